@@ -3,18 +3,32 @@ AI Modules Package
 Provides AI-powered features for the job tracker application
 """
 
-# Import all AI modules for easy access
-from .nlp_processor import NLPProcessor
-from .cv_analyzer import CVAnalyzer
-from .job_matcher import JobMatcher
-from .insights_generator import InsightsGenerator
-from .ai_service import AIService
+import importlib
+
+# Classes are imported lazily on first attribute access so that importing
+# the package (e.g. for the registry) does not pull in nltk/yake/PyPDF2
+_LAZY_IMPORTS = {
+    'NLPProcessor': '.nlp_processor',
+    'CVAnalyzer': '.cv_analyzer',
+    'JobMatcher': '.job_matcher',
+    'InsightsGenerator': '.insights_generator',
+    'AIService': '.ai_service'
+}
 
 __version__ = "1.0.0"
 __all__ = [
     'NLPProcessor',
-    'CVAnalyzer', 
+    'CVAnalyzer',
     'JobMatcher',
     'InsightsGenerator',
     'AIService'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,19 +6,17 @@ Main AI service that integrates all AI modules and provides unified interface
 import json
 import os
 from datetime import datetime
-from .nlp_processor import NLPProcessor
-from .cv_analyzer import CVAnalyzer
-from .job_matcher import JobMatcher
-from .insights_generator import InsightsGenerator
+from . import registry
 
 class AIService:
     """Main AI service for job tracker application"""
     
-    def __init__(self):
-        self.nlp_processor = NLPProcessor()
-        self.cv_analyzer = CVAnalyzer()
-        self.job_matcher = JobMatcher()
-        self.insights_generator = InsightsGenerator()
+    def __init__(self, nlp_processor=None, cv_analyzer=None, job_matcher=None, insights_generator=None):
+        # Reuse the process-wide shared components unless explicitly injected
+        self.nlp_processor = nlp_processor or registry.get_nlp_processor()
+        self.cv_analyzer = cv_analyzer or registry.get_cv_analyzer()
+        self.job_matcher = job_matcher or registry.get_job_matcher()
+        self.insights_generator = insights_generator or registry.get_insights_generator()
     
     def analyze_cv(self, cv_file_path, file_size):
         """Complete CV analysis"""
@@ -270,38 +268,15 @@ class AIService:
             }
     
     def validate_ai_dependencies(self):
-        """Validate that all AI dependencies are available"""
-        try:
-            # Test NLP processor
-            test_text = "Python programming and machine learning experience"
-            nlp_result = self.nlp_processor.extract_skills(test_text)
-            
-            # Test CV analyzer (basic initialization)
-            cv_analyzer_ok = True
-            
-            # Test job matcher
-            test_job = {'position': 'Software Developer', 'company_name': 'Tech Corp'}
-            job_matcher_ok = True
-            
-            # Test insights generator
-            test_user_data = {'cv_analysis': {'extracted_skills': ['python']}, 'job_applications': []}
-            insights_ok = True
-            
-            return {
-                'status': 'success',
-                'nlp_processor': 'working' if nlp_result else 'error',
-                'cv_analyzer': 'working' if cv_analyzer_ok else 'error',
-                'job_matcher': 'working' if job_matcher_ok else 'error',
-                'insights_generator': 'working' if insights_ok else 'error',
-                'validation_date': datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e),
-                'validation_date': datetime.now().isoformat()
-            }
+        """Per-component readiness (see ai_modules.warmup); warms up first if nothing ran yet"""
+        # Imported here: warmup imports the registry, which builds this service
+        from . import warmup
+        state = warmup.readiness()
+        if state['status'] == 'cold':
+            state = warmup.warm_up()
+        return state
+
 
-# Global AI service instance
-ai_service = AIService()
+def get_ai_service():
+    """Global AI service instance (shared, built on first use)"""
+    return registry.get_ai_service()
@@ -0,0 +1,176 @@
+"""
+Batch Matcher Module
+Vectorized job compatibility scoring for many jobs against one CV
+
+Skills are mapped to integer ids once per request and the jobs are laid out
+as a sparse jobs-by-skills matrix, so exact and fuzzy skill overlap for all
+jobs is computed with a handful of sparse matrix-vector products instead of
+a nested similarity loop per job. Scores are identical to
+``JobMatcher.analyze_job_compatibility``.
+"""
+
+from datetime import datetime
+import numpy as np
+from scipy import sparse
+
+# Same weights and thresholds as JobMatcher
+MATCH_WEIGHTS = {
+    'skills': 0.6,
+    'experience': 0.3,
+    'location': 0.1
+}
+FUZZY_THRESHOLD = 0.7
+
+
+class BatchJobMatcher:
+    """Scores a batch of jobs against a single CV using sparse matrix operations"""
+
+    def __init__(self, job_matcher):
+        # Requirement extraction, experience/location scoring and
+        # recommendations are shared with the per-job matcher
+        self.job_matcher = job_matcher
+
+    def analyze(self, cv_analysis, job_applications):
+        """Analyze all jobs and return results sorted by overall match score"""
+        jobs, requirements = self._extract_requirements(job_applications)
+        if not jobs:
+            return []
+
+        cv_skills_lower = [skill.lower() for skill in cv_analysis.get('extracted_skills', [])]
+        job_skills_lower = [
+            [skill.lower() for skill in req.get('extracted_skills', [])] for req in requirements
+        ]
+
+        skill_scores = self._skill_scores(cv_skills_lower, job_skills_lower)
+        experience_scores = self._experience_scores(cv_analysis.get('experience_level', ''), requirements)
+        location_scores = self._location_scores(
+            cv_analysis.get('contact_info', {}).get('location', ''), requirements
+        )
+
+        overall_scores = (
+            skill_scores * MATCH_WEIGHTS['skills'] +
+            experience_scores * MATCH_WEIGHTS['experience'] +
+            location_scores * MATCH_WEIGHTS['location']
+        )
+
+        cv_skill_set = set(cv_skills_lower)
+        analysis_date = datetime.now().isoformat()
+        results = []
+        for index, (job, job_requirements) in enumerate(zip(jobs, requirements)):
+            job_skill_set = set(job_skills_lower[index])
+            matching_skills = list(cv_skill_set & job_skill_set)
+            missing_skills = list(job_skill_set - cv_skill_set)
+            additional_skills = list(cv_skill_set - job_skill_set)
+            overall_score = float(overall_scores[index])
+
+            results.append({
+                'overall_match_score': round(overall_score, 1),
+                'skill_match_score': round(float(skill_scores[index]), 1),
+                'experience_match_score': round(float(experience_scores[index]), 1),
+                'location_match_score': round(float(location_scores[index]), 1),
+                'matching_skills': matching_skills,
+                'missing_skills': missing_skills,
+                'additional_skills': additional_skills,
+                'job_requirements': job_requirements,
+                'recommendations': self.job_matcher._generate_recommendations(
+                    overall_score, matching_skills, missing_skills, job_requirements
+                ),
+                'analysis_date': analysis_date,
+                'match_level': self.job_matcher._get_match_level(overall_score),
+                'job_id': job.get('id')
+            })
+
+        # Sort by overall match score (highest first)
+        results.sort(key=lambda x: x['overall_match_score'], reverse=True)
+
+        return results
+
+    def _extract_requirements(self, job_applications):
+        """Extract requirements per job, skipping jobs that cannot be parsed"""
+        jobs = []
+        requirements = []
+        for job in job_applications:
+            try:
+                requirements.append(self.job_matcher.extract_job_requirements(job))
+                jobs.append(job)
+            except Exception as e:
+                # Log error but continue with other jobs
+                print(f"Error analyzing job {job.get('id', 'unknown') if isinstance(job, dict) else 'unknown'}: {str(e)}")
+        return jobs, requirements
+
+    def _skill_scores(self, cv_skills, job_skills_per_job):
+        """Vectorized equivalent of JobMatcher.calculate_skill_match_score for every job"""
+        job_count = len(job_skills_per_job)
+        job_lengths = np.fromiter((len(skills) for skills in job_skills_per_job), dtype=np.float64, count=job_count)
+
+        if not cv_skills:
+            # 50 when neither side has skills, 20 when only the CV is empty
+            return np.where(job_lengths == 0, 50.0, 20.0)
+
+        # Map every distinct job skill to an integer id
+        skill_ids = {}
+        rows, cols = [], []
+        for row, skills in enumerate(job_skills_per_job):
+            for skill in skills:
+                rows.append(row)
+                cols.append(skill_ids.setdefault(skill, len(skill_ids)))
+
+        if not skill_ids:
+            return np.full(job_count, 80.0)
+
+        vocabulary = list(skill_ids)
+        # jobs x skills occurrence counts (job skill lists may repeat a skill)
+        job_matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(job_count, len(vocabulary))
+        )
+        job_presence = job_matrix.copy()
+        job_presence.data[:] = 1.0
+
+        # Exact overlap: distinct job skills that are present in the CV
+        cv_skill_set = set(cv_skills)
+        cv_presence = np.fromiter((skill in cv_skill_set for skill in vocabulary), dtype=np.float64, count=len(vocabulary))
+        exact_counts = job_presence @ cv_presence
+
+        # Fuzzy overlap: every (CV skill, job skill) pair above the threshold, with multiplicity.
+        # Similarities are computed once per distinct pair instead of once per job.
+        cv_counts = {}
+        for skill in cv_skills:
+            cv_counts[skill] = cv_counts.get(skill, 0) + 1
+        similarity = self.job_matcher.skill_similarity
+        fuzzy_weights = np.zeros(len(vocabulary), dtype=np.float64)
+        for col, job_skill in enumerate(vocabulary):
+            for cv_skill, count in cv_counts.items():
+                if cv_skill != job_skill and similarity.is_similar(cv_skill, job_skill, FUZZY_THRESHOLD):
+                    fuzzy_weights[col] += count
+        partial_counts = job_matrix @ fuzzy_weights
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            exact_scores = exact_counts / job_lengths * 100
+            partial_scores = partial_counts / job_lengths * 100
+            total_scores = np.minimum(100, (exact_scores * 0.8) + (partial_scores * 0.2))
+
+        # Jobs without specific requirements score 80
+        return np.where(job_lengths == 0, 80.0, total_scores)
+
+    def _experience_scores(self, cv_experience_level, requirements):
+        """Experience score per job; only a handful of distinct levels exist"""
+        cache = {}
+        scores = np.empty(len(requirements), dtype=np.float64)
+        for index, req in enumerate(requirements):
+            level = req.get('experience_required', '')
+            if level not in cache:
+                cache[level] = self.job_matcher.calculate_experience_match_score(cv_experience_level, level)
+            scores[index] = cache[level]
+        return scores
+
+    def _location_scores(self, cv_location, requirements):
+        """Location score per job, computed once per distinct job location"""
+        cache = {}
+        scores = np.empty(len(requirements), dtype=np.float64)
+        for index, req in enumerate(requirements):
+            location = req.get('location', '')
+            if location not in cache:
+                cache[location] = self.job_matcher.calculate_location_match_score(cv_location, location)
+            scores[index] = cache[location]
+        return scores
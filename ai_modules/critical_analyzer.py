@@ -4,15 +4,78 @@ Provides deep, critical analysis of CV content with Indonesian business context
 """
 
 import re
+import copy
 import json
-from collections import Counter, defaultdict
+import threading
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
 import statistics
 
+from .fingerprint import fingerprint
+from .lexicon_scanner import LexiconScanner
+
+# Independently addressable sections of the critical analysis report
+CRITICAL_SECTIONS = ('content_quality', 'critical_gaps', 'credibility_analysis', 'critical_feedback')
+
+
+class CriticalAnalysisReport:
+    """Critical analysis of one CV; each section is computed on first access"""
+    
+    def __init__(self, analyzer, extracted_data):
+        self.analyzer = analyzer
+        self.extracted_data = extracted_data
+        self.text = extracted_data.get('extracted_text', '')
+        self.extracted_skills = extracted_data.get('extracted_skills', [])
+        self._sections = {}
+    
+    def section(self, name):
+        """Return section ``name``, computing it (and its dependencies) once"""
+        if name not in CRITICAL_SECTIONS:
+            raise ValueError(f"Unknown critical analysis section: {name}")
+        if name not in self._sections:
+            self._sections[name] = getattr(self, f'_compute_{name}')()
+        return self._sections[name]
+    
+    def computed_sections(self):
+        return [name for name in CRITICAL_SECTIONS if name in self._sections]
+    
+    def _compute_content_quality(self):
+        return self.analyzer.analyze_content_quality(self.text, self.extracted_skills)
+    
+    def _compute_critical_gaps(self):
+        return self.analyzer.identify_critical_gaps(self.extracted_data)
+    
+    def _compute_credibility_analysis(self):
+        return self.analyzer.analyze_cv_credibility(self.text, self.extracted_data)
+    
+    def _compute_critical_feedback(self):
+        return self.analyzer.generate_critical_feedback(
+            self.section('content_quality'), self.section('critical_gaps'), self.extracted_data
+        )
+    
+    def to_dict(self, sections=None):
+        """Report with the requested sections (default: all)"""
+        sections = CRITICAL_SECTIONS if sections is None else tuple(sections)
+        report = {name: self.section(name) for name in sections}
+        if 'content_quality' in report:
+            report['overall_score'] = report['content_quality']['score']
+        report.update({
+            'sections': list(sections),
+            'analysis_timestamp': datetime.now().isoformat(),
+            'analysis_version': '2.0-critical'
+        })
+        return report
+
+
 class CriticalAnalyzer:
     """Advanced critical analysis engine for CV content evaluation"""
     
-    def __init__(self):
+    def __init__(self, report_cache_size=32):
+        # Lazily evaluated reports of recently analyzed CVs, keyed by input fingerprint
+        self.report_cache_size = report_cache_size
+        self._reports = OrderedDict()
+        self._reports_lock = threading.Lock()
+        
         # Indonesian business culture context
         self.indonesian_business_context = {
             'education_hierarchy': {
@@ -85,6 +148,72 @@ class CriticalAnalyzer:
                 'menangani', 'mengelola', 'memimpin', 'mengawasi'
             ]
         }
+        
+        # English proficiency indicators
+        self.english_indicators = [
+            'english', 'fluent', 'proficient', 'native speaker',
+            'bilingual', 'international', 'global', 'multicultural'
+        ]
+        
+        # Informal abbreviations (basic grammar and spelling check)
+        self.informal_words = [
+            'tdk', 'tdak', 'gk', 'gak', 'bgt', 'banget', 'sgt', 'sekali'
+        ]
+        
+        # Section headers
+        self.section_headers = [
+            'pengalaman kerja', 'work experience', 'pendidikan', 'education',
+            'keahlian', 'skills', 'ringkasan', 'summary', 'tentang', 'about',
+            'penghargaan', 'awards', 'sertifikasi', 'certifications'
+        ]
+        
+        # Experience level indicators
+        self.experience_indicators = {
+            'junior': ['junior', 'entry', 'fresh', 'graduate'],
+            'senior': ['senior', 'lead', 'principal', 'manager', 'director'],
+            'expert': ['expert', 'specialist', 'consultant', 'architect']
+        }
+        
+        # Education level patterns (checked in order)
+        self.education_patterns = {
+            'phd': ['phd', 'doctorate', 'doctoral'],
+            'master': ['master', 'magister', 's2', 'mba', 'msc'],
+            'bachelor': ['bachelor', 'sarjana', 's1', 'undergraduate'],
+            'diploma': ['diploma', 'd3', 'd4', 'associate'],
+            'high_school': ['sma', 'smk', 'high school']
+        }
+        
+        # Positive credibility indicators
+        self.credibility_indicators = [
+            'certified', 'certification', 'degree', 'university', 'gpa',
+            'award', 'recognition', 'achievement', 'graduated', 'honor'
+        ]
+        
+        # Common function words for language consistency (whole words)
+        self.function_words = {
+            'indonesian': ['yang', 'dan', 'di', 'dari', 'untuk', 'dengan'],
+            'english': ['the', 'and', 'of', 'in', 'for', 'with']
+        }
+        
+        # All lexicons compiled into one single-pass matcher
+        lexicons = {
+            'impact': self.achievement_patterns['impact'],
+            'responsibility': self.achievement_patterns['responsibility'],
+            'red_flags': self.quality_indicators['red_flags'],
+            'english_indicators': self.english_indicators,
+            'informal_words': self.informal_words,
+            'section_headers': self.section_headers,
+            'credibility_indicators': self.credibility_indicators
+        }
+        for category, patterns in self.indonesian_cv_patterns.items():
+            lexicons[category] = patterns
+        for level, indicators in self.experience_indicators.items():
+            lexicons[f'experience:{level}'] = indicators
+        for level, patterns in self.education_patterns.items():
+            lexicons[f'education:{level}'] = patterns
+        for language, words in self.function_words.items():
+            lexicons[f'function_words:{language}'] = [f' {word} ' for word in words]
+        self.lexicon_scanner = LexiconScanner(lexicons)
     
     def analyze_content_quality(self, text, extracted_skills):
         """Comprehensive content quality analysis"""
@@ -210,11 +339,10 @@ class CriticalAnalyzer:
         else:
             result['issues'].append("kurang pencapaian terukur dengan angka konkret")
         
+        lexicon_hits = self.lexicon_scanner.scan(text)
+        
         # Impact indicators
-        impact_score = 0
-        for impact_word in self.achievement_patterns['impact']:
-            if impact_word in text_lower:
-                impact_score += 2
+        impact_score = lexicon_hits.count('impact') * 2
         
         if impact_score >= 8:
             result['strengths'].append("banyak menunjukkan dampak positif")
@@ -227,10 +355,7 @@ class CriticalAnalyzer:
             result['issues'].append("kurang menunjukkan dampak konkret dari pekerjaan")
         
         # Responsibility indicators
-        responsibility_score = 0
-        for resp_word in self.achievement_patterns['responsibility']:
-            if resp_word in text_lower:
-                responsibility_score += 2
+        responsibility_score = lexicon_hits.count('responsibility') * 2
         
         if responsibility_score >= 6:
             result['strengths'].append("menunjukkan tanggung jawab yang kuat")
@@ -241,10 +366,7 @@ class CriticalAnalyzer:
             result['issues'].append("tanggung jawab kurang jelas")
         
         # Red flags detection
-        red_flag_count = 0
-        for red_flag in self.quality_indicators['red_flags']:
-            if red_flag in text_lower:
-                red_flag_count += 1
+        red_flag_count = lexicon_hits.count('red_flags')
         
         if red_flag_count > 0:
             result['issues'].append(f"terdeteksi {red_flag_count} indikasi masalah")
@@ -257,21 +379,14 @@ class CriticalAnalyzer:
         """Analyze professionalism of language used"""
         result = {'score': 0, 'issues': [], 'strengths': []}
         
-        text_lower = text.lower()
+        lexicon_hits = self.lexicon_scanner.scan(text)
         
         # Indonesian business language detection
-        formal_indicators = 0
-        for pattern in self.indonesian_cv_patterns['formal_opening']:
-            if pattern in text_lower:
-                formal_indicators += 1
-        
-        for pattern in self.indonesian_cv_patterns['achievement_style']:
-            if pattern in text_lower:
-                formal_indicators += 1
-        
-        for pattern in self.indonesian_cv_patterns['responsibility_style']:
-            if pattern in text_lower:
-                formal_indicators += 1
+        formal_indicators = (
+            lexicon_hits.count('formal_opening') +
+            lexicon_hits.count('achievement_style') +
+            lexicon_hits.count('responsibility_style')
+        )
         
         if formal_indicators >= 5:
             result['strengths'].append("bahasa formal dan profesional Indonesia")
@@ -284,12 +399,7 @@ class CriticalAnalyzer:
             result['issues'].append("bahasa kurang formal untuk konteks bisnis Indonesia")
         
         # English proficiency indicators
-        english_indicators = [
-            'english', 'fluent', 'proficient', 'native speaker',
-            'bilingual', 'international', 'global', 'multicultural'
-        ]
-        
-        english_score = sum(1 for indicator in english_indicators if indicator in text_lower)
+        english_score = lexicon_hits.count('english_indicators')
         if english_score >= 2:
             result['strengths'].append("menunjukkan kemampuan bahasa Inggris")
             result['score'] += 15
@@ -297,11 +407,7 @@ class CriticalAnalyzer:
             result['score'] += 8
         
         # Grammar and spelling quality (basic check)
-        common_errors = [
-            'tdk', 'tdak', 'gk', 'gak', 'bgt', 'banget', 'sgt', 'sekali'
-        ]
-        
-        informal_count = sum(1 for error in common_errors if error in text_lower)
+        informal_count = lexicon_hits.count('informal_words')
         if informal_count == 0:
             result['strengths'].append("tidak ada singkatan informal")
             result['score'] += 10
@@ -315,20 +421,8 @@ class CriticalAnalyzer:
         """Analyze structure and organization of CV"""
         result = {'score': 0, 'issues': [], 'strengths': []}
         
-        lines = text.split('\n')
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
-        
-        # Section headers detection
-        common_headers = [
-            'pengalaman kerja', 'work experience', 'pendidikan', 'education',
-            'keahlian', 'skills', 'ringkasan', 'summary', 'tentang', 'about',
-            'penghargaan', 'awards', 'sertifikasi', 'certifications'
-        ]
-        
-        header_count = 0
-        for line in non_empty_lines:
-            if any(header.lower() in line.lower() for header in common_headers):
-                header_count += 1
+        # Section headers detection (lines containing a header)
+        header_count = self.lexicon_scanner.scan(text).lines_with('section_headers')
         
         if header_count >= 4:
             result['strengths'].append("struktur CV lengkap dengan section yang jelas")
@@ -404,17 +498,12 @@ class CriticalAnalyzer:
                 result['issues'].append("beberapa keahlian tidak dijelaskan dalam pengalaman")
         
         # Experience level consistency
-        experience_indicators = {
-            'junior': ['junior', 'entry', 'fresh', 'graduate'],
-            'senior': ['senior', 'lead', 'principal', 'manager', 'director'],
-            'expert': ['expert', 'specialist', 'consultant', 'architect']
+        lexicon_hits = self.lexicon_scanner.scan(text)
+        level_scores = {
+            level: lexicon_hits.count(f'experience:{level}')
+            for level in self.experience_indicators
         }
         
-        level_scores = {}
-        for level, indicators in experience_indicators.items():
-            score = sum(1 for indicator in indicators if indicator in text_lower)
-            level_scores[level] = score
-        
         if level_scores:
             dominant_level = max(level_scores, key=level_scores.get)
             max_score = level_scores[dominant_level]
@@ -448,18 +537,10 @@ class CriticalAnalyzer:
     
     def _detect_education_level(self, text):
         """Detect education level from text"""
-        text_lower = text.lower()
-        
-        education_patterns = {
-            'phd': ['phd', 'doctorate', 'doctoral'],
-            'master': ['master', 'magister', 's2', 'mba', 'msc'],
-            'bachelor': ['bachelor', 'sarjana', 's1', 'undergraduate'],
-            'diploma': ['diploma', 'd3', 'd4', 'associate'],
-            'high_school': ['sma', 'smk', 'high school']
-        }
+        lexicon_hits = self.lexicon_scanner.scan(text)
         
-        for level, patterns in education_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
+        for level in self.education_patterns:
+            if lexicon_hits.any(f'education:{level}'):
                 return level
         
         return None
@@ -676,13 +757,10 @@ class CriticalAnalyzer:
         
         text_lower = text.lower()
         
-        # Positive credibility indicators
-        positive_indicators = [
-            'certified', 'certification', 'degree', 'university', 'gpa',
-            'award', 'recognition', 'achievement', 'graduated', 'honor'
-        ]
+        lexicon_hits = self.lexicon_scanner.scan(text)
         
-        trust_score = sum(1 for indicator in positive_indicators if indicator in text_lower)
+        # Positive credibility indicators
+        trust_score = lexicon_hits.count('credibility_indicators')
         
         # Educational institution verification
         universities = re.findall(r'\b(UI|ITB|UGM|Binus|Telkom|ITS|UNPAD|UNAIR)\b', text, re.IGNORECASE)
@@ -717,11 +795,8 @@ class CriticalAnalyzer:
         
         # Language consistency
         mixed_language_score = 0
-        indonesian_words = ['yang', 'dan', 'di', 'dari', 'untuk', 'dengan']
-        english_words = ['the', 'and', 'of', 'in', 'for', 'with']
-        
-        indonesian_count = sum(1 for word in indonesian_words if f' {word} ' in f' {text_lower} ')
-        english_count = sum(1 for word in english_words if f' {word} ' in f' {text_lower} ')
+        indonesian_count = lexicon_hits.count('function_words:indonesian')
+        english_count = lexicon_hits.count('function_words:english')
         
         if indonesian_count > 0 and english_count > 0:
             mixed_language_score = min(indonesian_count, english_count)
@@ -740,28 +815,33 @@ class CriticalAnalyzer:
         
         return credibility
     
+    def critical_report(self, extracted_data):
+        """Cached CriticalAnalysisReport for ``extracted_data``
+        
+        Sections computed for the same input (ignoring timestamps) are reused
+        across calls; the least recently used reports are evicted.
+        """
+        key = fingerprint(extracted_data)
+        with self._reports_lock:
+            report = self._reports.get(key)
+            if report is None:
+                # Own copy: the caller may keep mutating its results dict
+                report = CriticalAnalysisReport(self, copy.deepcopy(extracted_data))
+                self._reports[key] = report
+                if len(self._reports) > self.report_cache_size:
+                    self._reports.popitem(last=False)
+            else:
+                self._reports.move_to_end(key)
+        return report
+    
+    def generate_critical_analysis(self, extracted_data, sections=None):
+        """Generate the critical analysis report, limited to ``sections``
+        
+        ``sections`` is an iterable of CRITICAL_SECTIONS names (default: all).
+        Only the requested sections and their dependencies are computed.
+        """
+        return self.critical_report(extracted_data).to_dict(sections)
+    
     def generate_comprehensive_critical_analysis(self, extracted_data):
         """Generate complete critical analysis report"""
-        text = extracted_data.get('extracted_text', '')
-        extracted_skills = extracted_data.get('extracted_skills', [])
-        
-        # Perform all analyses
-        content_analysis = self.analyze_content_quality(text, extracted_skills)
-        gap_analysis = self.identify_critical_gaps(extracted_data)
-        credibility_analysis = self.analyze_cv_credibility(text, extracted_data)
-        
-        # Generate feedback
-        critical_feedback = self.generate_critical_feedback(content_analysis, gap_analysis, extracted_data)
-        
-        # Compile comprehensive report
-        report = {
-            'overall_score': content_analysis['score'],
-            'content_quality': content_analysis,
-            'critical_gaps': gap_analysis,
-            'credibility_analysis': credibility_analysis,
-            'critical_feedback': critical_feedback,
-            'analysis_timestamp': datetime.now().isoformat(),
-            'analysis_version': '2.0-critical'
-        }
-        
-        return report
+        return self.generate_critical_analysis(extracted_data)
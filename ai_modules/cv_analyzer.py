@@ -5,36 +5,40 @@ Handles CV/Resume upload, parsing, and analysis
 
 import os
 import io
+import copy
 import json
-import uuid
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from werkzeug.utils import secure_filename
 
-# PDF processing
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+from importlib.util import find_spec
 
-# DOCX processing
-try:
-    import docx
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# PDF processing (PyPDF2 is imported on first use)
+PDF_AVAILABLE = find_spec('PyPDF2') is not None
 
-from .nlp_processor import NLPProcessor
-from .critical_analyzer import CriticalAnalyzer
-from .feedback_generator import FeedbackGenerator
+# DOCX processing (python-docx is imported on first use)
+DOCX_AVAILABLE = find_spec('docx') is not None
+
+from . import registry
+from . import pipeline_metrics
+from .critical_analyzer import CRITICAL_SECTIONS
+
+# Sections of the critical CV analysis that can be requested independently
+CRITICAL_RESULT_SECTIONS = CRITICAL_SECTIONS + ('intelligent_feedback', 'enhanced_summary')
 
 class CVAnalyzer:
     """CV/Resume analyzer with PDF and DOCX support"""
     
-    def __init__(self):
-        self.nlp = NLPProcessor()
-        self.critical_analyzer = CriticalAnalyzer()
-        self.feedback_generator = FeedbackGenerator()
+    def __init__(self, nlp=None, critical_analyzer=None, feedback_generator=None, analysis_cache_size=32):
+        # Reuse the process-wide shared components unless explicitly injected
+        self.nlp = nlp or registry.get_nlp_processor()
+        self.critical_analyzer = critical_analyzer or registry.get_critical_analyzer()
+        self.feedback_generator = feedback_generator or registry.get_feedback_generator()
+        
+        # Analyses of recently uploaded CVs, keyed by content hash (see upload_storage)
+        self.analysis_cache_size = analysis_cache_size
+        self._analyses = OrderedDict()
+        self._analyses_lock = threading.Lock()
         self.allowed_extensions = {'pdf', 'docx', 'txt'}
         self.max_file_size = 5 * 1024 * 1024  # 5MB
         
@@ -47,22 +51,13 @@ class CVAnalyzer:
         return '.' in filename and \
                filename.rsplit('.', 1)[1].lower() in self.allowed_extensions
     
-    def save_cv_file(self, file):
-        """Save uploaded CV file and return file path"""
-        if file and self.allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            # Add unique identifier
-            unique_filename = f"{uuid.uuid4().hex}_{filename}"
-            file_path = os.path.join(self.upload_dir, unique_filename)
-            file.save(file_path)
-            return unique_filename
-        return None
-    
     def extract_text_from_pdf(self, file_path):
         """Extract text from PDF file"""
         if not PDF_AVAILABLE:
             raise ImportError("PyPDF2 not available for PDF processing")
         
+        import PyPDF2
+        
         try:
             text = ""
             with open(file_path, 'rb') as file:
@@ -80,6 +75,8 @@ class CVAnalyzer:
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx not available for DOCX processing")
         
+        import docx
+        
         try:
             doc = docx.Document(file_path)
             text = ""
@@ -677,25 +674,70 @@ class CVAnalyzer:
         
         return "\n".join(analysis_parts)
     
-    def analyze_cv(self, file_path, file_size):
-        """Complete CV analysis pipeline with industry-specific insights"""
+    def analyze_cv(self, file_path, file_size, content_hash=None):
+        """Complete CV analysis pipeline with industry-specific insights
+        
+        With ``content_hash`` (digest of the file, see upload_storage) the
+        result is cached: the same CV is analyzed once while it stays among
+        the most recently analyzed ones. A cached result gets a fresh
+        ``analysis_date`` and the timings of this call.
+        """
+        with pipeline_metrics.pipeline_run('analyze_cv') as run:
+            with pipeline_metrics.stage('analysis_cache'):
+                results = self._cached_analysis(content_hash)
+            if results is None:
+                results = self._analyze_cv(file_path, file_size, run)
+                self._cache_analysis(content_hash, results)
+            else:
+                results['analysis_date'] = datetime.now().isoformat()
+                results['metadata'] = pipeline_metrics.attach_timings({}, run, 'analyze_cv')
+        return results
+    
+    def _cached_analysis(self, content_hash):
+        if content_hash is None:
+            return None
+        with self._analyses_lock:
+            cached = self._analyses.get(content_hash)
+            if cached is None:
+                return None
+            self._analyses.move_to_end(content_hash)
+            # Own copy: callers extend and mutate the returned dict
+            return copy.deepcopy(cached)
+    
+    def _cache_analysis(self, content_hash, results):
+        if content_hash is None:
+            return
+        # Only the analysis itself: date and timings belong to the call that computed it
+        payload = {key: value for key, value in results.items() if key not in ('analysis_date', 'metadata')}
+        with self._analyses_lock:
+            self._analyses[content_hash] = copy.deepcopy(payload)
+            if len(self._analyses) > self.analysis_cache_size:
+                self._analyses.popitem(last=False)
+    
+    def _analyze_cv(self, file_path, file_size, run):
+        stage = pipeline_metrics.stage
         try:
             # Extract text from file
-            extracted_text = self.extract_text(file_path)
+            with stage('extraction', file_size):
+                extracted_text = self.extract_text(file_path)
+            text_size = len(extracted_text)
             
             # Process text with NLP
-            nlp_results = self.nlp.process_cv_text(extracted_text)
+            with stage('nlp', text_size):
+                nlp_results = self.nlp.process_cv_text(extracted_text)
             
             # Additional analysis
-            experience_level = self.analyze_experience_level(extracted_text)
-            education_level = self.analyze_education_level(extracted_text)
-            years_experience = self.estimate_years_experience(extracted_text)
+            with stage('experience_education', text_size):
+                experience_level = self.analyze_experience_level(extracted_text)
+                education_level = self.analyze_education_level(extracted_text)
+                years_experience = self.estimate_years_experience(extracted_text)
             
             # Industry detection and benchmarks
-            detected_industry = self.detect_industry(extracted_text, nlp_results['extracted_skills'])
-            industry_benchmarks = self.analyze_industry_benchmarks(
-                extracted_text, nlp_results['extracted_skills'], detected_industry
-            )
+            with stage('industry', text_size):
+                detected_industry = self.detect_industry(extracted_text, nlp_results['extracted_skills'])
+                industry_benchmarks = self.analyze_industry_benchmarks(
+                    extracted_text, nlp_results['extracted_skills'], detected_industry
+                )
             
             # Compile results
             analysis_results = {
@@ -720,39 +762,77 @@ class CVAnalyzer:
             }
             
             # Generate summary with industry context
-            analysis_results['summary'] = self.generate_enhanced_summary(analysis_results)
+            with stage('summary'):
+                analysis_results['summary'] = self.generate_enhanced_summary(analysis_results)
             
+            analysis_results['metadata'] = pipeline_metrics.attach_timings({}, run, 'analyze_cv')
             return analysis_results
             
         except Exception as e:
             raise Exception(f"Error analyzing CV: {str(e)}")
     
-    def analyze_cv_critical(self, file_path, file_size):
-        """Enhanced CV analysis with critical analysis and intelligent feedback"""
+    def analyze_cv_critical(self, file_path, file_size, sections=None, content_hash=None):
+        """Enhanced CV analysis with critical analysis and intelligent feedback
+        
+        ``sections`` selects which CRITICAL_RESULT_SECTIONS to compute
+        (default: all); sections that are not requested are skipped.
+        ``content_hash`` lets the standard analysis come from the cache.
+        """
+        sections = CRITICAL_RESULT_SECTIONS if sections is None else tuple(sections)
+        unknown = [section for section in sections if section not in CRITICAL_RESULT_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown critical analysis sections: {', '.join(unknown)}")
+        
+        with pipeline_metrics.pipeline_run('analyze_cv_critical') as run:
+            return self._analyze_cv_critical(file_path, file_size, sections, run, content_hash)
+    
+    def _analyze_cv_critical(self, file_path, file_size, sections, run, content_hash=None):
+        stage = pipeline_metrics.stage
         try:
             # Perform standard analysis first
-            standard_results = self.analyze_cv(file_path, file_size)
-            
-            # Perform critical analysis
-            critical_analysis = self.critical_analyzer.generate_comprehensive_critical_analysis(standard_results)
+            standard_results = self.analyze_cv(file_path, file_size, content_hash)
             
-            # Generate intelligent feedback
-            intelligent_feedback = self.feedback_generator.generate_comprehensive_feedback(
-                standard_results, critical_analysis
-            )
+            # Critical analysis sections (feedback and summary need the content score)
+            critical_sections = [section for section in sections if section in CRITICAL_SECTIONS]
+            needs_score = 'intelligent_feedback' in sections or 'enhanced_summary' in sections
+            if needs_score and 'content_quality' not in critical_sections:
+                critical_sections.append('content_quality')
+            with stage('critical_analysis', len(standard_results.get('extracted_text', ''))):
+                critical_analysis = self.critical_analyzer.generate_critical_analysis(
+                    standard_results, critical_sections
+                )
             
             # Add critical analysis results to standard results
             enhanced_results = standard_results.copy()
             enhanced_results.update({
                 'critical_analysis': critical_analysis,
-                'intelligent_feedback': intelligent_feedback,
-                'enhanced_summary': self._generate_enhanced_summary_with_critical_insights(
-                    standard_results, critical_analysis, intelligent_feedback
-                ),
                 'analysis_version': '2.0-enhanced',
-                'critical_analysis_included': True
+                'critical_analysis_included': True,
+                'sections': list(sections)
             })
             
+            # Generate intelligent feedback
+            if 'intelligent_feedback' in sections:
+                with stage('feedback'):
+                    enhanced_results['intelligent_feedback'] = self.feedback_generator.generate_comprehensive_feedback(
+                        standard_results, critical_analysis
+                    )
+            
+            if 'enhanced_summary' in sections:
+                with stage('enhanced_summary'):
+                    # The summary only reads the priority feedback
+                    feedback = enhanced_results.get('intelligent_feedback') or {
+                        'priority_based_feedback': self.feedback_generator.generate_priority_based_feedback(
+                            standard_results, critical_analysis
+                        )
+                    }
+                    enhanced_results['enhanced_summary'] = self._generate_enhanced_summary_with_critical_insights(
+                        standard_results, critical_analysis, feedback
+                    )
+            
+            enhanced_results['metadata'] = pipeline_metrics.attach_timings(
+                dict(standard_results.get('metadata', {})), run, 'analyze_cv_critical'
+            )
             return enhanced_results
             
         except Exception as e:
@@ -0,0 +1,28 @@
+"""
+Fingerprint Module
+Stable hashes of analysis inputs, used as memoization keys
+
+Analysis results carry per-call timestamps and timings. They do not
+change what is computed from the data, so ``fingerprint`` drops them
+(at any depth) before hashing the canonical JSON form.
+"""
+
+import hashlib
+import json
+
+# Per-call timestamps and timings in analysis results that do not affect the analysis
+VOLATILE_KEYS = frozenset({'analysis_date', 'analysis_timestamp', 'generated_timestamp', 'stage_timings'})
+
+
+def without_volatile_keys(value):
+    if isinstance(value, dict):
+        return {key: without_volatile_keys(item) for key, item in value.items() if key not in VOLATILE_KEYS}
+    if isinstance(value, (list, tuple)):
+        return [without_volatile_keys(item) for item in value]
+    return value
+
+
+def fingerprint(value):
+    """SHA-256 of ``value`` as canonical JSON, ignoring ``VOLATILE_KEYS``"""
+    canonical = json.dumps(without_volatile_keys(value), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
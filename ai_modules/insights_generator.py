@@ -124,8 +124,8 @@ class InsightsGenerator:
             # Analyze job requirements from applications
             all_required_skills = self._extract_all_job_skills(job_applications)
             
-            # Identify gaps
-            skill_gaps = list(set(all_required_skills) - set(current_skills))
+            # Identify gaps (sorted so the same input always yields the same insight text)
+            skill_gaps = sorted(set(all_required_skills) - set(current_skills))
             
             insights = []
             
@@ -381,7 +381,7 @@ class InsightsGenerator:
                 all_skills.extend(['programming', 'problem solving'])
             elif 'analyst' in position:
                 all_skills.extend(['data analysis', 'statistics'])
-        return list(set(all_skills))
+        return sorted(set(all_skills))
     
     def _identify_high_priority_gaps(self, skill_gaps):
         """Identify high-priority skill gaps"""
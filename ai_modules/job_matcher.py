@@ -6,12 +6,34 @@ Analyzes job compatibility between CV skills and job requirements
 import json
 import re
 from datetime import datetime
-from difflib import SequenceMatcher
+from importlib.util import find_spec
+
+from . import registry
+
+# Vectorized batch matching (numpy/scipy are imported on first use)
+BATCH_ENGINE_AVAILABLE = find_spec('numpy') is not None and find_spec('scipy') is not None
+
+# Requirement fields that can be precomputed when a job is saved
+PRECOMPUTED_REQUIREMENT_KEYS = ('extracted_skills', 'experience_required', 'job_category')
+
+# Common technical skills
+TECHNICAL_SKILLS = (
+    'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+    'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git',
+    'machine learning', 'deep learning', 'data science', 'ai',
+    'tableau', 'power bi', 'excel', 'statistics',
+    'project management', 'agile', 'scrum', 'kanban'
+)
 
 class JobMatcher:
     """AI-powered job matching and compatibility analysis"""
     
-    def __init__(self):
+    def __init__(self, skill_similarity=None):
+        # Precomputed skill similarity index (shared, loaded on first use)
+        self._skill_similarity = skill_similarity
+
         # Common job requirement patterns
         self.requirement_patterns = {
             'programming': [
@@ -72,25 +94,35 @@ class JobMatcher:
             'status': job_data.get('status', {})
         }
         
+        # Requirements extracted at write time (stored on the application) are reused as-is
+        if all(job_data.get(key) is not None for key in PRECOMPUTED_REQUIREMENT_KEYS):
+            for key in PRECOMPUTED_REQUIREMENT_KEYS:
+                requirements[key] = job_data[key]
+            return requirements
+        
+        requirements.update(self.derive_job_requirements(job_data))
+        
+        return requirements
+    
+    def derive_job_requirements(self, job_data):
+        """Derive skills, experience level and category from the job text"""
         # Combine all text for analysis
         text_to_analyze = ' '.join([
-            requirements['position'],
-            requirements['company'],
-            requirements['location'],
-            requirements['source_info'],
-            requirements['notes']
+            job_data.get('position') or '',
+            job_data.get('company_name') or '',
+            job_data.get('location') or '',
+            job_data.get('source_info') or '',
+            job_data.get('notes') or ''
         ])
         
-        # Extract skills from job description
-        requirements['extracted_skills'] = self._extract_skills_from_text(text_to_analyze)
-        
-        # Determine experience level required
-        requirements['experience_required'] = self._determine_experience_required(text_to_analyze)
-        
-        # Determine job category
-        requirements['job_category'] = self._categorize_job(text_to_analyze)
-        
-        return requirements
+        return {
+            # Extract skills from job description
+            'extracted_skills': self._extract_skills_from_text(text_to_analyze),
+            # Determine experience level required
+            'experience_required': self._determine_experience_required(text_to_analyze),
+            # Determine job category
+            'job_category': self._categorize_job(text_to_analyze)
+        }
     
     def _extract_skills_from_text(self, text):
         """Extract skills and keywords from job description"""
@@ -100,19 +132,8 @@ class JobMatcher:
         text_lower = text.lower()
         found_skills = []
         
-        # Common technical skills
-        technical_skills = [
-            'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git',
-            'machine learning', 'deep learning', 'data science', 'ai',
-            'tableau', 'power bi', 'excel', 'statistics',
-            'project management', 'agile', 'scrum', 'kanban'
-        ]
-        
         # Find matching skills
-        for skill in technical_skills:
+        for skill in TECHNICAL_SKILLS:
             # Use word boundaries to avoid partial matches
             pattern = r'\b' + re.escape(skill.lower()) + r'\b'
             if re.search(pattern, text_lower):
@@ -165,6 +186,12 @@ class JobMatcher:
         
         return 'other'
     
+    @property
+    def skill_similarity(self):
+        if self._skill_similarity is None:
+            self._skill_similarity = registry.get_skill_similarity()
+        return self._skill_similarity
+    
     def calculate_skill_match_score(self, cv_skills, job_skills):
         """Calculate skill compatibility score"""
         if not cv_skills and not job_skills:
@@ -188,9 +215,8 @@ class JobMatcher:
         for cv_skill in cv_skills_lower:
             for job_skill in job_skills_lower:
                 if cv_skill != job_skill:
-                    similarity = SequenceMatcher(None, cv_skill, job_skill).ratio()
-                    if similarity > 0.7:  # 70% similarity threshold
-                        partial_matches.append((cv_skill, job_skill, similarity))
+                    if self.skill_similarity.is_similar(cv_skill, job_skill, 0.7):  # 70% similarity threshold
+                        partial_matches.append((cv_skill, job_skill))
         
         # Calculate scores
         exact_score = len(exact_matches) / len(job_skills_lower) * 100 if job_skills_lower else 0
@@ -251,8 +277,7 @@ class JobMatcher:
         for cv_part in cv_parts:
             for job_part in job_parts:
                 if len(cv_part) > 3 and len(job_part) > 3:
-                    similarity = SequenceMatcher(None, cv_part, job_part).ratio()
-                    if similarity > 0.8:
+                    if self.skill_similarity.is_similar(cv_part, job_part, 0.8):
                         return 80
         
         # Different locations but both in same country/region
@@ -415,6 +440,15 @@ class JobMatcher:
     
     def batch_analyze_jobs(self, cv_analysis, job_applications):
         """Analyze multiple jobs for compatibility"""
+        if BATCH_ENGINE_AVAILABLE:
+            # Vectorized engine: same scores, computed for all jobs at once
+            from .batch_matcher import BatchJobMatcher
+            return BatchJobMatcher(self).analyze(cv_analysis, job_applications)
+        
+        return self.batch_analyze_jobs_sequential(cv_analysis, job_applications)
+    
+    def batch_analyze_jobs_sequential(self, cv_analysis, job_applications):
+        """Analyze multiple jobs one by one (fallback when NumPy/SciPy are unavailable)"""
         results = []
         
         for job in job_applications:
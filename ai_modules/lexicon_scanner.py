@@ -0,0 +1,98 @@
+"""
+Lexicon Scanner Module
+Single-pass matching of many phrase lexicons against a document
+
+All phrases of all lexicon categories are compiled into one Aho-Corasick
+automaton (pyahocorasick). One pass over the lowercased text finds every
+occurrence of every phrase. Analyzers then read per-category counts from
+the result instead of running a separate ``phrase in text`` scan per word.
+
+Semantics are substring containment on the text padded with one space on
+each side. This deliberately differs from the unpadded ``phrase in text``
+checks it replaces: space-delimited phrases such as ``' dan '`` now also
+match a word at the very start or end of the text, which the old checks
+missed. Without pyahocorasick, the scanner falls back to one containment
+check per distinct phrase, with identical results.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class LexiconScan:
+    """Result of scanning one document: which phrases occur and where"""
+
+    def __init__(self, scanner, padded_text, found, positions=None):
+        self._scanner = scanner
+        self._padded_text = padded_text
+        self.found = frozenset(found)
+        # phrase -> start offsets in the padded text (None in fallback mode)
+        self._positions = positions
+
+    def count(self, category):
+        """Number of lexicon entries of ``category`` present in the text"""
+        found = self.found
+        return sum(1 for phrase in self._scanner.lexicons[category] if phrase in found)
+
+    def any(self, category):
+        found = self.found
+        return any(phrase in found for phrase in self._scanner.lexicons[category])
+
+    def lines_with(self, category):
+        """Number of lines containing at least one phrase of ``category``"""
+        phrases = [phrase for phrase in self._scanner.lexicons[category] if phrase in self.found]
+        if not phrases:
+            return 0
+
+        if self._positions is None:
+            return sum(
+                1 for line in self._padded_text.split('\n')
+                if any(phrase in line for phrase in phrases)
+            )
+
+        newlines = [index for index, char in enumerate(self._padded_text) if char == '\n']
+        return len({
+            bisect_right(newlines, position)
+            for phrase in phrases
+            for position in self._positions[phrase]
+        })
+
+
+class LexiconScanner:
+    """Compiles named lexicons into one matcher"""
+
+    def __init__(self, lexicons, cache_size=32):
+        self.lexicons = {
+            category: tuple(phrase.lower() for phrase in phrases)
+            for category, phrases in lexicons.items()
+        }
+        self.phrases = frozenset(phrase for phrases in self.lexicons.values() for phrase in phrases)
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+
+        # Several analyzers scan the same document; reuse the last results
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _scan(self, text):
+        padded_text = f" {(text or '').lower()} "
+
+        if self._automaton is None:
+            found = [phrase for phrase in self.phrases if phrase in padded_text]
+            return LexiconScan(self, padded_text, found)
+
+        positions = defaultdict(list)
+        for end, phrase in self._automaton.iter(padded_text):
+            positions[phrase].append(end - len(phrase) + 1)
+        return LexiconScan(self, padded_text, positions, positions)
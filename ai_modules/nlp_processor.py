@@ -5,49 +5,17 @@ Handles text processing, skill extraction, and language analysis
 
 import re
 import json
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.stem import PorterStemmer
 from collections import Counter
-import yake
 import string
+from types import MappingProxyType
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+from .nltk_resources import word_tokenize, sent_tokenize, get_stopwords, get_combined_stopwords, get_stemmer
+from . import pipeline_metrics
 
 class NLPProcessor:
     """Natural Language Processing utilities for CV and job analysis"""
     
     def __init__(self):
-        # Support for multiple languages
-        try:
-            self.stop_words_en = set(stopwords.words('english'))
-        except:
-            self.stop_words_en = set()
-        
-        try:
-            # Download Indonesian stopwords if available
-            nltk.download('stopwords')
-            self.stop_words_id = set(stopwords.words('indonesian'))
-        except:
-            # Indonesian stopwords as fallback
-            self.stop_words_id = {
-                'yang', 'dan', 'di', 'ke', 'dari', 'untuk', 'dengan', 'adalah', 'akan', 'pada',
-                'oleh', 'atau', 'dalam', 'oleh', 'kami', 'kita', 'mereka', 'dia', 'ia', 'nya',
-                'ini', 'itu', 'dapat', 'bisa', 'harus', 'sebagai', 'juga', 'sudah', 'telah',
-                'dapat', 'bisa', 'harus', 'tidak', 'ya', 'atau', 'dengan', 'untuk'
-            }
-        
-        self.stemmer = PorterStemmer()
         self.max_keywords = 20
         
         # Comprehensive skill keywords database for extraction (English & Indonesian)
@@ -327,6 +295,31 @@ class NLPProcessor:
                 'organization', 'planning', 'scheduling', 'multitasking', 'work efficiency', 'goal setting'
             ]
         }
+        
+        # Instances are shared process-wide (see registry): keep the skill database read-only
+        self.skill_keywords = MappingProxyType({
+            category: tuple(skills) for category, skills in self.skill_keywords.items()
+        })
+    
+    @property
+    def stop_words_en(self):
+        """English stopwords, loaded from local NLTK data on first use"""
+        return get_stopwords('english')
+    
+    @property
+    def stop_words_id(self):
+        """Indonesian stopwords, loaded from local NLTK data on first use"""
+        return get_stopwords('indonesian')
+    
+    @property
+    def stop_words(self):
+        """Combined English and Indonesian stopwords (built once)"""
+        return get_combined_stopwords('english', 'indonesian')
+    
+    @property
+    def stemmer(self):
+        """Shared Porter stemmer, created on first use"""
+        return get_stemmer()
     
     def detect_language(self, text):
         """Detect if text is primarily Indonesian or English"""
@@ -529,7 +522,8 @@ class NLPProcessor:
         text = self.clean_text(text)
         
         try:
-            # Initialize YAKE extractor
+            # Initialize YAKE extractor (imported lazily, it is slow to import)
+            import yake
             kw_extractor = yake.KeywordExtractor(
                 lan="en",
                 n=2,  # Extract 1-2 word phrases
@@ -542,7 +536,8 @@ class NLPProcessor:
         except:
             # Fallback: simple word frequency
             words = word_tokenize(text)
-            words = [word for word in words if word.isalpha() and word not in self.stop_words]
+            stop_words = self.stop_words
+            words = [word for word in words if word.isalpha() and word not in stop_words]
             word_freq = Counter(words)
             return [word for word, freq in word_freq.most_common(max_keywords)]
     
@@ -1154,29 +1149,44 @@ class NLPProcessor:
                 'total_years': 0
             }
         
+        with pipeline_metrics.pipeline_run('process_cv_text') as run:
+            return self._process_cv_text(text, run)
+    
+    def _process_cv_text(self, text, run):
+        stage = pipeline_metrics.stage
+        text_size = len(text)
+        
         # Enhanced processing pipeline
         # 1. Language detection
-        language_detected = self.detect_language(text)
+        with stage('nlp.language', text_size):
+            language_detected = self.detect_language(text)
         
         # 2. Extract skills (with language awareness)
-        extracted_skills = self.extract_skills(text)
+        with stage('nlp.skills', text_size):
+            extracted_skills = self.extract_skills(text)
         
         # 3. Extract keywords
-        keywords = self.extract_keywords(text, max_keywords=15)
+        with stage('nlp.keywords', text_size):
+            keywords = self.extract_keywords(text, max_keywords=15)
         
         # 4. Extract contact info
-        contact_info = self.extract_contact_info(text)
+        with stage('nlp.contact_info', text_size):
+            contact_info = self.extract_contact_info(text)
         
         # 5. Analyze text structure
-        text_analysis = self.analyze_text_structure(text)
+        with stage('nlp.text_structure', text_size):
+            text_analysis = self.analyze_text_structure(text)
         
         # 6. Enhanced analysis
-        experience_level, total_years = self.detect_experience_level(text)
-        education_level, _, institution_score = self.detect_education_level(text)
-        industry_classification, industry_confidence = self.enhanced_industry_classification(text, extracted_skills)
+        with stage('nlp.experience_education', text_size):
+            experience_level, total_years = self.detect_experience_level(text)
+            education_level, _, institution_score = self.detect_education_level(text)
+        with stage('nlp.industry', text_size):
+            industry_classification, industry_confidence = self.enhanced_industry_classification(text, extracted_skills)
         
         # 7. Calculate scores
-        ats_score = self.calculate_ats_score(text, extracted_skills)
+        with stage('nlp.ats_score', text_size):
+            ats_score = self.calculate_ats_score(text, extracted_skills)
         completeness_score = self._calculate_completeness_score(
             extracted_skills, contact_info, text_analysis
         )
@@ -1216,13 +1226,13 @@ class NLPProcessor:
             'total_years': total_years,
             'institution_score': institution_score,
             'industry_confidence': round(industry_confidence, 2),
-            'metadata': {
+            'metadata': pipeline_metrics.attach_timings({
                 'skills_count': len(extracted_skills),
                 'keywords_count': len(keywords),
                 'sections_found': len(text_analysis.get('has_sections', [])),
                 'readability_score': text_analysis.get('readability_score', 0),
                 'word_count': text_analysis.get('word_count', 0)
-            }
+            }, run, 'process_cv_text')
         }
     
     def _calculate_completeness_score(self, extracted_skills, contact_info, text_analysis):
@@ -0,0 +1,169 @@
+"""
+NLTK Resources Module
+Offline, lazy access to NLTK tokenizers, stopwords and stemmer
+
+Resources are resolved from the bundled ``ai_modules/nltk_data`` directory,
+the ``NLTK_DATA`` environment variable or NLTK's default search path.
+Nothing is ever downloaded at runtime; provision the data directory at
+build/deploy time with ``python -m ai_modules.nltk_resources``.
+When a resource is missing, lightweight built-in fallbacks are used instead.
+"""
+
+import os
+import re
+import sys
+import threading
+from functools import lru_cache
+
+# Data directory shipped alongside the AI modules (optional)
+BUNDLED_NLTK_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nltk_data')
+
+# Packages needed by the NLP pipeline (package id -> resource path)
+REQUIRED_RESOURCES = {
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+}
+
+# Fallback stopwords used when the NLTK corpus is not provisioned
+FALLBACK_STOPWORDS = {
+    'english': frozenset({
+        'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 'your', 'yours',
+        'yourself', 'yourselves', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
+        'it', 'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 'what', 'which',
+        'who', 'whom', 'this', 'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be',
+        'been', 'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 'a', 'an',
+        'the', 'and', 'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by',
+        'for', 'with', 'about', 'against', 'between', 'into', 'through', 'during', 'before',
+        'after', 'above', 'below', 'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over',
+        'under', 'again', 'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why',
+        'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
+        'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 's', 't', 'can', 'will',
+        'just', 'don', 'should', 'now'
+    }),
+    'indonesian': frozenset({
+        'yang', 'dan', 'di', 'ke', 'dari', 'untuk', 'dengan', 'adalah', 'akan', 'pada',
+        'oleh', 'atau', 'dalam', 'kami', 'kita', 'mereka', 'dia', 'ia', 'nya',
+        'ini', 'itu', 'dapat', 'bisa', 'harus', 'sebagai', 'juga', 'sudah', 'telah',
+        'tidak', 'ya'
+    }),
+}
+
+# Regex fallbacks approximating the Punkt/Treebank tokenizers
+_WORD_PATTERN = re.compile(r"\w+(?:[-'.]\w+)*|[^\w\s]")
+_SENTENCE_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+_path_lock = threading.Lock()
+_path_configured = False
+
+
+def _nltk():
+    """Import nltk on first use and register the bundled data directory"""
+    global _path_configured
+    import nltk
+
+    if not _path_configured:
+        with _path_lock:
+            if not _path_configured:
+                if os.path.isdir(BUNDLED_NLTK_DATA) and BUNDLED_NLTK_DATA not in nltk.data.path:
+                    nltk.data.path.insert(0, BUNDLED_NLTK_DATA)
+                _path_configured = True
+    return nltk
+
+
+@lru_cache(maxsize=None)
+def has_resource(resource_path):
+    """Check whether an NLTK resource is available locally (never downloads)"""
+    try:
+        _nltk().data.find(resource_path)
+        return True
+    except LookupError:
+        return False
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _punkt_available():
+    """Punkt is stored as ``punkt_tab`` since NLTK 3.9 and ``punkt`` before"""
+    return has_resource(REQUIRED_RESOURCES['punkt_tab']) or has_resource(REQUIRED_RESOURCES['punkt'])
+
+
+def word_tokenize(text):
+    """Tokenize text into words using NLTK when provisioned, regex otherwise"""
+    if not text:
+        return []
+
+    if _punkt_available():
+        try:
+            from nltk.tokenize import word_tokenize as nltk_word_tokenize
+            return nltk_word_tokenize(text)
+        except LookupError:
+            _punkt_available.cache_clear()
+            has_resource.cache_clear()
+
+    return _WORD_PATTERN.findall(text)
+
+
+def sent_tokenize(text):
+    """Split text into sentences using NLTK when provisioned, regex otherwise"""
+    if not text:
+        return []
+
+    if _punkt_available():
+        try:
+            from nltk.tokenize import sent_tokenize as nltk_sent_tokenize
+            return nltk_sent_tokenize(text)
+        except LookupError:
+            _punkt_available.cache_clear()
+            has_resource.cache_clear()
+
+    return [sentence for sentence in _SENTENCE_PATTERN.split(text.strip()) if sentence]
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language):
+    """Get a read-only stopword set for a language"""
+    if has_resource(REQUIRED_RESOURCES['stopwords']):
+        try:
+            from nltk.corpus import stopwords
+            return frozenset(stopwords.words(language))
+        except (LookupError, OSError):
+            pass
+
+    return FALLBACK_STOPWORDS.get(language, frozenset())
+
+
+@lru_cache(maxsize=None)
+def get_combined_stopwords(*languages):
+    """Get one read-only stopword set for several languages"""
+    return frozenset().union(*(get_stopwords(language) for language in languages))
+
+
+@lru_cache(maxsize=1)
+def get_stemmer():
+    """Get a shared Porter stemmer (no data files required)"""
+    from nltk.stem import PorterStemmer
+    return PorterStemmer()
+
+
+def provision(download_dir=BUNDLED_NLTK_DATA):
+    """Download required NLTK packages into a data directory (build/deploy time only)"""
+    nltk = _nltk()
+    os.makedirs(download_dir, exist_ok=True)
+
+    results = {}
+    for package in REQUIRED_RESOURCES:
+        results[package] = bool(nltk.download(package, download_dir=download_dir, quiet=True))
+
+    has_resource.cache_clear()
+    _punkt_available.cache_clear()
+    get_stopwords.cache_clear()
+    get_combined_stopwords.cache_clear()
+    return results
+
+
+if __name__ == '__main__':
+    target_dir = sys.argv[1] if len(sys.argv) > 1 else BUNDLED_NLTK_DATA
+    for package, ok in provision(target_dir).items():
+        print(f"{'✅' if ok else '❌'} {package} -> {target_dir}")
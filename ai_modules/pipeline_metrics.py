@@ -0,0 +1,222 @@
+"""
+Pipeline Metrics Module
+Per-stage timing of the CV analysis pipeline
+
+A pipeline entry point (``CVAnalyzer.analyze_cv``,
+``NLPProcessor.process_cv_text``, ...) opens a run with ``pipeline_run``
+and wraps each stage in ``stage``. Every stage records its wall time, the
+CPU time of the calling thread and optionally an input size. A nested
+entry point (``process_cv_text`` called from ``analyze_cv``) joins the
+active run, so one run holds all stages of one request. The entry point
+that started the run attaches ``timings()`` to its result metadata.
+
+When a run ends, its stages are added to in-process histograms
+(``HISTOGRAMS``) for the operator endpoint and passed to any observers
+registered with ``add_observer`` (e.g. the Prometheus exporter). With
+``CV_PIPELINE_METRICS=0`` (or ``set_enabled(False)``), ``stage`` returns
+a shared no-op context manager and nothing is recorded. Runs started
+inside ``unrecorded()`` (startup warm-up) are timed but not recorded.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+# Upper bounds (ms) of the wall time histogram buckets; one overflow bucket follows
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_enabled = os.environ.get('CV_PIPELINE_METRICS', '1') != '0'
+_current_run = ContextVar('pipeline_run', default=None)
+_recording = ContextVar('pipeline_recording', default=True)
+_NULL_STAGE = nullcontext()
+_observers = []
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def add_observer(callback):
+    """Call ``callback(run)`` with every finished run"""
+    if callback not in _observers:
+        _observers.append(callback)
+
+
+@contextmanager
+def unrecorded():
+    """Keep runs started in this context out of the histograms and observers"""
+    token = _recording.set(False)
+    try:
+        yield
+    finally:
+        _recording.reset(token)
+
+
+class PipelineRun:
+    """Stage timings of one pipeline invocation"""
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.stages = {}
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.thread_time()
+
+    @contextmanager
+    def stage(self, name, input_size=None):
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(
+                name,
+                (time.perf_counter() - start_wall) * 1000,
+                (time.thread_time() - start_cpu) * 1000,
+                input_size
+            )
+
+    def record(self, name, wall_ms, cpu_ms, input_size=None):
+        # A stage that runs several times in one run accumulates
+        entry = self.stages.setdefault(name, {'wall_ms': 0.0, 'cpu_ms': 0.0})
+        entry['wall_ms'] += wall_ms
+        entry['cpu_ms'] += cpu_ms
+        if input_size is not None:
+            entry['input_size'] = entry.get('input_size', 0) + input_size
+
+    def total(self):
+        """(wall_ms, cpu_ms) since the run started"""
+        return (
+            (time.perf_counter() - self._start_wall) * 1000,
+            (time.thread_time() - self._start_cpu) * 1000
+        )
+
+    def timings(self):
+        """JSON-serializable summary for result metadata"""
+        total_wall_ms, total_cpu_ms = self.total()
+        return {
+            'pipeline': self.pipeline,
+            'total_wall_ms': round(total_wall_ms, 3),
+            'total_cpu_ms': round(total_cpu_ms, 3),
+            'stages': {
+                name: {key: round(value, 3) if isinstance(value, float) else value for key, value in entry.items()}
+                for name, entry in self.stages.items()
+            }
+        }
+
+
+class StageHistograms:
+    """Thread-safe in-process aggregate of stage timings per (pipeline, stage)"""
+
+    def __init__(self, buckets=BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, pipeline, stage, wall_ms, cpu_ms, input_size=None):
+        with self._lock:
+            series = self._series.get((pipeline, stage))
+            if series is None:
+                series = self._series[(pipeline, stage)] = {
+                    'count': 0,
+                    'wall_ms_sum': 0.0,
+                    'cpu_ms_sum': 0.0,
+                    'input_size_sum': 0,
+                    'bucket_counts': [0] * (len(self.buckets) + 1)
+                }
+            series['count'] += 1
+            series['wall_ms_sum'] += wall_ms
+            series['cpu_ms_sum'] += cpu_ms
+            series['input_size_sum'] += input_size or 0
+            series['bucket_counts'][bisect_left(self.buckets, wall_ms)] += 1
+
+    def observe_run(self, run):
+        total_wall_ms, total_cpu_ms = run.total()
+        self.observe(run.pipeline, 'total', total_wall_ms, total_cpu_ms)
+        for name, entry in run.stages.items():
+            self.observe(run.pipeline, name, entry['wall_ms'], entry['cpu_ms'], entry.get('input_size'))
+
+    def snapshot(self):
+        """Series with cumulative bucket counts (``le`` upper bounds in ms)"""
+        with self._lock:
+            items = sorted(
+                (key, dict(series, bucket_counts=list(series['bucket_counts'])))
+                for key, series in self._series.items()
+            )
+
+        snapshot = []
+        for (pipeline, stage), series in items:
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self.buckets + ('+Inf',), series['bucket_counts']):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            snapshot.append({
+                'pipeline': pipeline,
+                'stage': stage,
+                'count': series['count'],
+                'wall_ms_sum': round(series['wall_ms_sum'], 3),
+                'wall_ms_avg': round(series['wall_ms_sum'] / series['count'], 3),
+                'cpu_ms_sum': round(series['cpu_ms_sum'], 3),
+                'input_size_sum': series['input_size_sum'],
+                'buckets': buckets
+            })
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+HISTOGRAMS = StageHistograms()
+
+
+@contextmanager
+def pipeline_run(pipeline):
+    """Open a run for ``pipeline``, or join the run already active
+
+    Yields the PipelineRun (None when disabled). Only the outermost entry
+    point owns the run (``run.pipeline == pipeline``); its stages are added
+    to ``HISTOGRAMS`` when it ends.
+    """
+    if not _enabled:
+        yield None
+        return
+
+    active = _current_run.get()
+    if active is not None:
+        yield active
+        return
+
+    run = PipelineRun(pipeline)
+    token = _current_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_run.reset(token)
+        if _recording.get():
+            HISTOGRAMS.observe_run(run)
+            for observer in _observers:
+                observer(run)
+
+
+def stage(name, input_size=None):
+    """Context manager timing stage ``name`` of the active run (no-op without one)"""
+    run = _current_run.get() if _enabled else None
+    if run is None:
+        return _NULL_STAGE
+    return run.stage(name, input_size)
+
+
+def attach_timings(metadata, run, pipeline):
+    """Add the run timings to ``metadata`` if ``pipeline`` owns the run"""
+    if run is not None and run.pipeline == pipeline:
+        metadata['stage_timings'] = run.timings()
+    return metadata
@@ -0,0 +1,128 @@
+"""
+AI Component Registry
+Process-wide, lazily built, shared instances of the AI components
+
+Every component is constructed at most once per process and reused by
+``AIService``, ``CVAnalyzer`` and the Flask routes. Shared components are
+treated as read-only: callers must not mutate their dictionaries.
+Building everything in the master process before forking (see
+``preload_all``) lets pre-forked workers share the same copy-on-write pages.
+"""
+
+import gc
+import threading
+
+_lock = threading.RLock()
+_instances = {}
+
+
+def _get_or_build(name, factory):
+    """Return the shared instance for ``name``, building it on first use"""
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+
+    with _lock:
+        instance = _instances.get(name)
+        if instance is None:
+            instance = factory()
+            _instances[name] = instance
+    return instance
+
+
+def get_nlp_processor():
+    """Shared NLPProcessor"""
+    def build():
+        from .nlp_processor import NLPProcessor
+        return NLPProcessor()
+    return _get_or_build('nlp_processor', build)
+
+
+def get_critical_analyzer():
+    """Shared CriticalAnalyzer"""
+    def build():
+        from .critical_analyzer import CriticalAnalyzer
+        return CriticalAnalyzer()
+    return _get_or_build('critical_analyzer', build)
+
+
+def get_feedback_generator():
+    """Shared FeedbackGenerator"""
+    def build():
+        from .feedback_generator import FeedbackGenerator
+        return FeedbackGenerator()
+    return _get_or_build('feedback_generator', build)
+
+
+def get_cv_analyzer():
+    """Shared CVAnalyzer wired to the shared NLP, critical and feedback components"""
+    def build():
+        from .cv_analyzer import CVAnalyzer
+        return CVAnalyzer(
+            nlp=get_nlp_processor(),
+            critical_analyzer=get_critical_analyzer(),
+            feedback_generator=get_feedback_generator()
+        )
+    return _get_or_build('cv_analyzer', build)
+
+
+def get_job_matcher():
+    """Shared JobMatcher"""
+    def build():
+        from .job_matcher import JobMatcher
+        return JobMatcher()
+    return _get_or_build('job_matcher', build)
+
+
+def get_skill_similarity():
+    """Shared SkillSimilarityIndex (mmap-backed, pages shared across workers)"""
+    def build():
+        from .skill_similarity import SkillSimilarityIndex
+        return SkillSimilarityIndex()
+    return _get_or_build('skill_similarity', build)
+
+
+def get_insights_generator():
+    """Shared InsightsGenerator"""
+    def build():
+        from .insights_generator import InsightsGenerator
+        return InsightsGenerator()
+    return _get_or_build('insights_generator', build)
+
+
+def get_ai_service():
+    """Shared AIService wired to the shared components"""
+    def build():
+        from .ai_service import AIService
+        return AIService(
+            nlp_processor=get_nlp_processor(),
+            cv_analyzer=get_cv_analyzer(),
+            job_matcher=get_job_matcher(),
+            insights_generator=get_insights_generator()
+        )
+    return _get_or_build('ai_service', build)
+
+
+def preload_all(freeze_gc=True):
+    """Build every component now (call in the master process before forking)
+
+    With ``freeze_gc`` the preloaded objects are moved to the permanent GC
+    generation so collections in the workers do not touch (and copy) them.
+    """
+    get_ai_service()
+    get_skill_similarity()
+    if freeze_gc and hasattr(gc, 'freeze'):
+        gc.collect()
+        gc.freeze()
+    return loaded_components()
+
+
+def loaded_components():
+    """Names of the components built so far"""
+    return sorted(_instances)
+
+
+def reset():
+    """Drop all shared instances (for tests)"""
+    with _lock:
+        _instances.clear()
@@ -0,0 +1,174 @@
+"""
+Skill Similarity Module
+Precomputed string similarity index for the known skill vocabulary
+
+The index stores, for every ordered pair of known skills, the number of
+matching characters found by ``difflib.SequenceMatcher``. The ratio is then
+``2 * M / (len(a) + len(b))`` - exactly the value ``SequenceMatcher.ratio()``
+returns - so match scores do not change. It is stored as a dense N x N uint8
+matrix (about 0.5 MB for the current vocabulary) and loaded with mmap, which
+gives O(1) lookups shared between worker processes.
+
+Unseen strings fall back to an LRU-cached computation. jellyfish's
+Levenshtein distance gives a cheap upper bound on the ratio
+(``ratio <= 1 - lev / (len(a) + len(b))``), so pairs that cannot pass a
+threshold are rejected without running SequenceMatcher.
+
+Build the index offline (e.g. at deploy time) with:
+    python -m ai_modules.skill_similarity
+"""
+
+import mmap
+import os
+import struct
+import sys
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+try:
+    import jellyfish
+    JELLYFISH_AVAILABLE = True
+except ImportError:
+    JELLYFISH_AVAILABLE = False
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_similarity.idx')
+
+_MAGIC = b'SKSIM001'
+_HEADER = struct.Struct('<8sIId')  # magic, vocabulary size, vocabulary block length, min ratio
+_PRUNED = 255  # pair ratio is known to be below the index min ratio
+_MAX_SKILL_LENGTH = 254  # matching counts must fit in a uint8 next to the sentinel
+
+
+def skill_vocabulary():
+    """Known skill vocabulary: NLPProcessor skill database plus JobMatcher technical skills"""
+    from .job_matcher import TECHNICAL_SKILLS
+    from .nlp_processor import NLPProcessor
+
+    vocabulary = set(skill.lower() for skill in TECHNICAL_SKILLS)
+    for skills in NLPProcessor().skill_keywords.values():
+        vocabulary.update(skill.lower() for skill in skills)
+    return sorted(skill for skill in vocabulary if len(skill) <= _MAX_SKILL_LENGTH)
+
+
+def _levenshtein_upper_bound(a, b):
+    """Upper bound of SequenceMatcher(None, a, b).ratio() from the Levenshtein distance"""
+    total_length = len(a) + len(b)
+    if not total_length:
+        return 1.0
+    return 1.0 - jellyfish.levenshtein_distance(a, b) / total_length
+
+
+@lru_cache(maxsize=65536)
+def _matching_characters(a, b):
+    """Number of matching characters SequenceMatcher finds between a and b"""
+    return sum(block.size for block in SequenceMatcher(None, a, b).get_matching_blocks())
+
+
+def build_index(vocabulary=None, path=DEFAULT_INDEX_PATH, min_ratio=0.5):
+    """Build the similarity index file (offline)
+
+    Pairs whose ratio is provably below ``min_ratio`` are not computed and
+    are marked as pruned: threshold checks at or above ``min_ratio`` (the
+    matcher uses 0.7 / 0.8) answer False directly, exact ratios for them are
+    computed on demand.
+    """
+    vocabulary = sorted(set(vocabulary if vocabulary is not None else skill_vocabulary()))
+    size = len(vocabulary)
+    matrix = bytearray(size * size)
+
+    for i, a in enumerate(vocabulary):
+        row_offset = i * size
+        for j, b in enumerate(vocabulary):
+            if JELLYFISH_AVAILABLE and _levenshtein_upper_bound(a, b) < min_ratio:
+                matrix[row_offset + j] = _PRUNED
+                continue
+            matrix[row_offset + j] = sum(
+                block.size for block in SequenceMatcher(None, a, b).get_matching_blocks()
+            )
+
+    vocabulary_block = '\n'.join(vocabulary).encode('utf-8')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, size, len(vocabulary_block), min_ratio))
+        f.write(vocabulary_block)
+        f.write(matrix)
+    os.replace(tmp_path, path)
+    return path
+
+
+class SkillSimilarityIndex:
+    """O(1) similarity lookups for known skill pairs, cached fallback for others"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self._ids = {}
+        self._matrix = None
+        self._size = 0
+        self._min_ratio = 0.0
+        self._mmap = None
+        if os.path.exists(path):
+            self._load(path)
+
+    def _load(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, size, vocabulary_length, min_ratio = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Invalid skill similarity index: {path}")
+
+        start = _HEADER.size
+        vocabulary = self._mmap[start:start + vocabulary_length].decode('utf-8').split('\n') if size else []
+        matrix_start = start + vocabulary_length
+
+        self._ids = {skill: index for index, skill in enumerate(vocabulary)}
+        self._size = size
+        self._min_ratio = min_ratio
+        self._matrix = memoryview(self._mmap)[matrix_start:matrix_start + size * size]
+
+    @property
+    def loaded(self):
+        return self._matrix is not None
+
+    def __len__(self):
+        return self._size
+
+    def _lookup(self, a, b):
+        """Stored matching count for a known pair, None for unseen strings"""
+        i = self._ids.get(a)
+        if i is None:
+            return None
+        j = self._ids.get(b)
+        if j is None:
+            return None
+        return self._matrix[i * self._size + j]
+
+    def ratio(self, a, b):
+        """Same value as SequenceMatcher(None, a, b).ratio()"""
+        total_length = len(a) + len(b)
+        if not total_length:
+            return 1.0
+
+        matches = self._lookup(a, b)
+        if matches is None or matches == _PRUNED:
+            matches = _matching_characters(a, b)
+        return 2.0 * matches / total_length
+
+    def is_similar(self, a, b, threshold):
+        """True when SequenceMatcher(None, a, b).ratio() > threshold"""
+        matches = self._lookup(a, b)
+        if matches == _PRUNED and threshold >= self._min_ratio:
+            return False
+        if matches is not None:
+            return self.ratio(a, b) > threshold
+        if JELLYFISH_AVAILABLE and _levenshtein_upper_bound(a, b) <= threshold:
+            return False
+        return self.ratio(a, b) > threshold
+
+
+if __name__ == '__main__':
+    output_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INDEX_PATH
+    vocabulary = skill_vocabulary()
+    build_index(vocabulary, output_path)
+    print(f"✅ Skill similarity index: {len(vocabulary)} skills -> {output_path} ({os.path.getsize(output_path)} bytes)")
@@ -9,45 +9,41 @@ from extensions import db
 from models import JobApplication, User, Status, Notification
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from werkzeug.security import check_password_hash
-from werkzeug.utils import secure_filename
 import os
+import mimetypes
 import uuid
 import io
 from io import BytesIO
 
-
-# Import for PDF and Excel export
-import pandas as pd
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.units import inch
-
-# Import AI modules
-from ai_modules.ai_service import AIService
-from ai_modules.cv_analyzer import CVAnalyzer
-from ai_modules.job_matcher import JobMatcher
-from ai_modules.insights_generator import InsightsGenerator
+# Heavy dependencies (pandas, reportlab, nltk, yake) are imported lazily
+# inside the export routes and AI modules to keep worker startup fast
+
+# Import AI modules (components are built on first use, see ai_modules.registry)
+from ai_modules import registry as ai_registry
+from ai_modules import pipeline_metrics
+from ai_modules import warmup as ai_warmup
+import job_match_sync
+import job_import
+import proof_images
+import upload_storage
+import insight_sync
+import app_metrics
+import config
+import db_bootstrap
+import query_monitor
+from query_monitor import query_budget
 from models import CVProfile, JobMatch, AIInsight, SkillGap, CareerTrajectory
 import json
 import traceback
+from functools import partial
 
 
 app = Flask(__name__)
 
 
-app.config['SECRET_KEY'] = 'super-secret-key-alfarizi'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///database.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
+# Settings come from the environment, with the development defaults (see config)
+config.load_config(app)
 
-# File upload configuration
-app.config['UPLOAD_FOLDER'] = 'static/uploads/proofs'
-app.config['CV_UPLOAD_FOLDER'] = 'static/uploads/cv'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 CV_ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
 
@@ -66,39 +62,35 @@ def allowed_cv_file(filename):
            filename.rsplit('.', 1)[1].lower() in CV_ALLOWED_EXTENSIONS
 
 def save_uploaded_file(file):
-    """Save uploaded file and return filename"""
+    """Store uploaded file (content-addressed, see upload_storage), count the reference and return filename"""
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        # Add unique identifier to prevent conflicts
-        unique_filename = f"{uuid.uuid4().hex}_{filename}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-        file.save(file_path)
-        return unique_filename
+        return upload_storage.store(
+            file, app.config['UPLOAD_FOLDER'], file.filename.rsplit('.', 1)[1], 'proof'
+        ).filename
     return None
 
-def save_uploaded_image(file):
-    """Save uploaded image and return the filename"""
-    if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        # Generate unique filename
-        unique_filename = str(uuid.uuid4()) + '.' + filename.rsplit('.', 1)[1]
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-        file.save(file_path)
-        return unique_filename
-    return None
+def discard_proof_image(filename):
+    """Delete a released proof upload and its variants unless it is in use again"""
+    upload_storage.discard('proof', filename, partial(proof_images.delete_upload, app.config['UPLOAD_FOLDER']))
+
+def process_proof_image(filename):
+    """Queue the WebP variants of a committed proof upload (see proof_images)"""
+    # A re-uploaded image is already processed unless an earlier attempt failed
+    if filename and not proof_images.is_final(app.config['UPLOAD_FOLDER'], filename):
+        proof_images.schedule_processing(app, filename)
 
 def save_uploaded_cv(file):
-    """Save uploaded CV file and return the filename"""
+    """Store uploaded CV file (content-addressed), count the reference and return the filename"""
     if file and allowed_cv_file(file.filename):
-        filename = secure_filename(file.filename)
-        # Generate unique filename
-        unique_filename = f"{uuid.uuid4().hex}_{filename}"
-        file_path = os.path.join(app.config['CV_UPLOAD_FOLDER'], unique_filename)
-        file.save(file_path)
-        return unique_filename
+        return upload_storage.store(
+            file, app.config['CV_UPLOAD_FOLDER'], file.filename.rsplit('.', 1)[1], 'cv'
+        ).filename
     return None
 
 db.init_app(app)
+db_bootstrap.init_app(app)
+query_monitor.init_app(app)
+app_metrics.init_app(app)
 
 login_manager = LoginManager()
 login_manager.login_view = 'login'
@@ -108,6 +100,14 @@ login_manager.init_app(app)
 def load_user(user_id):
     return User.query.get(int(user_id))
 
+@app.teardown_request
+def discard_uncommitted_uploads(exc):
+    """Uploads stored by a request that failed or never committed are removed again"""
+    try:
+        upload_storage.discard_uncommitted()
+    except Exception as e:
+        print(f"⚠️  Upload cleanup error: {str(e)}")
+
 
 
 # ======================
@@ -115,6 +115,7 @@ def load_user(user_id):
 # ======================
 @app.route('/')
 @login_required
+@query_budget(12)
 def index():
 
     search = request.args.get('q')
@@ -218,7 +219,7 @@ def add_job():
         if 'image_proof' in request.files:
             file = request.files['image_proof']
             if file.filename:
-                image_proof = save_uploaded_image(file)
+                image_proof = save_uploaded_file(file)
         
         # Handle applied_date - if not provided, use current date
         applied_date = datetime.now()
@@ -250,6 +251,8 @@ def add_job():
         )
         db.session.add(job)
         db.session.commit()
+        process_proof_image(image_proof)
+        job_match_sync.schedule_recompute(app, current_user.id)
         return redirect(url_for('index'))
 
     statuses = Status.query.all()
@@ -294,17 +297,17 @@ def edit_job(id):
                 pass  # Keep existing date if invalid
         
         # Handle image upload
+        new_image = None
+        stale_image = None
         if 'image_proof' in request.files:
             file = request.files['image_proof']
             if file.filename:
                 # Save new image
-                new_image = save_uploaded_image(file)
+                new_image = save_uploaded_file(file)
                 if new_image:
-                    # Delete old image if exists
-                    if job.image_proof:
-                        old_file_path = os.path.join(app.config['UPLOAD_FOLDER'], job.image_proof)
-                        if os.path.exists(old_file_path):
-                            os.remove(old_file_path)
+                    # Old image (and its variants) is deleted once no job uses it
+                    if upload_storage.release('proof', job.image_proof):
+                        stale_image = job.image_proof
                     job.image_proof = new_image
         
 
@@ -318,6 +321,10 @@ def edit_job(id):
             job.last_status_update = datetime.now()
         
         db.session.commit()
+        if stale_image:
+            discard_proof_image(stale_image)
+        process_proof_image(new_image)
+        job_match_sync.schedule_recompute(app, current_user.id)
         return redirect(url_for('index'))
 
     return render_template('edit.html', job=job, statuses=statuses)
@@ -525,6 +532,7 @@ def update_job_status(job_id):
 
 @app.route('/api/notifications')
 @login_required
+@query_budget(4)
 def get_notifications():
     """API endpoint untuk mendapatkan notifikasi user"""
     try:
@@ -663,12 +671,6 @@ def clear_all_notifications():
 # AI-POWERED FEATURES
 # ======================
 
-# Initialize AI services
-ai_service = AIService()
-cv_analyzer = CVAnalyzer()
-job_matcher = JobMatcher()
-insights_generator = InsightsGenerator()
-
 # CV Upload and Analysis
 
 @app.route('/ai/cv/upload', methods=['GET', 'POST'])
@@ -715,7 +717,11 @@ def upload_cv():
                 return jsonify({'success': False, 'error': 'Error reading file content. Please make sure the file is not corrupted.'}), 400
             
             # Analyze CV using AI
-            analysis_result = cv_analyzer.analyze_cv(file_path, len(cv_content))
+            # The same CV bytes (same digest) reuse an earlier analysis
+            cv_analyzer = ai_registry.get_cv_analyzer()
+            analysis_result = cv_analyzer.analyze_cv(
+                file_path, len(cv_content), content_hash=upload_storage.digest_of(cv_filename)
+            )
             
             # Save or update CV profile
             cv_profile = CVProfile.query.filter_by(user_id=current_user.id).first()
@@ -724,7 +730,10 @@ def upload_cv():
                 db.session.add(cv_profile)
             
             # Update CV profile with analysis results
+            # The previous CV file is deleted once no profile uses it
+            previous_cv = cv_profile.cv_file_path
             cv_profile.cv_file_path = cv_filename
+            delete_previous_cv = upload_storage.release('cv', previous_cv)
             cv_profile.file_size = len(cv_content)
             cv_profile.full_name = analysis_result.get('personal_info', {}).get('name', '')
             cv_profile.email = analysis_result.get('personal_info', {}).get('email', '')
@@ -740,31 +749,23 @@ def upload_cv():
             cv_profile.last_updated = datetime.now()
             
             db.session.commit()
+            if delete_previous_cv:
+                upload_storage.discard(
+                    'cv', previous_cv, partial(upload_storage.remove_from, app.config['CV_UPLOAD_FOLDER'])
+                )
             
             # Generate insights based on CV analysis
             user_data = {
                 'cv_analysis': analysis_result,
                 'job_applications': []
             }
-            insights = insights_generator.generate_all_insights(user_data)
-            
-            # Save insights to database
-            for insight in insights:
-                ai_insight = AIInsight(
-                    user_id=current_user.id,
-                    insight_type=insight['type'],
-                    title=insight['title'],
-                    content=insight['content'],
-                    confidence_score=insight.get('confidence', 0),
-                    priority_level=insight.get('priority', 3),
-                    action_required=insight.get('action_required', False),
-                    action_text=insight.get('action_text', ''),
-                    related_skills=json.dumps(insight.get('related_skills', []))
-                )
-                db.session.add(ai_insight)
+            insights, _ = insight_sync.generate_insights(current_user.id, user_data, replace=False)
             
             db.session.commit()
             
+            # CV changed: refresh the user's job matches in the background
+            job_match_sync.schedule_recompute(app, current_user.id)
+            
             return jsonify({
                 'success': True,
                 'message': 'CV analyzed successfully',
@@ -782,6 +783,7 @@ def upload_cv():
 # AI Dashboard
 @app.route('/ai/dashboard')
 @login_required
+@query_budget(8)
 def ai_dashboard():
     """AI-powered insights dashboard"""
     try:
@@ -816,7 +818,123 @@ def ai_dashboard():
         flash('Error loading AI dashboard', 'danger')
         return redirect(url_for('index'))
 
+# Critical CV Analysis API
+@app.route('/api/ai/cv-analysis/critical')
+@login_required
+def critical_cv_analysis():
+    """Critical analysis of the user's CV, limited to the requested sections
+
+    ``?sections=content_quality,critical_gaps`` computes only those sections
+    (default: all). Sections already computed for the same CV are reused.
+    """
+    try:
+        cv_profile = CVProfile.query.filter_by(user_id=current_user.id).first()
+        if not cv_profile or not cv_profile.cv_file_path:
+            return jsonify({'success': False, 'error': 'No CV profile found. Please upload your CV first.'}), 400
+
+        file_path = os.path.join(app.config['CV_UPLOAD_FOLDER'], cv_profile.cv_file_path)
+        if not os.path.exists(file_path):
+            return jsonify({'success': False, 'error': 'CV file not found. Please upload your CV again.'}), 404
+
+        sections_param = request.args.get('sections', '')
+        sections = [section.strip() for section in sections_param.split(',') if section.strip()] or None
+
+        try:
+            analysis = ai_registry.get_cv_analyzer().analyze_cv_critical(
+                file_path, cv_profile.file_size or 0, sections=sections,
+                content_hash=upload_storage.digest_of(cv_profile.cv_file_path)
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        return jsonify({
+            'success': True,
+            'sections': analysis['sections'],
+            'analysis': analysis
+        })
+
+    except Exception as e:
+        print(f"Critical CV Analysis Error: {str(e)}")
+        print(traceback.format_exc())
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+# CV pipeline timing histograms (operator view)
+@app.route('/api/ai/metrics/pipeline')
+@login_required
+def cv_pipeline_metrics():
+    """Per-stage timing histograms of the CV analysis pipeline in this process"""
+    return jsonify({
+        'success': True,
+        'enabled': pipeline_metrics.is_enabled(),
+        'bucket_bounds_ms': list(pipeline_metrics.BUCKETS_MS),
+        'stages': pipeline_metrics.HISTOGRAMS.snapshot()
+    })
+
 # Job Matching API
+@app.route('/api/ai/job-match/batch', methods=['POST'])
+@login_required
+def match_jobs_batch():
+    """Match all (or selected) jobs with user's CV in one pass"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        # Get user's CV profile (loaded once for the whole batch)
+        cv_profile = CVProfile.query.filter_by(user_id=current_user.id).first()
+        if not cv_profile:
+            return jsonify({'success': False, 'error': 'No CV profile found. Please upload your CV first.'}), 400
+        
+        # Optional filters
+        try:
+            job_ids = [int(job_id) for job_id in data.get('job_ids') or []]
+            status_id = int(data['status_id']) if data.get('status_id') else None
+            limit = max(1, min(int(data.get('limit', 10)), 100))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'Invalid job_ids, status_id or limit'}), 400
+        
+        query = JobApplication.query.filter_by(user_id=current_user.id)
+        if status_id:
+            query = query.filter_by(status_id=status_id)
+        if job_ids:
+            # Client-supplied ids: IN lookups in chunks, like job_match_sync.stored_matches
+            job_ids = list(dict.fromkeys(job_ids))
+            chunk_size = job_match_sync.ID_CHUNK_SIZE
+            jobs = []
+            for start in range(0, len(job_ids), chunk_size):
+                jobs.extend(query.filter(JobApplication.id.in_(job_ids[start:start + chunk_size])).all())
+        else:
+            jobs = query.all()
+        
+        # Score stale jobs, bulk upsert and commit once
+        match_results, scored = job_match_sync.match_jobs(
+            current_user.id, cv_profile, jobs, force=bool(data.get('force'))
+        )
+        db.session.commit()
+        
+        jobs_by_id = {job.id: job for job in jobs}
+        top_matches = []
+        for match_result in match_results[:limit]:
+            job = jobs_by_id[match_result['job_id']]
+            top_matches.append(dict(match_result, job={
+                'id': job.id,
+                'company_name': job.company_name,
+                'position': job.position,
+                'location': job.location
+            }))
+        
+        return jsonify({
+            'success': True,
+            'total_jobs': len(jobs),
+            'scored_jobs': scored,
+            'top_matches': top_matches,
+            'message': 'Job matching completed successfully'
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"Batch Job Matching Error: {str(e)}")
+        print(traceback.format_exc())
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/ai/job-match/<int:job_id>', methods=['POST'])
 @login_required
 def match_job(job_id):
@@ -832,49 +950,37 @@ def match_job(job_id):
         if not cv_profile:
             return jsonify({'success': False, 'error': 'No CV profile found. Please upload your CV first.'}), 400
         
-        # Parse CV skills
-        cv_skills = json.loads(cv_profile.extracted_skills) if cv_profile.extracted_skills else []
-        
-        # Create job description from job data
-        job_description = f"""
-        Position: {job.position}
-        Company: {job.company_name}
-        Location: {job.location}
-        Requirements: {job.application_proof}
-        """
+        # Skip recomputation when the stored match is still current
+        job_match = JobMatch.query.filter_by(user_id=current_user.id, job_id=job.id).first()
+        if job_match_sync.match_is_current(job_match, cv_profile, job):
+            return jsonify({
+                'success': True,
+                'match_result': job_match_sync.match_result_from_row(job_match),
+                'cached': True,
+                'message': 'Job matching completed successfully'
+            })
         
         # Perform job matching
-        match_result = job_matcher.match_job(cv_skills, job_description)
-        
-        # Save match result
-        job_match = JobMatch(
-            user_id=current_user.id,
-            job_id=job.id,
-            match_score=match_result['match_score'],
-            matching_skills=json.dumps(match_result['matching_skills']),
-            missing_skills=json.dumps(match_result['missing_skills']),
-            additional_skills=json.dumps(match_result['additional_skills']),
-            compatibility_factors=json.dumps(match_result['compatibility_factors']),
-            recommendations=match_result['recommendations'],
-            salary_match_score=match_result.get('salary_match_score', 0),
-            location_match_score=match_result.get('location_match_score', 0)
+        match_result = ai_registry.get_job_matcher().analyze_job_compatibility(
+            job_match_sync.cv_analysis_from_profile(cv_profile),
+            job_match_sync.job_data_from_application(job)
         )
+        match_result['job_id'] = job.id
         
-        # Remove existing match for this job
-        existing_match = JobMatch.query.filter_by(user_id=current_user.id, job_id=job.id).first()
-        if existing_match:
-            db.session.delete(existing_match)
-        
-        db.session.add(job_match)
+        # Save match result with ON CONFLICT: the background recompute may
+        # have written this (user, job) row since the lookup above
+        job_match_sync.upsert_match_results(current_user.id, cv_profile, [job], [match_result])
         db.session.commit()
         
         return jsonify({
             'success': True,
             'match_result': match_result,
+            'cached': False,
             'message': 'Job matching completed successfully'
         })
         
     except Exception as e:
+        db.session.rollback()
         print(f"Job Matching Error: {str(e)}")
         print(traceback.format_exc())
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -905,35 +1011,16 @@ def generate_insights():
             } for job in job_applications]
         }
         
-        # Generate insights
-        insights = insights_generator.generate_all_insights(user_data)
-        
-        # Clear existing insights
-        AIInsight.query.filter_by(user_id=current_user.id).delete()
-        
-        # Save new insights
-        saved_insights = []
-        for insight in insights:
-            ai_insight = AIInsight(
-                user_id=current_user.id,
-                insight_type=insight['type'],
-                title=insight['title'],
-                content=insight['content'],
-                confidence_score=insight.get('confidence', 0),
-                priority_level=insight.get('priority', 3),
-                action_required=insight.get('action_required', False),
-                action_text=insight.get('action_text', ''),
-                related_skills=json.dumps(insight.get('related_skills', []))
-            )
-            db.session.add(ai_insight)
-            saved_insights.append(ai_insight)
-        
-        db.session.commit()
+        # Generate insights (skipped when the input is unchanged)
+        saved_insights, cached = insight_sync.generate_insights(current_user.id, user_data)
+        if not cached:
+            db.session.commit()
         
         return jsonify({
             'success': True,
             'message': f'Generated {len(saved_insights)} insights successfully',
-            'insights_count': len(saved_insights)
+            'insights_count': len(saved_insights),
+            'cached': cached
         })
         
     except Exception as e:
@@ -944,6 +1031,7 @@ def generate_insights():
 # AI Insights API
 @app.route('/api/ai/insights')
 @login_required
+@query_budget(4)
 def get_ai_insights():
     """Get AI insights for user"""
     try:
@@ -979,10 +1067,70 @@ def get_ai_insights():
 # ======================
 # SERVE UPLOADED IMAGE
 # ======================
+PROOF_CACHE_MAX_AGE = 365 * 24 * 3600
+
+
+def send_proof_file(path, mimetype=None, immutable=False):
+    """Send an upload with an ETag, conditional and range support, and private caching
+
+    Immutable files are cached for a year without revalidation; the others
+    are revalidated with ``If-None-Match`` on every use. With
+    ``PROOF_SENDFILE`` the response carries no body, only the header that
+    tells the front proxy which file to send (the proxy handles ranges).
+    """
+    stat = os.stat(path)
+    etag = f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+    mode = app.config['PROOF_SENDFILE']
+
+    if mode == 'off':
+        response = send_file(path, mimetype=mimetype, etag=etag, conditional=True)
+    else:
+        response = Response(mimetype=mimetype or mimetypes.guess_type(path)[0] or 'application/octet-stream')
+        if mode == 'x-sendfile':
+            response.headers['X-Sendfile'] = os.path.abspath(path)
+        else:
+            relative = os.path.relpath(path, app.config['UPLOAD_FOLDER']).replace(os.sep, '/')
+            response.headers['X-Accel-Redirect'] = app.config['PROOF_ACCEL_REDIRECT_PREFIX'] + relative
+        response.set_etag(etag)
+        response.last_modified = int(stat.st_mtime)
+        response = response.make_conditional(request)
+
+    response.cache_control.no_cache = None
+    response.cache_control.private = True
+    if immutable:
+        response.cache_control.max_age = PROOF_CACHE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+
 @app.route('/uploads/proofs/<filename>')
+@login_required
 def uploaded_file(filename):
-    """Serve uploaded proof images"""
-    return send_file(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+    """Serve uploaded proof images (only to the owner of the job)
+
+    ``?variant=thumb`` or ``?variant=medium`` sends the resized WebP copy
+    (see proof_images), or the original while that copy does not exist yet.
+    The original of an oversized screenshot is sent as its downscaled copy.
+    Files are cached as immutable once processing finished.
+    """
+    owned = db.session.query(JobApplication.id).filter_by(
+        image_proof=filename, user_id=current_user.id
+    ).first()
+    if owned is None:
+        abort(404)
+
+    folder = app.config['UPLOAD_FOLDER']
+    original_path = os.path.join(folder, filename)
+    if not os.path.isfile(original_path):
+        abort(404)
+
+    immutable = proof_images.is_final(folder, filename)
+    variant_path = proof_images.variant_path(folder, filename, request.args.get('variant'))
+    if variant_path:
+        return send_proof_file(variant_path, mimetype='image/webp', immutable=immutable)
+    return send_proof_file(proof_images.full_path(folder, filename), immutable=immutable)
 
 
 
@@ -993,6 +1141,7 @@ def uploaded_file(filename):
 # Jobs List Page
 @app.route('/jobs')
 @login_required
+@query_budget(6)
 def jobs():
     """Halaman daftar lamaran kerja dengan fitur pencarian dan filter"""
     search = request.args.get('q', '')
@@ -1048,6 +1197,7 @@ def jobs():
 # Reports & Export Page
 @app.route('/reports')
 @login_required
+@query_budget(10)
 def reports():
     """Halaman laporan dan export data"""
     # Get statistics for current user
@@ -1124,14 +1274,13 @@ def delete_job(id):
     if job.user_id != current_user.id:
         abort(403)
     
-    # Delete associated image file if exists
-    if job.image_proof:
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], job.image_proof)
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    # Delete associated image file (and its variants) once no other job uses it
+    delete_image = upload_storage.release('proof', job.image_proof)
     
     db.session.delete(job)
     db.session.commit()
+    if delete_image:
+        discard_proof_image(job.image_proof)
     
     return {'success': True, 'message': 'Job berhasil dihapus'}
 
@@ -1142,8 +1291,15 @@ def delete_job(id):
 # ======================
 @app.route('/export/pdf')
 @login_required
+@query_budget(8)
 def export_pdf():
     """Export job applications to PDF"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+
     try:
         # Get all jobs for current user
         jobs = JobApplication.query.filter_by(user_id=current_user.id).order_by(JobApplication.applied_date.desc()).all()
@@ -1254,8 +1410,11 @@ def export_pdf():
 # ======================
 @app.route('/export/excel')
 @login_required
+@query_budget(8)
 def export_excel():
     """Export job applications to Excel"""
+    import pandas as pd
+
     try:
         # Get all jobs for current user
         jobs = JobApplication.query.filter_by(user_id=current_user.id).order_by(JobApplication.applied_date.desc()).all()
@@ -1349,6 +1508,31 @@ def export_excel():
         flash(f'Error dalam export Excel: {str(e)}', 'danger')
         return redirect(url_for('index'))
 
+# ======================
+# IMPORT CSV / EXCEL
+# ======================
+@app.route('/import/jobs', methods=['POST'])
+@login_required
+def import_jobs():
+    """Bulk import job applications from a CSV or XLSX upload (see job_import)
+
+    ``dry_run=1`` only validates and returns a preview. The report lists
+    the rows that were skipped and why.
+    """
+    file = request.files.get('file')
+    if not file or not file.filename:
+        return jsonify({'success': False, 'error': 'No file provided'}), 400
+
+    dry_run = request.values.get('dry_run', '').strip().lower() in ('1', 'true', 'yes', 'on')
+    try:
+        report = job_import.import_file(file.stream, file.filename, current_user.id, dry_run=dry_run)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    if report['imported']:
+        job_match_sync.schedule_recompute(app, current_user.id)
+    return jsonify({'success': True, 'report': report})
+
 # ======================
 # LOGOUT
 # ======================
@@ -1360,7 +1544,60 @@ def logout():
 
 
 
-if __name__ == '__main__':
+# ======================
+# APPLICATION FACTORY & READINESS
+# ======================
+_app_ready = False
+
+
+def create_app(config_overrides=None):
+    """Prepare the application for serving and return it
+
+    Routes and extensions are registered on the module-level ``app`` at
+    import, so the database is chosen by ``DATABASE_URL`` before that;
+    ``config_overrides`` can change the other settings. Missing tables are
+    created, and the AI components are warmed up as ``AI_WARMUP`` says:
+    ``sync`` now, ``background`` in a thread, ``off`` lazily on first use.
+    A pre-forking server (see ``wsgi.py`` and ``gunicorn.conf.py``) calls
+    this once in its master process with ``sync``, so the workers start
+    warm and share the preloaded pages.
+    """
+    global _app_ready
+
+    if config_overrides:
+        if 'SQLALCHEMY_DATABASE_URI' in config_overrides:
+            raise ValueError('Set DATABASE_URL before importing app to choose the database')
+        app.config.update(config_overrides)
+
     with app.app_context():
         db.create_all()
-    app.run(debug=True, port=5001)
+        # Forked workers must open their own connections
+        db.engine.dispose()
+
+    if app.config['AI_WARMUP'] == 'sync':
+        ai_warmup.warm_up(freeze_gc=True)
+    elif app.config['AI_WARMUP'] == 'background':
+        ai_warmup.start_background_warm_up()
+
+    _app_ready = True
+    return app
+
+
+@app.route('/healthz/ready')
+def healthz_ready():
+    """Readiness probe: 200 once create_app has prepared this process and no warm-up is running
+
+    A degraded warm-up (some AI component failed) still reports 200: those
+    components are built again on first use.
+    """
+    ready = _app_ready and not ai_warmup.is_warming()
+    return jsonify({
+        'status': 'ready' if ready else 'starting',
+        'pid': os.getpid(),
+        'ai_components': ai_registry.loaded_components(),
+        'ai_warmup': ai_warmup.readiness()
+    }), 200 if ready else 503
+
+
+if __name__ == '__main__':
+    create_app().run(debug=True, port=5001)
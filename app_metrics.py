@@ -0,0 +1,145 @@
+"""
+App Metrics
+Prometheus metrics for the Flask app, served at ``/metrics``
+
+Collected by request hooks and the statement timing of ``query_monitor``
+(``query_monitor.init_app`` must be registered for the DB metrics):
+
+- ``http_request_duration_seconds``: latency per route template, method
+  and status code
+- ``http_request_db_queries`` / ``http_request_db_seconds``: number and
+  total time of DB queries per request
+- ``notification_polls_total``: polls of the notification API
+- ``export_duration_seconds`` / ``export_size_bytes``: PDF/Excel exports
+- ``cv_pipeline_stage_seconds``: CV analysis stage times (from
+  ``ai_modules.pipeline_metrics``)
+
+Pre-forked workers: set ``PROMETHEUS_MULTIPROC_DIR`` to an empty,
+writable directory before the workers start. prometheus_client then
+writes each worker's samples to that directory, and ``/metrics``
+aggregates all of them. Call ``mark_process_dead(pid)`` when a worker
+exits. Without prometheus_client, ``/metrics`` answers 503.
+"""
+
+import os
+import time
+
+from flask import Response, g, request
+
+import query_monitor
+from ai_modules import pipeline_metrics
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, REGISTRY, generate_latest, multiprocess
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+# Endpoints whose requests are counted as notification polls / exports
+NOTIFICATION_POLL_ENDPOINTS = frozenset({'get_notifications'})
+EXPORT_ENDPOINTS = {'export_pdf': 'pdf', 'export_excel': 'excel'}
+
+if PROMETHEUS_AVAILABLE:
+    REQUEST_LATENCY = Histogram(
+        'http_request_duration_seconds', 'HTTP request latency',
+        ['method', 'route', 'status']
+    )
+    REQUEST_DB_QUERIES = Histogram(
+        'http_request_db_queries', 'DB queries executed per request', ['route'],
+        buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+    )
+    REQUEST_DB_SECONDS = Histogram(
+        'http_request_db_seconds', 'Total DB query time per request', ['route']
+    )
+    NOTIFICATION_POLLS = Counter('notification_polls_total', 'Notification API polls')
+    EXPORT_DURATION = Histogram(
+        'export_duration_seconds', 'Export generation time', ['format'],
+        buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+    )
+    EXPORT_SIZE = Histogram(
+        'export_size_bytes', 'Export file size', ['format'],
+        buckets=(1e3, 1e4, 1e5, 5e5, 1e6, 5e6, 1e7, 5e7)
+    )
+    CV_STAGE_SECONDS = Histogram(
+        'cv_pipeline_stage_seconds', 'CV analysis pipeline stage wall time', ['pipeline', 'stage']
+    )
+
+_observer_installed = False
+
+
+def _route_label():
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+
+def _before_request():
+    g.metrics_start = time.perf_counter()
+
+
+def _after_request(response):
+    start = g.pop('metrics_start', None)
+    if start is None:
+        return response
+
+    elapsed = time.perf_counter() - start
+    route = _route_label()
+    REQUEST_LATENCY.labels(request.method, route, str(response.status_code)).observe(elapsed)
+    query_count, query_seconds = query_monitor.request_query_stats()
+    REQUEST_DB_QUERIES.labels(route).observe(query_count)
+    REQUEST_DB_SECONDS.labels(route).observe(query_seconds)
+
+    if request.endpoint in NOTIFICATION_POLL_ENDPOINTS:
+        NOTIFICATION_POLLS.inc()
+
+    export_format = EXPORT_ENDPOINTS.get(request.endpoint)
+    if export_format and response.status_code == 200:
+        EXPORT_DURATION.labels(export_format).observe(elapsed)
+        if response.content_length is not None:
+            EXPORT_SIZE.labels(export_format).observe(response.content_length)
+
+    return response
+
+
+def _observe_pipeline_run(run):
+    total_wall_ms, _ = run.total()
+    CV_STAGE_SECONDS.labels(run.pipeline, 'total').observe(total_wall_ms / 1000)
+    for name, entry in run.stages.items():
+        CV_STAGE_SECONDS.labels(run.pipeline, name).observe(entry['wall_ms'] / 1000)
+
+
+def metrics_registry():
+    """Registry to export: all workers' samples in multi-process mode"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_view():
+    if not PROMETHEUS_AVAILABLE:
+        return Response('prometheus_client is not installed\n', status=503, mimetype='text/plain')
+    return Response(generate_latest(metrics_registry()), mimetype=CONTENT_TYPE_LATEST)
+
+
+def mark_process_dead(pid):
+    """Clean up a finished worker's live samples (multi-process mode)"""
+    if PROMETHEUS_AVAILABLE and os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid)
+
+
+def init_app(app):
+    """Register the /metrics endpoint and the metric collection hooks"""
+    global _observer_installed
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+    if not PROMETHEUS_AVAILABLE or not app.config.get('METRICS_ENABLED', True):
+        return
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+
+    if not _observer_installed:
+        pipeline_metrics.add_observer(_observe_pipeline_run)
+        _observer_installed = True
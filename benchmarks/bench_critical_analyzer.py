@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Critical analyzer benchmark: per-phrase containment loops vs single-pass scan
+
+Runs the lexicon lookups of ``CriticalAnalyzer`` over a synthetic bilingual
+CV, once as one ``phrase in text`` check per lexicon entry (the previous
+implementation) and once through ``LexiconScanner``, and times a full
+``analyze_content_quality`` call. Prints timings as JSON.
+
+Usage:
+    python benchmarks/bench_critical_analyzer.py [--size 2 10 50] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from ai_modules import lexicon_scanner
+from ai_modules.critical_analyzer import CriticalAnalyzer
+
+CV_SECTION = """RINGKASAN
+Senior software engineer dengan pengalaman 6 tahun di bidang fintech dan e-commerce.
+PENGALAMAN KERJA
+PT Maju Jaya - Lead Developer (2019 - 2024)
+- Bertanggung jawab memimpin tim 8 engineer dan mengelola roadmap produk
+- Meningkatkan performa API 45% dan menghemat biaya cloud Rp 200 juta per tahun
+- Led the migration to microservices, improved deployment frequency by 3x
+EDUCATION
+Bachelor of Computer Science, Universitas Indonesia, GPA 3.7
+SKILLS
+Python, Django, PostgreSQL, Docker, Kubernetes, AWS, fluent English
+"""
+
+
+def make_text(size):
+    return '\n'.join(CV_SECTION for _ in range(size))
+
+
+def time_call(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def naive_scan(lexicons, text):
+    padded = f" {text.lower()} "
+    return {category: sum(1 for phrase in phrases if phrase in padded) for category, phrases in lexicons.items()}
+
+
+def single_pass_scan(scanner, text):
+    scan = scanner._scan(text)  # uncached
+    return {category: scan.count(category) for category in scanner.lexicons}
+
+
+def run(sizes, repeat):
+    analyzer = CriticalAnalyzer()
+    scanner = analyzer.lexicon_scanner
+    lexicons = scanner.lexicons
+    results = []
+    for size in sizes:
+        text = make_text(size)
+        results.append({
+            'text_chars': len(text),
+            'phrases': len(scanner.phrases),
+            'aho_corasick': lexicon_scanner.AHOCORASICK_AVAILABLE,
+            'naive_loops_ms': time_call(lambda: naive_scan(lexicons, text), repeat),
+            'single_pass_ms': time_call(lambda: single_pass_scan(scanner, text), repeat),
+            'analyze_content_quality_ms': time_call(
+                lambda: (scanner.scan.cache_clear(), analyzer.analyze_content_quality(text, ['python'])), repeat),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Critical analyzer benchmark')
+    parser.add_argument('--size', type=int, nargs='+', default=[2, 10, 50])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run(args.size, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+CV pipeline benchmark over the synthetic bilingual corpus
+
+Times ``NLPProcessor.process_cv_text``, ``CVAnalyzer.analyze_cv`` (per file
+format), ``CVAnalyzer.analyze_cv_critical``, ``JobMatcher.batch_analyze_jobs``
+and ``InsightsGenerator.generate_all_insights`` on the CVs of
+``cv_corpus.py``. Every case reports latency percentiles, throughput and
+the tracemalloc peak of one extra, untimed run. Result caches (critical
+analysis reports, lexicon scans) are cleared before each sample, so the
+numbers are cold-path timings.
+
+Usage:
+    python benchmarks/bench_cv_pipeline.py [--repeat 10] [--seed 0] [--formats txt docx pdf]
+                                           [--jobs 500] [--write-report [PATH]]
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+DEFAULT_REPORT = os.path.join(BENCH_DIR, 'results', 'cv_pipeline.json')
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from cv_corpus import FORMATS, build_corpus
+from ai_modules.cv_analyzer import CVAnalyzer
+from ai_modules.critical_analyzer import CriticalAnalyzer
+from ai_modules.feedback_generator import FeedbackGenerator
+from ai_modules.insights_generator import InsightsGenerator
+from ai_modules.job_matcher import JobMatcher
+from ai_modules.nlp_processor import NLPProcessor
+from test_batch_job_matcher import make_jobs
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_samples, pct):
+    """Linear interpolation between closest ranks"""
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    rank = (len(sorted_samples) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_samples) - 1)
+    return sorted_samples[low] + (sorted_samples[high] - sorted_samples[low]) * (rank - low)
+
+
+def measure(func, repeat, reset=None):
+    """Timing samples plus the allocation peak of one traced run"""
+    samples = []
+    for _ in range(repeat):
+        if reset:
+            reset()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    if reset:
+        reset()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    result = {
+        'samples': repeat,
+        'mean_ms': round(sum(samples) / repeat, 3),
+        'min_ms': round(samples[0], 3),
+        'max_ms': round(samples[-1], 3),
+        'throughput_per_s': round(1000 * repeat / sum(samples), 2) if sum(samples) else None,
+        'peak_memory_kb': round(peak / 1024, 1)
+    }
+    for pct in PERCENTILES:
+        result[f'p{pct}_ms'] = round(percentile(samples, pct), 3)
+    return result
+
+
+def run(repeat=10, seed=0, formats=FORMATS, job_count=500):
+    nlp = NLPProcessor()
+    critical_analyzer = CriticalAnalyzer()
+    analyzer = CVAnalyzer(nlp=nlp, critical_analyzer=critical_analyzer, feedback_generator=FeedbackGenerator())
+    matcher = JobMatcher()
+    insights_generator = InsightsGenerator()
+
+    def reset_caches():
+        critical_analyzer._reports.clear()
+        critical_analyzer.lexicon_scanner.scan.cache_clear()
+
+    cases = []
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        corpus = build_corpus(corpus_dir, seed=seed, formats=formats)
+        jobs = make_jobs(job_count, seed=seed)
+
+        for item in corpus:
+            variant = {key: item[key] for key in ('language', 'length', 'format', 'chars', 'file_size')}
+
+            if item['format'] == formats[0]:
+                # Text-only stages do not depend on the file format
+                cases.append(dict(variant, case='process_cv_text', format=None,
+                                  **measure(lambda: nlp.process_cv_text(item['text']), repeat)))
+
+            cases.append(dict(variant, case='analyze_cv', **measure(
+                lambda: analyzer.analyze_cv(item['path'], item['file_size']), repeat, reset_caches)))
+
+            if item['format'] != formats[0]:
+                continue
+
+            cases.append(dict(variant, case='analyze_cv_critical', **measure(
+                lambda: analyzer.analyze_cv_critical(item['path'], item['file_size']), repeat, reset_caches)))
+
+            cv_analysis = analyzer.analyze_cv(item['path'], item['file_size'])
+            cases.append(dict(variant, case='batch_analyze_jobs', jobs=job_count, **measure(
+                lambda: matcher.batch_analyze_jobs(cv_analysis, jobs), repeat)))
+
+            user_data = {
+                'cv_analysis': cv_analysis,
+                'job_applications': [
+                    dict(job, status=('Applied', 'Interview', 'Rejected')[index % 3])
+                    for index, job in enumerate(jobs[:50])
+                ]
+            }
+            cases.append(dict(variant, case='generate_all_insights', **measure(
+                lambda: insights_generator.generate_all_insights(user_data), repeat)))
+
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+        'formats': list(formats),
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'cases': cases
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CV pipeline benchmark over a synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--jobs', type=int, default=500)
+    parser.add_argument('--write-report', nargs='?', const=DEFAULT_REPORT, default=None,
+                        help=f'write the JSON report (default path: {os.path.relpath(DEFAULT_REPORT, PROJECT_ROOT)})')
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.seed, tuple(args.formats), args.jobs)
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.write_report:
+        os.makedirs(os.path.dirname(args.write_report), exist_ok=True)
+        with open(args.write_report, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for worker cold start
+
+Runs ``python -X importtime -c "import app"`` in fresh interpreters, reports
+the total and the most expensive modules, and checks the result against
+``import_time_budget.json``: the total must stay under ``budget_ms`` and
+none of the ``deferred_modules`` (pandas, reportlab, nltk, yake, ...) may be
+imported at startup. Exits with status 1 on a regression.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 5] [--top 15] [--write-report PATH]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+BUDGET_FILE = os.path.join(BENCH_DIR, 'import_time_budget.json')
+DEFAULT_REPORT = os.path.join(BENCH_DIR, 'results', 'import_time_app.json')
+
+
+def load_budget():
+    with open(BUDGET_FILE) as f:
+        return json.load(f)
+
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` output into {module: (self_us, cumulative_us)}"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace('import time:', '|', 1).split('|')]
+        timings[name] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def profile_once(module):
+    """Import ``module`` in a fresh interpreter and return parsed timings"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def run(runs=5, top=15):
+    """Profile the configured module and compare with the budget"""
+    budget = load_budget()
+    module = budget['module']
+
+    profiles = [profile_once(module) for _ in range(runs)]
+    totals_ms = [profile[module][1] / 1000 for profile in profiles]
+
+    # Use the median run for the per-module breakdown
+    median_index = sorted(range(runs), key=lambda i: totals_ms[i])[runs // 2]
+    median_profile = profiles[median_index]
+    slowest = sorted(median_profile.items(), key=lambda item: item[1][1], reverse=True)
+
+    deferred_imported = sorted(
+        name for name in budget['deferred_modules']
+        if any(imported == name or imported.startswith(name + '.') for imported in median_profile)
+    )
+
+    total_ms = statistics.median(totals_ms)
+    return {
+        'module': module,
+        'python': sys.version.split()[0],
+        'runs': runs,
+        'total_ms': {
+            'median': round(total_ms, 1),
+            'min': round(min(totals_ms), 1),
+            'max': round(max(totals_ms), 1)
+        },
+        'budget_ms': budget['budget_ms'],
+        'modules_imported': len(median_profile),
+        'top_modules': [
+            {'module': name, 'self_ms': round(self_us / 1000, 1), 'cumulative_ms': round(cum_us / 1000, 1)}
+            for name, (self_us, cum_us) in slowest[:top]
+        ],
+        'deferred_modules_imported': deferred_imported,
+        'passed': total_ms <= budget['budget_ms'] and not deferred_imported
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time benchmark for worker cold start')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--write-report', nargs='?', const=DEFAULT_REPORT, default=None,
+                        help=f'write the JSON report (default path: {os.path.relpath(DEFAULT_REPORT, PROJECT_ROOT)})')
+    args = parser.parse_args()
+
+    report = run(args.runs, args.top)
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.write_report:
+        os.makedirs(os.path.dirname(args.write_report), exist_ok=True)
+        with open(args.write_report, 'w') as f:
+            f.write(output + '\n')
+
+    if not report['passed']:
+        if report['deferred_modules_imported']:
+            print(f"❌ Deferred modules imported at startup: {', '.join(report['deferred_modules_imported'])}", file=sys.stderr)
+        if report['total_ms']['median'] > report['budget_ms']:
+            print(f"❌ import {report['module']} took {report['total_ms']['median']}ms (budget {report['budget_ms']}ms)", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Job matching benchmark: per-job loop vs vectorized batch engine
+
+Scores N synthetic applications against one CV with
+``JobMatcher.batch_analyze_jobs_sequential`` and ``batch_analyze_jobs``
+(BatchJobMatcher), with requirements derived per call or stored at write
+time, and prints timings as JSON.
+
+Usage:
+    python benchmarks/bench_job_matching.py [--jobs 1000 5000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from ai_modules.batch_matcher import BatchJobMatcher
+from ai_modules.job_matcher import JobMatcher
+from test_batch_job_matcher import make_jobs
+
+CV_ANALYSIS = {
+    'extracted_skills': [
+        'python', 'django', 'flask', 'postgres', 'sql', 'docker', 'kubernetes', 'aws', 'git',
+        'javascript', 'react', 'excel', 'tableau', 'agile', 'scrum', 'machine learning',
+        'leadership', 'communication', 'problem solving', 'teamwork'
+    ],
+    'experience_level': 'mid',
+    'contact_info': {'location': 'Jakarta Selatan'}
+}
+
+
+def time_call(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+def run(job_counts, repeat):
+    matcher = JobMatcher()
+    results = []
+    for count in job_counts:
+        jobs = make_jobs(count)
+        requirements = [matcher.extract_job_requirements(job) for job in jobs]
+        # Jobs as loaded from the database, with requirements stored at write time
+        stored_jobs = [dict(job, **matcher.derive_job_requirements(job)) for job in jobs]
+        batch = BatchJobMatcher(matcher)
+        cv_skills = [skill.lower() for skill in CV_ANALYSIS['extracted_skills']]
+        job_skills = [[skill.lower() for skill in req['extracted_skills']] for req in requirements]
+
+        results.append({
+            'jobs': count,
+            'sequential_ms': time_call(lambda: matcher.batch_analyze_jobs_sequential(CV_ANALYSIS, jobs), repeat),
+            'batch_ms': time_call(lambda: matcher.batch_analyze_jobs(CV_ANALYSIS, jobs), repeat),
+            'batch_stored_requirements_ms': time_call(lambda: matcher.batch_analyze_jobs(CV_ANALYSIS, stored_jobs), repeat),
+            'batch_requirement_extraction_ms': time_call(
+                lambda: [matcher.extract_job_requirements(job) for job in jobs], repeat),
+            'batch_skill_scoring_ms': time_call(lambda: batch._skill_scores(cv_skills, job_skills), repeat),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Job matching benchmark')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(args.jobs, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
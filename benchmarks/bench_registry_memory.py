@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the shared AI component registry
+
+Forks N workers after building the AI components in the parent and reports,
+per worker, how many instances of each AI class exist and the worker's
+RSS / PSS / private memory. Compares the shared registry against the old
+wiring where app.py, AIService and every CVAnalyzer built their own copies.
+
+Usage:
+    python benchmarks/bench_registry_memory.py [--workers 4] [--mode both|shared|legacy]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_modules import registry
+from ai_modules.ai_service import AIService
+from ai_modules.critical_analyzer import CriticalAnalyzer
+from ai_modules.cv_analyzer import CVAnalyzer
+from ai_modules.feedback_generator import FeedbackGenerator
+from ai_modules.insights_generator import InsightsGenerator
+from ai_modules.job_matcher import JobMatcher
+from ai_modules.nlp_processor import NLPProcessor
+
+AI_CLASSES = (
+    NLPProcessor, CVAnalyzer, CriticalAnalyzer, FeedbackGenerator,
+    JobMatcher, InsightsGenerator, AIService
+)
+
+SAMPLE_CV = (
+    "Budi Santoso\nbudi@example.com +6281234567890\n"
+    "Senior Python developer with 6 years of experience in Django, SQL, Docker and AWS. "
+    "Led a team of 5 engineers and improved API latency by 40%.\n"
+    "Pendidikan: Sarjana Teknik Informatika, Universitas Indonesia 2016\n"
+)
+
+
+def build_shared():
+    """Current wiring: one instance per component via the registry"""
+    return [registry.get_ai_service(), registry.get_cv_analyzer(),
+            registry.get_job_matcher(), registry.get_insights_generator()]
+
+
+def build_legacy():
+    """Previous wiring: app.py and AIService each built private copies"""
+    def private_cv_analyzer():
+        return CVAnalyzer(nlp=NLPProcessor(), critical_analyzer=CriticalAnalyzer(),
+                          feedback_generator=FeedbackGenerator())
+
+    service = AIService(nlp_processor=NLPProcessor(), cv_analyzer=private_cv_analyzer(),
+                        job_matcher=JobMatcher(), insights_generator=InsightsGenerator())
+    module_level_service = AIService(nlp_processor=NLPProcessor(), cv_analyzer=private_cv_analyzer(),
+                                     job_matcher=JobMatcher(), insights_generator=InsightsGenerator())
+    return [service, module_level_service, private_cv_analyzer(), JobMatcher(), InsightsGenerator()]
+
+
+def count_instances():
+    """Count live instances of each AI class"""
+    counts = {cls.__name__: 0 for cls in AI_CLASSES}
+    for obj in gc.get_objects():
+        for cls in AI_CLASSES:
+            if type(obj) is cls:
+                counts[cls.__name__] += 1
+    return counts
+
+
+def memory_stats():
+    """RSS, PSS and private memory of this process in KB (Linux /proc)"""
+    stats = {}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('Rss', 'Pss', 'Private_Clean', 'Private_Dirty', 'Shared_Clean', 'Shared_Dirty'):
+                    stats[key.lower() + '_kb'] = int(value.split()[0])
+    except OSError:
+        import resource
+        stats['rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return stats
+
+
+def run_worker(components, write_fd):
+    """Worker body: do a small amount of work, then report instance counts and memory"""
+    service = components[0]
+    service.process_cv_text(SAMPLE_CV)
+    memory = memory_stats()
+    if hasattr(gc, 'unfreeze'):
+        # Frozen objects are invisible to gc.get_objects(); unfreeze only after measuring
+        gc.unfreeze()
+    report = {'pid': os.getpid(), 'instances': count_instances(), 'memory': memory}
+    os.write(write_fd, json.dumps(report).encode())
+    os.close(write_fd)
+    os._exit(0)
+
+
+def run_mode(mode, workers):
+    """Build components in the parent, fork workers and collect their reports"""
+    registry.reset()
+    gc.collect()
+    components = build_shared() if mode == 'shared' else build_legacy()
+    if mode == 'shared' and hasattr(gc, 'freeze'):
+        gc.collect()
+        gc.freeze()
+
+    reports = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            run_worker(components, write_fd)
+        os.close(write_fd)
+        chunks = []
+        while True:
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        reports.append(json.loads(b''.join(chunks)))
+
+    if hasattr(gc, 'unfreeze'):
+        gc.unfreeze()
+
+    private_kb = [r['memory'].get('private_dirty_kb', 0) + r['memory'].get('private_clean_kb', 0) for r in reports]
+    return {
+        'mode': mode,
+        'workers': reports,
+        'summary': {
+            'instances_per_worker': reports[0]['instances'] if reports else {},
+            'avg_rss_kb': sum(r['memory'].get('rss_kb', 0) for r in reports) / max(len(reports), 1),
+            'avg_pss_kb': sum(r['memory'].get('pss_kb', 0) for r in reports) / max(len(reports), 1),
+            'avg_private_kb': sum(private_kb) / max(len(private_kb), 1),
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--mode', choices=['both', 'shared', 'legacy'], default='both')
+    args = parser.parse_args()
+
+    modes = ['legacy', 'shared'] if args.mode == 'both' else [args.mode]
+    results = [run_mode(mode, args.workers) for mode in modes]
+    print(json.dumps(results if len(results) > 1 else results[0], indent=2))
+
+
+if __name__ == '__main__':
+    main()
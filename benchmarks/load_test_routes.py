@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Route-level load test with seeded large tenants
+
+Seeds a temporary SQLite database with ``seed_data`` (users that each own
+``--jobs`` applications, with their status-change notifications, CV
+profile and AI insights). Then it drives
+``--sessions`` concurrent simulated browser sessions through the Flask
+test client for ``--duration`` seconds. Each session mixes:
+
+- polling tabs (``/api/notifications``)
+- dashboard and job list pages
+- reports
+- status clicks (``/api/job/<id>/status``)
+- occasional exports
+
+Each route reports its latency percentiles, throughput, errors and the
+DB queries per request (from ``query_monitor``), next to its declared
+query budget. The application database is never touched:
+``DATABASE_URL`` points the app at the temporary file before it is
+imported.
+
+Usage:
+    python benchmarks/load_test_routes.py [--users 2] [--jobs 10000]
+                                          [--sessions 8] [--duration 20] [--seed 0]
+                                          [--write-report [PATH]]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+DEFAULT_REPORT = os.path.join(BENCH_DIR, 'results', 'load_test_routes.json')
+sys.path.insert(0, PROJECT_ROOT)
+
+from seed_data import STATUSES, Seeder
+
+# (name, weight): how often a simulated session performs each action
+SCENARIOS = [
+    ('poll_notifications', 40),
+    ('dashboard', 15),
+    ('job_list', 15),
+    ('reports', 5),
+    ('status_click', 20),
+    ('export_excel', 3),
+    ('export_pdf', 2)
+]
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def import_app(database_url):
+    """Import the app bound to ``database_url`` (never the real database)"""
+    os.environ['DATABASE_URL'] = database_url
+    import app as app_module
+    if app_module.app.config['SQLALCHEMY_DATABASE_URI'] != database_url:
+        raise RuntimeError('app was imported before DATABASE_URL was set; run the load test in a fresh process')
+    return app_module
+
+
+def seed(app_module, users, jobs_per_user, seed_value):
+    """Seed the tenants with ``seed_data``; returns ({user id: [job ids]}, row counts)"""
+    from models import JobApplication
+
+    app = app_module.app
+    threshold = app.config.get('SLOW_QUERY_THRESHOLD_MS')
+    # Bulk inserts are not slow queries of the routes under test
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = None
+    with app.app_context():
+        app_module.db.create_all()
+        counts = Seeder(users, jobs_per_user, seed=seed_value, prefix='load').run()
+        jobs_by_user = {}
+        for job_id, user_id in app_module.db.session.query(JobApplication.id, JobApplication.user_id):
+            jobs_by_user.setdefault(user_id, []).append(job_id)
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = threshold
+    return jobs_by_user, counts
+
+
+def percentile(sorted_samples, pct):
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    rank = (len(sorted_samples) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_samples) - 1)
+    return sorted_samples[low] + (sorted_samples[high] - sorted_samples[low]) * (rank - low)
+
+
+def make_request(client, scenario, job_ids, rng, pages):
+    """Perform one scenario action; returns (route label, response)"""
+    if scenario == 'poll_notifications':
+        return 'GET /api/notifications', client.get('/api/notifications')
+    if scenario == 'dashboard':
+        return 'GET /', client.get(f'/?page={rng.randint(1, pages)}')
+    if scenario == 'job_list':
+        return 'GET /jobs', client.get(f'/jobs?page={rng.randint(1, pages)}')
+    if scenario == 'reports':
+        return 'GET /reports', client.get('/reports')
+    if scenario == 'status_click':
+        return 'POST /api/job/<id>/status', client.post(
+            f'/api/job/{rng.choice(job_ids)}/status', json={'status': rng.choice(STATUSES)[0]}
+        )
+    if scenario == 'export_excel':
+        return 'GET /export/excel', client.get('/export/excel')
+    if scenario == 'export_pdf':
+        return 'GET /export/pdf', client.get('/export/pdf')
+    raise ValueError(scenario)
+
+
+def run_session(app, user_id, job_ids, deadline, rng, samples, lock):
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
+
+    names = [name for name, _ in SCENARIOS]
+    weights = [weight for _, weight in SCENARIOS]
+    pages = max(1, len(job_ids) // 10)
+    local = []
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        route, response = make_request(client, scenario, job_ids, rng, pages)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        local.append((route, response.status_code, elapsed_ms, int(response.headers.get('X-Query-Count', 0))))
+    with lock:
+        samples.extend(local)
+
+
+def summarize(samples, wall_seconds, budgets):
+    routes = {}
+    for route, status_code, elapsed_ms, queries in samples:
+        routes.setdefault(route, []).append((status_code, elapsed_ms, queries))
+
+    summary = {}
+    for route, entries in sorted(routes.items()):
+        latencies = sorted(elapsed for _, elapsed, _ in entries)
+        queries = [count for _, _, count in entries]
+        summary[route] = {
+            'requests': len(entries),
+            'errors': sum(1 for status_code, _, _ in entries if status_code >= 400),
+            'throughput_per_s': round(len(entries) / wall_seconds, 2),
+            'mean_ms': round(sum(latencies) / len(latencies), 2),
+            'max_ms': round(latencies[-1], 2),
+            'queries_mean': round(sum(queries) / len(queries), 2),
+            'queries_max': max(queries),
+            'query_budget': budgets.get(route)
+        }
+        for pct in PERCENTILES:
+            summary[route][f'p{pct}_ms'] = round(percentile(latencies, pct), 2)
+    return summary
+
+
+def run(users=2, jobs=10000, sessions=8, duration=20, seed_value=0):
+    with tempfile.TemporaryDirectory() as tmp:
+        app_module = import_app(f"sqlite:///{os.path.join(tmp, 'load.db')}")
+        app = app_module.app
+        app.config['QUERY_BUDGET_MODE'] = 'off'  # reported below instead of enforced
+        app.config['JOB_MATCH_BACKGROUND'] = False
+
+        import query_monitor
+
+        @app.after_request
+        def add_query_count(response):
+            response.headers['X-Query-Count'] = str(query_monitor.request_query_stats()[0])
+            return response
+
+        seed_start = time.perf_counter()
+        jobs_by_user, counts = seed(app_module, users, jobs, seed_value)
+        seed_seconds = time.perf_counter() - seed_start
+
+        endpoints = {
+            'GET /api/notifications': 'get_notifications', 'GET /': 'index', 'GET /jobs': 'jobs',
+            'GET /reports': 'reports', 'POST /api/job/<id>/status': 'update_job_status',
+            'GET /export/excel': 'export_excel', 'GET /export/pdf': 'export_pdf'
+        }
+        budgets = {
+            route: getattr(app.view_functions[endpoint], 'query_budget', None)
+            for route, endpoint in endpoints.items()
+        }
+
+        samples = []
+        lock = threading.Lock()
+        user_ids = list(jobs_by_user)
+        start = time.perf_counter()
+        deadline = start + duration
+        threads = [
+            threading.Thread(target=run_session, args=(
+                app, user_ids[index % len(user_ids)], jobs_by_user[user_ids[index % len(user_ids)]],
+                deadline, random.Random(seed_value * 1000 + index), samples, lock
+            ))
+            for index in range(sessions)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall_seconds = time.perf_counter() - start
+
+        # Release the pooled connections before the temporary directory is removed
+        with app.app_context():
+            app_module.db.engine.dispose()
+
+    return {
+        'python': sys.version.split()[0],
+        'users': users,
+        'jobs_per_user': jobs,
+        'seeded_rows': counts,
+        'sessions': sessions,
+        'duration_s': round(wall_seconds, 2),
+        'seed_s': round(seed_seconds, 2),
+        'total_requests': len(samples),
+        'throughput_per_s': round(len(samples) / wall_seconds, 2),
+        'routes': summarize(samples, wall_seconds, budgets)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Route-level load test with seeded large tenants')
+    parser.add_argument('--users', type=int, default=2)
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--write-report', nargs='?', const=DEFAULT_REPORT, default=None,
+                        help=f'write the JSON report (default path: {os.path.relpath(DEFAULT_REPORT, PROJECT_ROOT)})')
+    args = parser.parse_args()
+
+    report = run(args.users, args.jobs, args.sessions, args.duration, args.seed)
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.write_report:
+        os.makedirs(os.path.dirname(args.write_report), exist_ok=True)
+        with open(args.write_report, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+SQLite concurrency stress test: default journal vs ``db_bootstrap`` pragmas
+
+Seeds one database per mode with ``seed_data``. Then ``--workers``
+processes (like pre-forked app workers), each with its own engine, run
+for ``--duration`` seconds. Each worker mixes:
+
+- notification polls (unread count plus the latest notifications),
+- status updates: the read-modify-write of ``/api/job/<id>/status``
+  (read the job, update its status, insert a notification) in one
+  transaction, and
+- exports: a long read of all of a user's applications, as the
+  Excel/PDF exports do.
+
+Modes:
+
+- ``default``: no pragmas (rollback journal, sqlite3's 5 s timeout).
+- ``tuned``: ``db_bootstrap.pragmas_from_env()`` (WAL, synchronous=NORMAL,
+  busy timeout, mmap and cache size).
+
+Each mode reports throughput, the lock-error rate ("database is locked"
+/ "busy") and latency percentiles per operation.
+
+Usage:
+    python benchmarks/stress_sqlite_concurrency.py [--workers 8] [--duration 10] [--write-ratio 0.3]
+                                                   [--export-ratio 0.02]
+                                                   [--users 4] [--jobs 2000] [--modes default tuned]
+                                                   [--write-report [PATH]]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+DEFAULT_REPORT = os.path.join(BENCH_DIR, 'results', 'stress_sqlite_concurrency.json')
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+
+import db_bootstrap
+from seed_data import STATUSES
+
+MODES = ('default', 'tuned')
+OPERATIONS = ('poll', 'status_update', 'export')
+PERCENTILES = (50, 90, 99)
+
+
+def mode_pragmas(mode):
+    return {} if mode == 'default' else db_bootstrap.pragmas_from_env()
+
+
+def prepare_database(path, users, jobs_per_user):
+    """Seed a fresh database file; returns {user id: [job ids]}"""
+    from flask import Flask
+    from extensions import db
+    from models import JobApplication
+    from seed_data import Seeder
+
+    seed_app = Flask(__name__)
+    seed_app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    db.init_app(seed_app)
+    with seed_app.app_context():
+        db.create_all()
+        Seeder(users, jobs_per_user, prefix='stress').run()
+        jobs_by_user = {}
+        for job_id, user_id in db.session.query(JobApplication.id, JobApplication.user_id):
+            jobs_by_user.setdefault(user_id, []).append(job_id)
+        db.engine.dispose()
+    return jobs_by_user
+
+
+def poll_notifications(connection, notification, user_id):
+    connection.execute(
+        select(func.count()).select_from(notification)
+        .where(notification.c.user_id == user_id, notification.c.is_read.is_(False))
+    ).scalar()
+    connection.execute(
+        select(notification).where(notification.c.user_id == user_id)
+        .order_by(notification.c.created_at.desc()).limit(10)
+    ).all()
+
+
+def export_jobs(connection, job_table, user_id):
+    for _ in connection.execute(select(job_table).where(job_table.c.user_id == user_id)):
+        pass
+
+
+def update_status(connection, tables, status_ids, job_id, rng):
+    job_table, notification = tables
+    job = connection.execute(select(job_table).where(job_table.c.id == job_id)).one()
+    status_name = rng.choice(list(status_ids))
+    now = datetime.now()
+    connection.execute(
+        job_table.update().where(job_table.c.id == job_id)
+        .values(status_id=status_ids[status_name], last_status_update=now)
+    )
+    connection.execute(notification.insert().values(
+        user_id=job.user_id, title='Status Lamaran Diupdate',
+        message=f'Status lamaran di {job.company_name} berhasil diubah menjadi {status_name}',
+        type='info', is_read=False, created_at=now, job_id=job_id
+    ))
+
+
+def worker(path, mode, jobs_by_user, status_ids, duration, write_ratio, export_ratio, seed):
+    """Run the operation mix until the deadline; returns per-operation samples"""
+    from models import JobApplication, Notification
+
+    engine = create_engine(f'sqlite:///{path}')
+    db_bootstrap.configure_engine(engine, mode_pragmas(mode))
+    tables = (JobApplication.__table__, Notification.__table__)
+    rng = random.Random(seed)
+    user_ids = list(jobs_by_user)
+
+    samples = {operation: [] for operation in OPERATIONS}
+    errors = {operation: 0 for operation in OPERATIONS}
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        user_id = rng.choice(user_ids)
+        draw = rng.random()
+        if draw < write_ratio:
+            operation = 'status_update'
+        elif draw < write_ratio + export_ratio:
+            operation = 'export'
+        else:
+            operation = 'poll'
+        start = time.perf_counter()
+        try:
+            with engine.begin() as connection:
+                if operation == 'poll':
+                    poll_notifications(connection, tables[1], user_id)
+                elif operation == 'export':
+                    export_jobs(connection, tables[0], user_id)
+                else:
+                    update_status(connection, tables, status_ids, rng.choice(jobs_by_user[user_id]), rng)
+        except OperationalError as e:
+            if 'locked' not in str(e) and 'busy' not in str(e):
+                raise
+            errors[operation] += 1
+            continue
+        samples[operation].append((time.perf_counter() - start) * 1000)
+    engine.dispose()
+    return samples, errors
+
+
+def percentile(sorted_samples, pct):
+    if not sorted_samples:
+        return None
+    rank = (len(sorted_samples) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_samples) - 1)
+    return round(sorted_samples[low] + (sorted_samples[high] - sorted_samples[low]) * (rank - low), 2)
+
+
+def run_mode(mode, workers, duration, write_ratio, export_ratio, users, jobs_per_user):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f'{mode}.db')
+        jobs_by_user = prepare_database(path, users, jobs_per_user)
+        status_ids = {name: index + 1 for index, (name, _) in enumerate(STATUSES)}
+
+        # Switch the file to WAL once (persistent) before the workers start
+        engine = create_engine(f'sqlite:///{path}')
+        db_bootstrap.configure_engine(engine, mode_pragmas(mode))
+        with engine.connect() as connection:
+            pragmas = db_bootstrap.read_pragmas(connection)
+        engine.dispose()
+
+        start = time.perf_counter()
+        with multiprocessing.get_context('spawn').Pool(workers) as pool:
+            results = pool.starmap(worker, [
+                (path, mode, jobs_by_user, status_ids, duration, write_ratio, export_ratio, index)
+                for index in range(workers)
+            ])
+        wall_seconds = time.perf_counter() - start
+
+    operations = {}
+    for operation in OPERATIONS:
+        latencies = sorted(sample for samples, _ in results for sample in samples[operation])
+        failed = sum(errors[operation] for _, errors in results)
+        attempted = len(latencies) + failed
+        operations[operation] = {
+            'completed': len(latencies),
+            'lock_errors': failed,
+            'lock_error_rate': round(failed / attempted, 4) if attempted else 0.0,
+            'throughput_per_s': round(len(latencies) / duration, 1)
+        }
+        for pct in PERCENTILES:
+            operations[operation][f'p{pct}_ms'] = percentile(latencies, pct)
+
+    completed = sum(entry['completed'] for entry in operations.values())
+    failed = sum(entry['lock_errors'] for entry in operations.values())
+    return {
+        'pragmas': pragmas,
+        'wall_s': round(wall_seconds, 2),
+        'throughput_per_s': round(completed / duration, 1),
+        'lock_error_rate': round(failed / (completed + failed), 4) if completed + failed else 0.0,
+        'operations': operations
+    }
+
+
+def run(workers=8, duration=10, write_ratio=0.3, export_ratio=0.02, users=4, jobs_per_user=2000, modes=MODES):
+    return {
+        'python': sys.version.split()[0],
+        'workers': workers,
+        'duration_s': duration,
+        'write_ratio': write_ratio,
+        'export_ratio': export_ratio,
+        'modes': {
+            mode: run_mode(mode, workers, duration, write_ratio, export_ratio, users, jobs_per_user)
+            for mode in modes
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite concurrency stress test')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--write-ratio', type=float, default=0.3)
+    parser.add_argument('--export-ratio', type=float, default=0.02)
+    parser.add_argument('--users', type=int, default=4)
+    parser.add_argument('--jobs', type=int, default=2000)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--write-report', nargs='?', const=DEFAULT_REPORT, default=None,
+                        help=f'write the JSON report (default path: {os.path.relpath(DEFAULT_REPORT, PROJECT_ROOT)})')
+    args = parser.parse_args()
+
+    report = run(args.workers, args.duration, args.write_ratio, args.export_ratio, args.users, args.jobs, tuple(args.modes))
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.write_report:
+        os.makedirs(os.path.dirname(args.write_report), exist_ok=True)
+        with open(args.write_report, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Config
+Environment-driven application settings
+
+Every setting has the development default the app always used and can
+be overridden by an environment variable of the same name (for the
+database: ``DATABASE_URL``). Booleans accept 1/0, true/false, yes/no
+and on/off. For optional numbers, an empty value or ``none`` means
+None (for example, no query budget).
+"""
+
+import os
+
+import db_bootstrap
+
+TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+FALSE_VALUES = frozenset({'0', 'false', 'no', 'off'})
+# Same values as ai_modules.warmup.MODES (not imported: it pulls in the AI registry)
+WARMUP_MODES = ('off', 'sync', 'background')
+SENDFILE_MODES = ('off', 'x-sendfile', 'x-accel-redirect')
+
+
+def _bool(value):
+    value = value.strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f'not a boolean: {value!r}')
+
+
+def _choice(*choices):
+    def parse(value):
+        value = value.strip().lower()
+        if value not in choices:
+            raise ValueError(f"expected one of {', '.join(choices)}: {value!r}")
+        return value
+    return parse
+
+
+def _optional_int(value):
+    value = value.strip()
+    return None if value.lower() in ('', 'none') else int(value)
+
+
+# name: (default, parser of the environment value)
+SETTINGS = {
+    'SECRET_KEY': ('super-secret-key-alfarizi', str),
+    'SQLALCHEMY_TRACK_MODIFICATIONS': (False, _bool),
+
+    # Job matches are recomputed incrementally in background batches (see job_match_sync)
+    'JOB_MATCH_BACKGROUND': (True, _bool),
+    'JOB_MATCH_BATCH_SIZE': (200, int),
+
+    # Prometheus metrics at /metrics (see app_metrics)
+    'METRICS_ENABLED': (True, _bool),
+
+    # Slow-query log and per-request query budgets (see query_monitor)
+    'SLOW_QUERY_THRESHOLD_MS': (200, _optional_int),
+    'QUERY_BUDGET_DEFAULT': (None, _optional_int),
+
+    # AI warm-up in create_app (see ai_modules.warmup): 'sync' before a pre-fork
+    # server forks its workers, 'background' in a thread, 'off' to build lazily
+    'AI_WARMUP': ('background', _choice(*WARMUP_MODES)),
+
+    # File upload configuration
+    'UPLOAD_FOLDER': ('static/uploads/proofs', str),
+    'CV_UPLOAD_FOLDER': ('static/uploads/cv', str),
+    'MAX_CONTENT_LENGTH': (16 * 1024 * 1024, int),  # 16MB max file size
+
+    # Proof screenshots: WebP variants made in the background, and originals
+    # past this many pixels per side served as a downscaled copy (see proof_images)
+    'PROOF_IMAGES_BACKGROUND': (True, _bool),
+    'PROOF_MAX_DIMENSION': (2560, _optional_int),
+
+    # Let the front proxy send proof files: X-Sendfile (Apache, lighttpd) with
+    # the file path, or X-Accel-Redirect (nginx) with this internal location
+    # prefix followed by the path inside UPLOAD_FOLDER
+    'PROOF_SENDFILE': ('off', _choice(*SENDFILE_MODES)),
+    'PROOF_ACCEL_REDIRECT_PREFIX': ('/protected/proofs/', str)
+}
+
+
+def from_env(environ=None):
+    """Settings dict: defaults overridden by the environment"""
+    environ = os.environ if environ is None else environ
+    settings = {}
+    for name, (default, parse) in SETTINGS.items():
+        settings[name] = parse(environ[name]) if name in environ else default
+
+    settings['SQLALCHEMY_DATABASE_URI'] = environ.get('DATABASE_URL', 'sqlite:///database.db')
+    # SQLite WAL, busy timeout and cache pragmas per connection (see db_bootstrap)
+    settings['SQLITE_PRAGMAS'] = db_bootstrap.pragmas_from_env(environ)
+    if 'QUERY_BUDGET_MODE' in environ:
+        settings['QUERY_BUDGET_MODE'] = environ['QUERY_BUDGET_MODE']
+    return settings
+
+
+def load_config(app, environ=None):
+    app.config.update(from_env(environ))
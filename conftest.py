@@ -0,0 +1,34 @@
+"""
+Shared pytest fixtures for the root-level test files
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pytest
+from flask import Flask
+
+from extensions import db
+
+
+def create_test_app(db_path, **config):
+    """Bare Flask app with the database bound to the SQLite file ``db_path``
+
+    Extra keyword arguments are applied to ``app.config`` before the
+    extensions are initialized. Test files add their own extensions,
+    routes and tables on top of it.
+    """
+    test_app = Flask(__name__)
+    test_app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    test_app.config.update(config)
+    db.init_app(test_app)
+    return test_app
+
+
+@pytest.fixture
+def make_app():
+    """The ``create_test_app`` factory (plain import for the ``__main__`` runners)"""
+    return create_test_app
@@ -0,0 +1,89 @@
+"""
+DB Bootstrap
+SQLite concurrency tuning: WAL, busy timeout and pragmas on every pooled connection
+
+The default rollback journal lets a writer block every reader and makes
+concurrent writers fail fast with "database is locked". On each new DBAPI
+connection, the pragmas below are applied (SQLite engines only):
+
+- ``busy_timeout``: milliseconds to wait for a lock before failing.
+- ``journal_mode``: WAL lets readers run alongside one writer. The mode is
+  stored in the database file.
+- ``synchronous``: NORMAL is safe in WAL mode and skips an fsync per commit.
+- ``mmap_size``: bytes of the database file read through memory mapping.
+- ``cache_size``: page cache per connection (negative: KiB).
+
+Every value can be changed through the environment (``SQLITE_BUSY_TIMEOUT``,
+``SQLITE_JOURNAL_MODE``, ``SQLITE_SYNCHRONOUS``, ``SQLITE_MMAP_SIZE``,
+``SQLITE_CACHE_SIZE``). An empty value leaves that pragma at SQLite's
+default. The app reads them once into ``app.config['SQLITE_PRAGMAS']``.
+"""
+
+import os
+
+from sqlalchemy import event
+
+from extensions import db
+
+# Applied in this order: the busy timeout also covers switching to WAL
+DEFAULT_PRAGMAS = {
+    'busy_timeout': '5000',
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': str(256 * 1024 * 1024),
+    'cache_size': '-65536'
+}
+
+
+def pragmas_from_env(environ=None):
+    """{pragma: value} from SQLITE_<PRAGMA> variables over the defaults"""
+    environ = os.environ if environ is None else environ
+    pragmas = {}
+    for name, default in DEFAULT_PRAGMAS.items():
+        value = environ.get(f'SQLITE_{name.upper()}', default).strip()
+        if value:
+            pragmas[name] = value
+    return pragmas
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
+
+
+def configure_engine(engine, pragmas):
+    """Apply ``pragmas`` to every new connection of a SQLite ``engine``"""
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return False
+
+    pragmas = dict(pragmas)
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, pragmas)
+
+    # Connections opened before this call would keep the old settings
+    engine.dispose()
+    return True
+
+
+def read_pragmas(connection):
+    """Current values of the tuned pragmas on a SQLAlchemy connection"""
+    return {
+        name: connection.exec_driver_sql(f'PRAGMA {name}').scalar()
+        for name in DEFAULT_PRAGMAS
+    }
+
+
+def init_app(app):
+    """Tune the SQLite engines of ``app`` with ``SQLITE_PRAGMAS``"""
+    pragmas = app.config.get('SQLITE_PRAGMAS')
+    if pragmas is None:
+        pragmas = pragmas_from_env()
+    with app.app_context():
+        for engine in db.engines.values():
+            configure_engine(engine, pragmas)
@@ -0,0 +1,60 @@
+"""
+Gunicorn configuration: pre-forking production server
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The master loads the app and the AI components (``preload_app``) and then
+forks the workers, which start warm and share those pages copy-on-write.
+Workers are recycled gracefully after ``max_requests`` (plus jitter, so
+they do not all restart at once): a recycled worker finishes its
+in-flight requests within ``graceful_timeout`` while a fresh one takes
+over. ``/healthz/ready`` answers 200 once a worker can serve.
+
+Environment: ``BIND`` (or ``PORT``), ``WEB_CONCURRENCY``, ``GUNICORN_THREADS``,
+``GUNICORN_MAX_REQUESTS``, ``GUNICORN_MAX_REQUESTS_JITTER``,
+``GUNICORN_TIMEOUT``, ``GUNICORN_GRACEFUL_TIMEOUT``. For Prometheus
+metrics across workers, also set ``PROMETHEUS_MULTIPROC_DIR`` (see
+app_metrics).
+"""
+
+import multiprocessing
+import os
+
+# Build and warm up the AI components in the master before forking
+os.environ.setdefault('AI_WARMUP', 'sync')
+
+bind = os.environ.get('BIND', f"0.0.0.0:{os.environ.get('PORT', '5001')}")
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+preload_app = True
+
+# Graceful worker recycling
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+# CV analysis of a large upload can take a while
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+
+accesslog = '-'
+
+
+def when_ready(server):
+    from ai_modules import warmup
+    state = warmup.readiness()
+    server.log.info("AI warm-up %s in %s ms", state['status'], state['total_ms'])
+    for name, entry in state['components'].items():
+        if entry['status'] != 'ready':
+            server.log.warning("AI component %s failed to warm up: %s", name, entry.get('error'))
+
+
+def post_fork(server, worker):
+    # Pooled connections inherited from the master must not be used by the worker
+    from app import app
+    from extensions import db
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    import app_metrics
+    app_metrics.mark_process_dead(worker.pid)
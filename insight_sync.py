@@ -0,0 +1,107 @@
+"""
+Insight Sync
+Memoized AI insight generation keyed by an input fingerprint
+
+``InsightsGenerator.generate_all_insights`` is a pure function of the
+``user_data`` it receives. The SHA-256 of the canonical JSON form of that
+input (minus per-call timestamps and timings) is stored on the user
+(``User.insights_fingerprint``). A repeat call with an unchanged
+fingerprint returns the stored ``AIInsight`` rows and neither recomputes
+nor rewrites them.
+
+Changed input is persisted differentially. Each insight is keyed by
+(user, insight_type, content_key), where content_key is a hash of the type
+and title. One INSERT ... ON CONFLICT statement writes all insights and
+only touches rows whose content hash changed. ``is_read`` and
+``is_dismissed`` are never overwritten. Expired insights, and with
+``replace`` insights that are no longer generated, are removed by a single
+DELETE.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+
+from sqlalchemy import or_
+
+from extensions import db, upsert_statement
+from models import User, AIInsight
+from ai_modules import registry as ai_registry
+from ai_modules.fingerprint import fingerprint
+
+
+def content_key(insight):
+    """Stable identity of an insight across runs"""
+    return hashlib.sha1(f"{insight['type']}\n{insight['title']}".encode('utf-8')).hexdigest()
+
+
+def insight_values(user_id, insight):
+    """InsightsGenerator dict -> AIInsight column values"""
+    values = {
+        'user_id': user_id,
+        'insight_type': insight['type'],
+        'title': insight['title'],
+        'content': insight['content'],
+        'confidence_score': insight.get('confidence', 0),
+        'priority_level': insight.get('priority', 3),
+        'action_required': insight.get('action_required', False),
+        'action_text': insight.get('action_text', ''),
+        'related_skills': json.dumps(insight.get('related_skills', [])),
+        'content_key': content_key(insight)
+    }
+    hashed = json.dumps(values, sort_keys=True, default=str)
+    values['content_hash'] = hashlib.sha256(hashed.encode('utf-8')).hexdigest()
+    return values
+
+
+def stored_insights(user_id):
+    # populate_existing: rows may have been changed by the bulk upsert in this session
+    return AIInsight.query.filter_by(user_id=user_id).populate_existing().all()
+
+
+def upsert_insights(user_id, insights, replace=True):
+    """Bulk upsert changed insights and delete expired/removed ones (caller commits)"""
+    now = datetime.utcnow()
+    rows = {}
+    for insight in insights:
+        values = insight_values(user_id, insight)
+        # Keep the first (highest priority) insight per key
+        rows.setdefault((values['insight_type'], values['content_key']), dict(values, created_at=now))
+
+    if rows:
+        table = AIInsight.__table__
+        stmt = upsert_statement(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'insight_type', 'content_key'],
+            set_={
+                column: stmt.excluded[column]
+                for column in next(iter(rows.values()))
+                if column not in ('user_id', 'insight_type', 'content_key', 'created_at')
+            },
+            where=table.c.content_hash.is_distinct_from(stmt.excluded.content_hash)
+        )
+        db.session.execute(stmt, list(rows.values()))
+
+    stale = AIInsight.expires_at < now
+    if replace:
+        current_keys = [key for _, key in rows]
+        stale = or_(stale, AIInsight.content_key.is_(None), AIInsight.content_key.notin_(current_keys))
+    AIInsight.query.filter(AIInsight.user_id == user_id, stale).delete(synchronize_session=False)
+
+
+def generate_insights(user_id, user_data, replace=True):
+    """Generate and persist insights unless the input is unchanged (caller commits)
+
+    Returns (insights, cached). With ``replace`` insights that are no longer
+    generated are removed; otherwise they are kept.
+    """
+    user = db.session.get(User, user_id)
+    input_fingerprint = fingerprint(user_data)
+    if user.insights_fingerprint == input_fingerprint:
+        return stored_insights(user_id), True
+
+    insights = ai_registry.get_insights_generator().generate_all_insights(user_data)
+    upsert_insights(user_id, insights, replace=replace)
+    user.insights_fingerprint = input_fingerprint
+
+    return stored_insights(user_id), False
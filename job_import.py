@@ -0,0 +1,345 @@
+"""
+Job Import
+Bulk import of job applications from CSV or XLSX files
+
+Rows are streamed from the file (``csv`` module, openpyxl in read-only
+mode), so memory does not grow with the file. Headers are matched to
+JobApplication fields through ``COLUMN_ALIASES``; these include the
+headers of the Excel export, so an exported file can be imported again.
+Status names are resolved through one lookup of the Status table.
+
+Every row is validated. Invalid rows are skipped and reported with their
+line number. Valid rows are inserted in batches, one executemany and
+commit per batch, with the requirement columns the ``before_insert`` hook
+would fill (Core inserts skip ORM events). With ``dry_run`` nothing is
+written and the report includes a preview of the first valid rows.
+
+    python job_import.py lamaran.xlsx --username alfarizi --dry-run
+"""
+
+import argparse
+import csv
+import io
+import os
+import re
+import sys
+import time
+from datetime import date, datetime
+from importlib.util import find_spec
+
+from extensions import db
+from models import JOB_MATCH_FIELDS, JobApplication, Status, job_requirement_values
+
+# XLSX reading (openpyxl is imported on first use)
+OPENPYXL_AVAILABLE = find_spec('openpyxl') is not None
+
+FORMATS = ('csv', 'xlsx')
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_ERRORS = 1000
+PREVIEW_SIZE = 20
+CSV_SAMPLE_SIZE = 64 * 1024
+# Distinct job texts whose derived requirements are kept during one import
+REQUIREMENTS_CACHE_SIZE = 2048
+# Used when a row has no status (the first status of seed_status.py)
+DEFAULT_STATUS = 'Terdaftar'
+
+# field: normalized header names (see normalize_header)
+COLUMN_ALIASES = {
+    'company_name': ('company_name', 'company', 'perusahaan', 'nama_perusahaan'),
+    'position': ('position', 'posisi', 'jabatan'),
+    'location': ('location', 'lokasi', 'kota'),
+    'address': ('address', 'alamat'),
+    'status': ('status',),
+    'applied_date': ('applied_date', 'tanggal_apply', 'tanggal_lamar', 'tanggal'),
+    'last_status_update': ('last_status_update', 'terakhir_diupdate'),
+    'source_info': ('source_info', 'source', 'sumber', 'sumber_info'),
+    'application_proof': ('application_proof', 'bukti_lamaran', 'bukti_lamaran_link', 'link'),
+    'notes': ('notes', 'catatan', 'keterangan')
+}
+HEADER_FIELDS = {alias: field for field, aliases in COLUMN_ALIASES.items() for alias in aliases}
+REQUIRED_FIELDS = ('company_name',)
+DATE_FIELDS = ('applied_date', 'last_status_update')
+DATE_FORMATS = ('%d/%m/%Y %H:%M', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d', '%d-%m-%Y')
+
+# String column lengths, checked before the insert
+MAX_LENGTHS = {
+    column.name: column.type.length
+    for column in JobApplication.__table__.columns
+    if getattr(column.type, 'length', None)
+}
+
+
+def normalize_header(header):
+    return re.sub(r'[^a-z0-9]+', '_', str(header or '').strip().lower()).strip('_')
+
+
+def file_format(filename):
+    """'csv' or 'xlsx' from the file name; ValueError for anything else"""
+    extension = os.path.splitext(filename or '')[1].lstrip('.').lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Format file tidak didukung: .{extension or '?'} (gunakan CSV atau XLSX)")
+    if extension == 'xlsx' and not OPENPYXL_AVAILABLE:
+        raise ValueError('Import XLSX membutuhkan openpyxl')
+    return extension
+
+
+def _csv_encoding(sample):
+    """UTF-8 (with or without BOM), else the Windows code page older Excel versions write"""
+    try:
+        sample.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A character cut at the end of the sample is still UTF-8
+        if e.start < len(sample) - 3:
+            return 'cp1252'
+    return 'utf-8-sig'
+
+
+def _csv_rows(stream):
+    sample = stream.read(CSV_SAMPLE_SIZE)
+    stream.seek(0)
+    text = io.TextIOWrapper(stream, encoding=_csv_encoding(sample), newline='')
+    try:
+        # Spreadsheets in Indonesian locales write ';' separated CSV
+        dialect = csv.Sniffer().sniff(text.read(CSV_SAMPLE_SIZE), delimiters=',;\t')
+    except (csv.Error, UnicodeDecodeError):
+        dialect = csv.excel
+    text.seek(0)
+    try:
+        yield from csv.reader(text, dialect)
+    finally:
+        text.detach()
+
+
+def _xlsx_rows(stream):
+    from openpyxl import load_workbook
+
+    try:
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+    except Exception as e:
+        raise ValueError(f'File XLSX tidak valid: {e}')
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _data_rows(rows, fields):
+    for line, row in enumerate(rows, start=2):
+        if any(value not in (None, '') for value in row):
+            yield line, {field: value for field, value in zip(fields, row) if field is not None}
+
+
+def read_rows(stream, filename):
+    """Open a CSV/XLSX table whose first row is the header
+
+    Returns the ignored (unknown) column names and an iterator of
+    (line number, {field: raw value}) for the non-empty data rows.
+    """
+    rows = _xlsx_rows(stream) if file_format(filename) == 'xlsx' else _csv_rows(stream)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError('File kosong')
+
+    fields = [HEADER_FIELDS.get(normalize_header(name)) for name in header]
+    missing = [field for field in REQUIRED_FIELDS if field not in fields]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+    ignored = [str(name) for name, field in zip(header, fields) if field is None and name not in (None, '')]
+    return ignored, _data_rows(rows, fields)
+
+
+def _text(value):
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = str(value).strip()
+    # The export writes '-' for empty cells
+    return None if value in ('', '-') else value
+
+
+def _datetime(value):
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            pass
+    raise ValueError(value)
+
+
+class JobImporter:
+    """Validate and insert rows for one user; ``run`` returns the report dict"""
+
+    def __init__(self, user_id, dry_run=False, batch_size=DEFAULT_BATCH_SIZE, max_errors=DEFAULT_MAX_ERRORS):
+        self.user_id = user_id
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.now = datetime.now()
+        self.report = {
+            'dry_run': dry_run, 'rows': 0, 'valid': 0, 'imported': 0, 'invalid': 0,
+            'errors': [], 'errors_truncated': False, 'error': None, 'ignored_columns': [], 'preview': []
+        }
+        self._statuses = None
+        self._requirements = {}
+        self._batch = []
+
+    def _status_id(self, name):
+        if self._statuses is None:
+            self._statuses = {status_name.lower(): status_id for status_id, status_name in
+                              db.session.query(Status.id, Status.name)}
+        return self._statuses.get((name or DEFAULT_STATUS).lower())
+
+    def _job_requirements(self, values):
+        """Columns the before_insert hook would fill, cached per distinct job text"""
+        key = tuple(values[field] for field in JOB_MATCH_FIELDS)
+        if key not in self._requirements:
+            if len(self._requirements) >= REQUIREMENTS_CACHE_SIZE:
+                self._requirements.clear()
+            self._requirements[key] = job_requirement_values(dict(zip(JOB_MATCH_FIELDS, key)))
+        return self._requirements[key]
+
+    def validate(self, raw):
+        """Raw row -> (JobApplication column values or None, error messages)"""
+        errors = []
+        values = {field: _text(raw.get(field)) for field in COLUMN_ALIASES if field not in DATE_FIELDS}
+
+        for field in REQUIRED_FIELDS:
+            if not values[field]:
+                errors.append(f'{field} wajib diisi')
+        for field, value in values.items():
+            limit = MAX_LENGTHS.get(field)
+            if value and limit and len(value) > limit:
+                errors.append(f'{field} lebih dari {limit} karakter')
+
+        status_name = values.pop('status')
+        status_id = self._status_id(status_name)
+        if status_id is None:
+            errors.append(f'Status tidak dikenal: {status_name or DEFAULT_STATUS}')
+
+        for field in DATE_FIELDS:
+            value = raw.get(field)
+            if isinstance(value, str):
+                value = _text(value)
+            try:
+                values[field] = _datetime(value) if value is not None else None
+            except (TypeError, ValueError):
+                errors.append(f'{field} bukan tanggal yang valid: {value}')
+
+        if errors:
+            return None, errors
+
+        # Same defaults as add_job
+        values['applied_date'] = values['applied_date'] or self.now
+        values['last_status_update'] = values['last_status_update'] or values['applied_date']
+        values.update(status_id=status_id, user_id=self.user_id, match_version=1)
+        values.update(self._job_requirements(values))
+        return values, []
+
+    def _record_error(self, line, errors):
+        self.report['invalid'] += 1
+        if len(self.report['errors']) < self.max_errors:
+            self.report['errors'].append({'row': line, 'errors': errors})
+        else:
+            self.report['errors_truncated'] = True
+
+    def _preview(self, values, status_name):
+        if len(self.report['preview']) < PREVIEW_SIZE:
+            row = {
+                field: value.isoformat() if isinstance(value, datetime) else value
+                for field, value in values.items()
+                if field in COLUMN_ALIASES
+            }
+            row['status'] = status_name
+            self.report['preview'].append(row)
+
+    def _flush(self):
+        if self._batch and not self.dry_run:
+            db.session.execute(JobApplication.__table__.insert(), self._batch)
+            db.session.commit()
+            self.report['imported'] += len(self._batch)
+        self._batch = []
+
+    def run(self, rows):
+        """Import (line, raw values) pairs, e.g. from ``read_rows``"""
+        try:
+            for line, raw in rows:
+                self.report['rows'] += 1
+                values, errors = self.validate(raw)
+                if errors:
+                    self._record_error(line, errors)
+                    continue
+                self.report['valid'] += 1
+                self._preview(values, _text(raw.get('status')) or DEFAULT_STATUS)
+                self._batch.append(values)
+                if len(self._batch) >= self.batch_size:
+                    self._flush()
+        except (csv.Error, ValueError) as e:
+            # Unreadable rest of the file: earlier batches stay imported
+            self.report['error'] = f"File tidak bisa dibaca setelah {self.report['rows']} baris data: {e}"
+
+        self._flush()
+        return self.report
+
+
+def import_file(stream, filename, user_id, **options):
+    """Import a CSV/XLSX binary stream for a user (current app context); returns the report"""
+    ignored, rows = read_rows(stream, filename)
+    importer = JobImporter(user_id, **options)
+    importer.report['ignored_columns'] = ignored
+    return importer.run(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import lamaran kerja dari file CSV atau XLSX')
+    parser.add_argument('path')
+    parser.add_argument('--username', required=True, help='owner of the imported applications')
+    parser.add_argument('--dry-run', action='store_true', help='validate and preview only')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--max-errors', type=int, default=DEFAULT_MAX_ERRORS, help='row errors to list')
+    args = parser.parse_args()
+
+    from app import app
+    from models import User
+    import job_match_sync
+
+    # Every bulk INSERT would be reported as a slow query
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = None
+    with app.app_context():
+        user = User.query.filter_by(username=args.username).first()
+        if user is None:
+            print(f"❌ User tidak ditemukan: {args.username}")
+            sys.exit(1)
+
+        start = time.perf_counter()
+        try:
+            with open(args.path, 'rb') as f:
+                report = import_file(f, args.path, user.id, dry_run=args.dry_run,
+                                     batch_size=args.batch_size, max_errors=args.max_errors)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        elapsed = time.perf_counter() - start
+
+        if report['imported']:
+            job_match_sync.recompute_stale_matches(user.id, app.config['JOB_MATCH_BATCH_SIZE'])
+
+    mode = 'Dry run' if args.dry_run else 'Import'
+    print(f"✅ {mode}: {report['rows']} baris dalam {elapsed:.1f} detik "
+          f"({report['valid']} valid, {report['imported']} diimport, {report['invalid']} error)")
+    if report['ignored_columns']:
+        print(f"ℹ️  Kolom diabaikan: {', '.join(report['ignored_columns'])}")
+    if report['error']:
+        print(f"❌ {report['error']}")
+    for error in report['errors'][:20]:
+        print(f"   - baris {error['row']}: {'; '.join(error['errors'])}")
+    if report['invalid'] > 20:
+        print(f"   ... dan {report['invalid'] - 20} baris error lainnya")
+
+
+if __name__ == '__main__':
+    main()
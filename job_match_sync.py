@@ -0,0 +1,247 @@
+"""
+Job Match Sync
+Incremental, versioned recomputation of JobMatch rows
+
+Every JobMatch records the versions of the inputs it was computed from:
+``CVProfile.version`` and ``JobApplication.match_version``. Both are bumped
+by the dirty-tracking hooks in models.py only when a field used for matching
+changes. A stored match is current when both versions are equal; otherwise
+it is stale.
+
+A CV change therefore makes every match of the user stale, while editing
+a job only invalidates that job. ``recompute_stale_matches`` scores just the
+stale jobs in batches through ``JobMatcher.batch_analyze_jobs``.
+``schedule_recompute`` runs the same pass on a background worker after
+writes. Results are written with ``upsert_match_results``, a single
+INSERT ... ON CONFLICT statement per batch.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+from extensions import db, upsert_statement
+from models import CVProfile, JobApplication, JobMatch
+from ai_modules import registry as ai_registry
+
+DEFAULT_BATCH_SIZE = 200
+# Job ids per IN (...) lookup, below SQLite's host parameter limit
+ID_CHUNK_SIZE = 500
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='job-match-sync')
+_pending_users = set()
+_pending_lock = threading.Lock()
+
+
+def cv_analysis_from_profile(cv_profile):
+    """CVProfile row -> cv_analysis dict expected by JobMatcher"""
+    return {
+        'extracted_skills': json.loads(cv_profile.extracted_skills) if cv_profile.extracted_skills else [],
+        'experience_level': cv_profile.experience_level or '',
+        'contact_info': {'location': cv_profile.location or ''}
+    }
+
+
+def job_data_from_application(job):
+    """JobApplication row -> job dict expected by JobMatcher (with stored requirements)"""
+    return {
+        'id': job.id,
+        'position': job.position or '',
+        'company_name': job.company_name or '',
+        'location': job.location or '',
+        'source_info': job.source_info or '',
+        'notes': job.notes or '',
+        'extracted_skills': json.loads(job.required_skills) if job.required_skills is not None else None,
+        'experience_required': job.experience_required,
+        'job_category': job.job_category
+    }
+
+
+def match_is_current(job_match, cv_profile, job):
+    """True when the stored match was computed from the current CV and job text"""
+    return (
+        job_match is not None and
+        job_match.cv_version == cv_profile.version and
+        job_match.job_version == job.match_version
+    )
+
+
+def match_values(match_result, cv_profile, job):
+    """JobMatcher result (and input versions) -> JobMatch column values"""
+    return {
+        'match_score': match_result['overall_match_score'],
+        'matching_skills': json.dumps(match_result['matching_skills']),
+        'missing_skills': json.dumps(match_result['missing_skills']),
+        'additional_skills': json.dumps(match_result['additional_skills']),
+        'compatibility_factors': json.dumps({
+            'skill_match_score': match_result['skill_match_score'],
+            'experience_match_score': match_result['experience_match_score'],
+            'match_level': match_result['match_level'],
+            'analysis_date': match_result.get('analysis_date'),
+            'job_requirements': match_result['job_requirements'],
+            'recommendations': match_result['recommendations']
+        }),
+        'recommendations': ' '.join(
+            recommendation['description'] for recommendation in match_result['recommendations']
+        ),
+        'location_match_score': match_result['location_match_score'],
+        'cv_version': cv_profile.version,
+        'job_version': job.match_version
+    }
+
+
+def match_result_from_row(job_match):
+    """Stored JobMatch row -> match result dict (same shape as JobMatcher output)"""
+    factors = json.loads(job_match.compatibility_factors) if job_match.compatibility_factors else {}
+    return {
+        'overall_match_score': job_match.match_score,
+        'skill_match_score': factors.get('skill_match_score'),
+        'experience_match_score': factors.get('experience_match_score'),
+        'location_match_score': job_match.location_match_score,
+        'matching_skills': json.loads(job_match.matching_skills or '[]'),
+        'missing_skills': json.loads(job_match.missing_skills or '[]'),
+        'additional_skills': json.loads(job_match.additional_skills or '[]'),
+        'job_requirements': factors.get('job_requirements', {}),
+        'recommendations': factors.get('recommendations', []),
+        # Rows stored before analysis_date was kept fall back to the write time
+        'analysis_date': factors.get('analysis_date') or (
+            job_match.created_at.isoformat() if job_match.created_at else None
+        ),
+        'match_level': factors.get('match_level'),
+        'job_id': job_match.job_id
+    }
+
+
+def stored_matches(user_id, job_ids):
+    """job id -> JobMatch of the user, for ``job_ids`` only"""
+    existing = {}
+    for start in range(0, len(job_ids), ID_CHUNK_SIZE):
+        existing.update(
+            (job_match.job_id, job_match) for job_match in JobMatch.query.filter(
+                JobMatch.user_id == user_id,
+                JobMatch.job_id.in_(job_ids[start:start + ID_CHUNK_SIZE])
+            )
+        )
+    return existing
+
+
+def stale_job_ids(user_id, cv_profile):
+    """Ids of the user's jobs without a current match"""
+    rows = db.session.query(JobApplication.id).outerjoin(
+        JobMatch,
+        and_(JobMatch.job_id == JobApplication.id, JobMatch.user_id == user_id)
+    ).filter(
+        JobApplication.user_id == user_id,
+        or_(
+            JobMatch.id.is_(None),
+            JobMatch.cv_version.is_(None),
+            JobMatch.cv_version != cv_profile.version,
+            JobMatch.job_version != JobApplication.match_version
+        )
+    ).order_by(JobApplication.id).all()
+    return [row.id for row in rows]
+
+
+def upsert_match_results(user_id, cv_profile, jobs, match_results):
+    """Insert or update the JobMatch rows for ``jobs`` in one bulk statement (caller commits)"""
+    if not match_results:
+        return 0
+
+    jobs_by_id = {job.id: job for job in jobs}
+    computed_at = datetime.utcnow()
+    rows = [
+        dict(
+            match_values(match_result, cv_profile, jobs_by_id[match_result['job_id']]),
+            user_id=user_id,
+            job_id=match_result['job_id'],
+            created_at=computed_at
+        )
+        for match_result in match_results
+    ]
+
+    stmt = upsert_statement(JobMatch.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['user_id', 'job_id'],
+        set_={column: stmt.excluded[column] for column in rows[0] if column not in ('user_id', 'job_id')}
+    )
+    db.session.execute(stmt, rows)
+    return len(rows)
+
+
+def match_jobs(user_id, cv_profile, jobs, force=False):
+    """Match results for ``jobs``, highest score first (caller commits)
+
+    Current stored matches are reused unless ``force``; the rest are scored
+    in one ``batch_analyze_jobs`` call and written with one bulk upsert.
+    Returns (results, number of jobs scored).
+    """
+    existing = stored_matches(user_id, [job.id for job in jobs])
+
+    results = []
+    stale_jobs = []
+    for job in jobs:
+        job_match = existing.get(job.id)
+        if not force and match_is_current(job_match, cv_profile, job):
+            results.append(match_result_from_row(job_match))
+        else:
+            stale_jobs.append(job)
+
+    if stale_jobs:
+        match_results = ai_registry.get_job_matcher().batch_analyze_jobs(
+            cv_analysis_from_profile(cv_profile), [job_data_from_application(job) for job in stale_jobs]
+        )
+        upsert_match_results(user_id, cv_profile, stale_jobs, match_results)
+        results.extend(match_results)
+
+    results.sort(key=lambda result: result['overall_match_score'], reverse=True)
+    return results, len(stale_jobs)
+
+
+def recompute_stale_matches(user_id, batch_size=DEFAULT_BATCH_SIZE):
+    """Recompute the stale matches of a user in batches; returns the number recomputed"""
+    cv_profile = CVProfile.query.filter_by(user_id=user_id).first()
+    if not cv_profile:
+        return 0
+
+    cv_analysis = cv_analysis_from_profile(cv_profile)
+    job_matcher = ai_registry.get_job_matcher()
+    job_ids = stale_job_ids(user_id, cv_profile)
+
+    recomputed = 0
+    for start in range(0, len(job_ids), batch_size):
+        jobs = JobApplication.query.filter(JobApplication.id.in_(job_ids[start:start + batch_size])).all()
+        match_results = job_matcher.batch_analyze_jobs(
+            cv_analysis, [job_data_from_application(job) for job in jobs]
+        )
+        recomputed += upsert_match_results(user_id, cv_profile, jobs, match_results)
+        db.session.commit()
+
+    return recomputed
+
+
+def _run_recompute(app, user_id):
+    with _pending_lock:
+        _pending_users.discard(user_id)
+    with app.app_context():
+        try:
+            recompute_stale_matches(user_id, app.config.get('JOB_MATCH_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+        except Exception as e:
+            db.session.rollback()
+            print(f"Job Match Sync Error (user {user_id}): {str(e)}")
+        finally:
+            db.session.remove()
+
+
+def schedule_recompute(app, user_id):
+    """Queue a background recompute pass for a user (coalesced while pending)"""
+    if not app.config.get('JOB_MATCH_BACKGROUND', True):
+        return recompute_stale_matches(user_id, app.config.get('JOB_MATCH_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+
+    with _pending_lock:
+        if user_id in _pending_users:
+            return None
+        _pending_users.add(user_id)
+    return _executor.submit(_run_recompute, app, user_id)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Migration script untuk penyimpanan upload berbasis hash (content-addressed)
+Script ini akan:
+1. Membuat tabel upload_blob untuk reference counting
+2. Mengganti nama setiap file di folder upload bukti dan CV menjadi <sha256>.<ext>;
+   file dengan isi yang sama disimpan sekali saja (termasuk varian WebP bukti)
+3. Mengupdate job_application.image_proof dan cv_profile.cv_file_path
+4. Menghitung ulang jumlah referensi setiap file dari data tersebut
+File baru lebih dulu dibuat sebagai hard link (atau salinan); file lama baru
+dihapus setelah database berhasil di-commit.
+"""
+
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+
+import proof_images
+from upload_storage import blob_filename, digest_of, file_digest
+
+# (kind, table, column, default folder)
+REFERENCES = [
+    ('proof', 'job_application', 'image_proof', 'static/uploads/proofs'),
+    ('cv', 'cv_profile', 'cv_file_path', 'static/uploads/cv'),
+]
+
+
+def _link(source, target):
+    """Make ``target`` a second name of ``source`` (copy across filesystems)"""
+    if os.path.exists(target):
+        return
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def plan_folder(folder):
+    """old filename -> content-addressed filename for every file in ``folder``"""
+    renames = {}
+    if not os.path.isdir(folder):
+        return renames
+    for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+        name = entry.name
+        extension = os.path.splitext(name)[1].lstrip('.')
+        if not entry.is_file() or name.endswith('.tmp') or not extension or digest_of(name):
+            continue
+        renames[name] = blob_filename(file_digest(entry.path), extension)
+    return renames
+
+
+def link_files(kind, folder, renames):
+    """Create the new names; returns the old paths to delete after the commit"""
+    obsolete = []
+    for old, new in renames.items():
+        _link(os.path.join(folder, old), os.path.join(folder, new))
+        obsolete.append(os.path.join(folder, old))
+        if kind == 'proof':
+            derived = zip(proof_images.variant_files(folder, old), proof_images.variant_files(folder, new))
+            for old_variant, new_variant in derived:
+                if os.path.exists(old_variant):
+                    _link(old_variant, new_variant)
+                    obsolete.append(old_variant)
+    return obsolete
+
+
+def migrate_database(db_path='instance/database.db', folders=None):
+    """Migrate database dan folder upload ke penyimpanan berbasis hash"""
+
+    folders = folders or {}
+
+    if not os.path.exists(db_path):
+        print(f"Database tidak ditemukan di: {db_path}")
+        return False
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("🗄️  Menghubungkan ke database...")
+        print("📝 Membuat tabel upload_blob...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS upload_blob (
+                id INTEGER PRIMARY KEY,
+                kind VARCHAR(20) NOT NULL,
+                filename VARCHAR(255) NOT NULL,
+                size INTEGER,
+                ref_count INTEGER NOT NULL,
+                created_at DATETIME
+            )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_upload_blob_kind_filename
+            ON upload_blob (kind, filename)
+        """)
+
+        obsolete = []
+        now = datetime.utcnow().isoformat(sep=' ')
+        for kind, table, column, default_folder in REFERENCES:
+            folder = folders.get(kind, default_folder)
+            renames = plan_folder(folder)
+            unique = len(set(renames.values()))
+            print(f"🔄 {folder}: {len(renames)} file, {len(renames) - unique} duplikat")
+
+            obsolete.extend(link_files(kind, folder, renames))
+            cursor.executemany(
+                f"UPDATE {table} SET {column} = ? WHERE {column} = ?",
+                [(new, old) for old, new in renames.items()]
+            )
+
+            # Reference counts follow the rows that point to each blob
+            cursor.execute("DELETE FROM upload_blob WHERE kind = ?", (kind,))
+            cursor.execute(f"""
+                SELECT {column}, COUNT(*) FROM {table}
+                WHERE {column} IS NOT NULL AND {column} != ''
+                GROUP BY {column}
+            """)
+            blobs = []
+            for filename, count in cursor.fetchall():
+                path = os.path.join(folder, filename)
+                if digest_of(filename) and os.path.exists(path):
+                    blobs.append((kind, filename, os.path.getsize(path), count, now))
+            cursor.executemany("""
+                INSERT INTO upload_blob (kind, filename, size, ref_count, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, blobs)
+            print(f"✅ {len(blobs)} file {kind} direferensikan")
+
+        conn.commit()
+
+        for path in obsolete:
+            os.remove(path)
+        print(f"🧹 {len(obsolete)} file lama dihapus")
+        print("🎉 Migration berhasil diselesaikan!")
+        return True
+
+    except (sqlite3.Error, OSError) as e:
+        print(f"❌ Error saat migrasi: {e}")
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Migration: Content-Addressed Uploads")
+    print("=" * 60)
+
+    if migrate_database():
+        print("\n✅ Migration completed successfully!")
+    else:
+        print("\n❌ Migration failed!")
+
+    print("=" * 60)
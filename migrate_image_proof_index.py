@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Migration script untuk index job_application.image_proof
+Route /uploads/proofs/ mencari job pemilik screenshot berdasarkan nama file
+setiap kali gambar diminta; tanpa index query tersebut men-scan seluruh tabel.
+"""
+
+import sqlite3
+import os
+
+
+def migrate_database():
+    """Migrate database untuk index image_proof"""
+
+    db_path = 'instance/database.db'
+
+    if not os.path.exists(db_path):
+        print(f"Database tidak ditemukan di: {db_path}")
+        return False
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("🗄️  Menghubungkan ke database...")
+        print("📝 Menambahkan index image_proof...")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_job_application_image_proof
+            ON job_application (image_proof)
+        """)
+
+        conn.commit()
+        print("🎉 Migration berhasil diselesaikan!")
+        return True
+
+    except sqlite3.Error as e:
+        print(f"❌ Error saat migrasi database: {e}")
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Migration: Image Proof Index")
+    print("=" * 60)
+
+    if migrate_database():
+        print("\n✅ Migration completed successfully!")
+    else:
+        print("\n❌ Migration failed!")
+
+    print("=" * 60)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Migration script untuk menambahkan field insights_fingerprint ke tabel user
+Dipakai insight_sync untuk melewati generate insight jika input tidak berubah.
+"""
+
+import sqlite3
+import os
+
+
+def migrate_database():
+    """Migrate database untuk menambahkan field insights_fingerprint"""
+
+    db_path = 'instance/database.db'
+
+    if not os.path.exists(db_path):
+        print(f"Database tidak ditemukan di: {db_path}")
+        return False
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("PRAGMA table_info(user)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        if 'insights_fingerprint' in columns:
+            print("✅ Field insights_fingerprint sudah ada di database")
+            return True
+
+        print("📝 Menambahkan field insights_fingerprint ke tabel user...")
+        cursor.execute("ALTER TABLE user ADD COLUMN insights_fingerprint VARCHAR(64)")
+
+        conn.commit()
+        print("🎉 Migration berhasil diselesaikan!")
+        return True
+
+    except sqlite3.Error as e:
+        print(f"❌ Error saat migrasi database: {e}")
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Migration: Insight Fingerprint")
+    print("=" * 60)
+
+    if migrate_database():
+        print("\n✅ Migration completed successfully!")
+    else:
+        print("\n❌ Migration failed!")
+
+    print("=" * 60)
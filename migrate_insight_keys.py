@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Migration script untuk persistence insight yang differential
+Script ini akan:
+1. Menambahkan field content_key dan content_hash ke tabel ai_insight
+2. Mengisi content_key untuk data existing (hash dari insight_type + title)
+3. Menghapus duplikat dan menambahkan unique index (user_id, insight_type, content_key)
+content_hash dibiarkan kosong sehingga generate berikutnya menulis ulang isi insight
+tanpa mengubah status is_read/is_dismissed.
+"""
+
+import hashlib
+import sqlite3
+import os
+
+
+def migrate_database():
+    """Migrate database untuk key insight yang stabil"""
+
+    db_path = 'instance/database.db'
+
+    if not os.path.exists(db_path):
+        print(f"Database tidak ditemukan di: {db_path}")
+        return False
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("PRAGMA table_info(ai_insight)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        for column, definition in [('content_key', 'VARCHAR(40)'), ('content_hash', 'VARCHAR(64)')]:
+            if column in columns:
+                print(f"✅ Field {column} sudah ada")
+                continue
+            print(f"📝 Menambahkan field {column}...")
+            cursor.execute(f"ALTER TABLE ai_insight ADD COLUMN {column} {definition}")
+
+        print("🔄 Mengisi content_key untuk data existing...")
+        cursor.execute("SELECT id, insight_type, title FROM ai_insight WHERE content_key IS NULL")
+        updates = [
+            (hashlib.sha1(f"{insight_type}\n{title}".encode('utf-8')).hexdigest(), insight_id)
+            for insight_id, insight_type, title in cursor.fetchall()
+        ]
+        cursor.executemany("UPDATE ai_insight SET content_key = ? WHERE id = ?", updates)
+        print(f"✅ {len(updates)} records diupdate")
+
+        # Keep the most recent row per key (duplicates came from repeated CV uploads)
+        cursor.execute("""
+            DELETE FROM ai_insight
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM ai_insight GROUP BY user_id, insight_type, content_key
+            )
+        """)
+        print(f"✅ {cursor.rowcount} duplikat dihapus")
+
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_ai_insight_user_key
+            ON ai_insight (user_id, insight_type, content_key)
+        """)
+
+        conn.commit()
+        print("🎉 Migration berhasil diselesaikan!")
+        return True
+
+    except sqlite3.Error as e:
+        print(f"❌ Error saat migrasi database: {e}")
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Migration: Insight Keys")
+    print("=" * 60)
+
+    if migrate_database():
+        print("\n✅ Migration completed successfully!")
+    else:
+        print("\n❌ Migration failed!")
+
+    print("=" * 60)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Migration script untuk versioning job match (incremental recompute)
+Script ini akan:
+1. Menambahkan field match_version ke job_application dan version ke cv_profile
+2. Menambahkan field cv_version dan job_version ke job_match
+3. Menghapus duplikat job_match (user_id, job_id) dan menambahkan unique index
+Match lama tidak punya versi sehingga dianggap stale dan dihitung ulang otomatis.
+"""
+
+import sqlite3
+import os
+
+NEW_COLUMNS = [
+    ('job_application', 'match_version', 'INTEGER NOT NULL DEFAULT 1'),
+    ('cv_profile', 'version', 'INTEGER NOT NULL DEFAULT 1'),
+    ('job_match', 'cv_version', 'INTEGER'),
+    ('job_match', 'job_version', 'INTEGER'),
+]
+
+
+def migrate_database():
+    """Migrate database untuk versioning job match"""
+
+    db_path = 'instance/database.db'
+
+    if not os.path.exists(db_path):
+        print(f"Database tidak ditemukan di: {db_path}")
+        return False
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("🗄️  Menghubungkan ke database...")
+
+        for table, column, definition in NEW_COLUMNS:
+            cursor.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in cursor.fetchall()]
+
+            if column in columns:
+                print(f"✅ Field {table}.{column} sudah ada")
+                continue
+
+            print(f"📝 Menambahkan field {table}.{column}...")
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+        print("🔄 Menghapus duplikat job_match...")
+        cursor.execute("""
+            DELETE FROM job_match
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM job_match GROUP BY user_id, job_id
+            )
+        """)
+        print(f"✅ {cursor.rowcount} duplikat dihapus")
+
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_job_match_user_job
+            ON job_match (user_id, job_id)
+        """)
+
+        conn.commit()
+        print("🎉 Migration berhasil diselesaikan!")
+        return True
+
+    except sqlite3.Error as e:
+        print(f"❌ Error saat migrasi database: {e}")
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Migration: Job Match Versioning")
+    print("=" * 60)
+
+    if migrate_database():
+        print("\n✅ Migration completed successfully!")
+    else:
+        print("\n❌ Migration failed!")
+
+    print("=" * 60)
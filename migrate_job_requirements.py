@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Migration script untuk menyimpan job requirements di tabel job_application
+Script ini akan:
+1. Menambahkan field required_skills, experience_required dan job_category
+2. Menambahkan index untuk experience_required dan job_category
+3. Mengisi field tersebut untuk data existing memakai JobMatcher
+Job baru/yang diedit diisi otomatis oleh hook di models.py.
+"""
+
+import json
+import sqlite3
+import os
+
+from ai_modules.job_matcher import JobMatcher
+
+NEW_COLUMNS = [
+    ('required_skills', 'TEXT'),
+    ('experience_required', 'VARCHAR(20)'),
+    ('job_category', 'VARCHAR(50)'),
+]
+
+
+def migrate_database():
+    """Migrate database untuk job requirements yang diprecompute"""
+
+    db_path = 'instance/database.db'
+
+    if not os.path.exists(db_path):
+        print(f"Database tidak ditemukan di: {db_path}")
+        return False
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("🗄️  Menghubungkan ke database...")
+
+        cursor.execute("PRAGMA table_info(job_application)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        for column, definition in NEW_COLUMNS:
+            if column in columns:
+                print(f"✅ Field {column} sudah ada")
+                continue
+            print(f"📝 Menambahkan field {column}...")
+            cursor.execute(f"ALTER TABLE job_application ADD COLUMN {column} {definition}")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_job_application_experience_required
+            ON job_application (experience_required)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_job_application_job_category
+            ON job_application (job_category)
+        """)
+
+        print("🔄 Mengekstrak requirements untuk data existing...")
+        cursor.execute("""
+            SELECT id, position, company_name, location, source_info, notes
+            FROM job_application
+            WHERE required_skills IS NULL
+        """)
+        rows = cursor.fetchall()
+
+        job_matcher = JobMatcher()
+        updates = []
+        for job_id, position, company_name, location, source_info, notes in rows:
+            requirements = job_matcher.derive_job_requirements({
+                'position': position,
+                'company_name': company_name,
+                'location': location,
+                'source_info': source_info,
+                'notes': notes
+            })
+            updates.append((
+                json.dumps(sorted(requirements['extracted_skills'])),
+                requirements['experience_required'],
+                requirements['job_category'],
+                job_id
+            ))
+
+        cursor.executemany("""
+            UPDATE job_application
+            SET required_skills = ?, experience_required = ?, job_category = ?
+            WHERE id = ?
+        """, updates)
+
+        conn.commit()
+        print(f"✅ Berhasil mengupdate {len(updates)} records")
+        print("🎉 Migration berhasil diselesaikan!")
+        return True
+
+    except sqlite3.Error as e:
+        print(f"❌ Error saat migrasi database: {e}")
+        return False
+
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Migration: Job Requirements")
+    print("=" * 60)
+
+    if migrate_database():
+        print("\n✅ Migration completed successfully!")
+    else:
+        print("\n❌ Migration failed!")
+
+    print("=" * 60)
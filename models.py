@@ -2,14 +2,21 @@
 
 
 
+import json
 from flask_login import UserMixin
+from sqlalchemy import event, inspect
 from extensions import db
 from datetime import datetime as dt
 
+# Fields whose changes invalidate stored job matches (see job_match_sync)
+JOB_MATCH_FIELDS = ('position', 'company_name', 'location', 'source_info', 'notes')
+CV_MATCH_FIELDS = ('extracted_skills', 'experience_level', 'location')
+
 class User(db.Model, UserMixin):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(50), unique=True, nullable=False)
     password = db.Column(db.String(255), nullable=False)
+    insights_fingerprint = db.Column(db.String(64), nullable=True)  # Hash input insight terakhir (lihat insight_sync)
 
     jobs = db.relationship(
         'JobApplication',
@@ -43,12 +50,18 @@ class JobApplication(db.Model):
     address = db.Column(db.String(200))
 
     application_proof = db.Column(db.Text, nullable=True)  # NEW: Link atau path screenshot
-    image_proof = db.Column(db.String(255), nullable=True)  # NEW: Path to uploaded image
+    image_proof = db.Column(db.String(255), nullable=True, index=True)  # NEW: Path to uploaded image
     source_info = db.Column(db.String(100), nullable=True)  # NEW: Asal info loker
     logo_url = db.Column(db.String(255), nullable=True)  # NEW: URL logo perusahaan
     notes = db.Column(db.Text, nullable=True)  # NEW: Keterangan tambahan
     applied_date = db.Column(db.DateTime)
     last_status_update = db.Column(db.DateTime, nullable=True)  # NEW: Tanggal terakhir update status
+    match_version = db.Column(db.Integer, nullable=False, default=1)  # Naik setiap teks yang dipakai job matching berubah
+
+    # Job requirements diekstrak saat job dibuat/diedit (dipakai JobMatcher tanpa parsing ulang)
+    required_skills = db.Column(db.Text, nullable=True)  # JSON array of skills
+    experience_required = db.Column(db.String(20), nullable=True, index=True)  # junior, mid, senior
+    job_category = db.Column(db.String(50), nullable=True, index=True)
 
     status_id = db.Column(db.Integer, db.ForeignKey('status.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
@@ -94,6 +107,7 @@ class CVProfile(db.Model):
     # Analysis metadata
     ats_score = db.Column(db.Float)  # ATS compatibility score (0-100)
     completeness_score = db.Column(db.Float)  # CV completeness (0-100)
+    version = db.Column(db.Integer, nullable=False, default=1)  # Bumped when matching inputs change
     last_updated = db.Column(db.DateTime, default=dt.utcnow, onupdate=dt.utcnow)
     
     created_at = db.Column(db.DateTime, default=dt.utcnow)
@@ -120,11 +134,19 @@ class JobMatch(db.Model):
     salary_match_score = db.Column(db.Float)  # 0-100
     location_match_score = db.Column(db.Float)  # 0-100
     
+    # Versions of the inputs this match was computed from
+    cv_version = db.Column(db.Integer)  # CVProfile.version
+    job_version = db.Column(db.Integer)  # JobApplication.match_version
+    
     created_at = db.Column(db.DateTime, default=dt.utcnow)
     
     # Relationships
     user = db.relationship('User', backref='job_matches')
     job = db.relationship('JobApplication', backref='job_matches')
+    
+    __table_args__ = (
+        db.Index('ix_job_match_user_job', 'user_id', 'job_id', unique=True),
+    )
 
 
 class AIInsight(db.Model):
@@ -148,11 +170,19 @@ class AIInsight(db.Model):
     action_text = db.Column(db.String(500))
     related_skills = db.Column(db.Text)  # JSON array of relevant skills
     
+    # Differential persistence (see insight_sync)
+    content_key = db.Column(db.String(40))  # Stable key: hash of type + title
+    content_hash = db.Column(db.String(64))  # Hash of the generated content
+    
     created_at = db.Column(db.DateTime, default=dt.utcnow)
     expires_at = db.Column(db.DateTime, nullable=True)
     
     # Relationships
     user = db.relationship('User', backref='ai_insights')
+    
+    __table_args__ = (
+        db.Index('ix_ai_insight_user_key', 'user_id', 'insight_type', 'content_key', unique=True),
+    )
 
 
 class SkillGap(db.Model):
@@ -212,5 +242,57 @@ class CareerTrajectory(db.Model):
 
 
 
+class UploadBlob(db.Model):
+    """Content-addressed upload file and the number of rows referencing it (see upload_storage)"""
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(20), nullable=False)  # proof, cv
+    filename = db.Column(db.String(255), nullable=False)  # <sha256>.<ext>
+    size = db.Column(db.Integer)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=dt.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_upload_blob_kind_filename', 'kind', 'filename', unique=True),
+    )
+
+# Dirty tracking for incremental job matching
+def _matching_inputs_changed(target, fields):
+    state = inspect(target)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def job_requirement_values(job_fields):
+    """Stored requirement columns for a job (``JOB_MATCH_FIELDS`` values)"""
+    from ai_modules import registry
+
+    requirements = registry.get_job_matcher().derive_job_requirements(job_fields)
+    return {
+        'required_skills': json.dumps(sorted(requirements['extracted_skills'])),
+        'experience_required': requirements['experience_required'],
+        'job_category': requirements['job_category']
+    }
+
+
+def _store_job_requirements(target):
+    """Extract requirements once at write time instead of on every match"""
+    values = job_requirement_values({field: getattr(target, field) for field in JOB_MATCH_FIELDS})
+    for column, value in values.items():
+        setattr(target, column, value)
+
+
+@event.listens_for(JobApplication, 'before_insert')
+def _extract_new_job_requirements(mapper, connection, target):
+    _store_job_requirements(target)
+
+
+@event.listens_for(JobApplication, 'before_update')
+def _bump_job_match_version(mapper, connection, target):
+    if _matching_inputs_changed(target, JOB_MATCH_FIELDS):
+        target.match_version = (target.match_version or 1) + 1
+        _store_job_requirements(target)
 
 
+@event.listens_for(CVProfile, 'before_update')
+def _bump_cv_profile_version(mapper, connection, target):
+    if _matching_inputs_changed(target, CV_MATCH_FIELDS):
+        target.version = (target.version or 1) + 1
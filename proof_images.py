@@ -0,0 +1,208 @@
+"""
+Proof Images
+Resized WebP variants of uploaded proof screenshots
+
+Originals stay in ``UPLOAD_FOLDER`` under their upload name and are never
+modified: the name is the digest of their bytes (see upload_storage). For
+every original, ``process_upload`` writes one WebP file per entry of
+``VARIANTS`` to ``UPLOAD_FOLDER/variants/<variant>/<stem>.webp``: a small
+``thumb`` for previews and a ``medium`` image for the screenshot modal.
+Originals larger than ``PROOF_MAX_DIMENSION`` on either side also get a
+downscaled copy in their own format, ``variants/full/<filename>``, which
+is sent instead of the original. ``schedule_processing`` runs this on a
+background worker once the upload is committed (``PROOF_IMAGES_BACKGROUND``).
+
+``variant_path`` returns the file the ``/uploads/proofs/`` route should
+send for a requested variant, and ``full_path`` the file to send for the
+original. Until a variant exists the route sends the original. Once all
+variants exist (``is_final``) none of the files change again, so they
+can be cached as immutable.
+
+Run ``python proof_images.py`` to create the missing variants of existing
+uploads.
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# name: longest side in pixels
+VARIANTS = {
+    'thumb': 320,
+    'medium': 1280
+}
+VARIANTS_DIR = 'variants'
+# Downscaled copy of an oversized original (same format as the original)
+FULL_VARIANT = 'full'
+WEBP_QUALITY = 80
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='proof-images')
+_pending_files = set()
+_pending_lock = threading.Lock()
+
+
+def _stem(filename):
+    return os.path.splitext(filename)[0]
+
+
+def variant_file(folder, filename, variant):
+    """Path of a variant of an upload (whether or not it exists yet)"""
+    return os.path.join(folder, VARIANTS_DIR, variant, _stem(filename) + '.webp')
+
+
+def variant_path(folder, filename, variant):
+    """Existing variant file for ``filename``, or None (unknown variant or not created yet)"""
+    if variant not in VARIANTS:
+        return None
+    path = variant_file(folder, filename, variant)
+    return path if os.path.exists(path) else None
+
+
+def full_file(folder, filename):
+    """Path of the downscaled copy of an original (whether or not it exists)"""
+    return os.path.join(folder, VARIANTS_DIR, FULL_VARIANT, filename)
+
+
+def full_path(folder, filename):
+    """File to send for the original: its downscaled copy if there is one"""
+    path = full_file(folder, filename)
+    return path if os.path.exists(path) else os.path.join(folder, filename)
+
+
+def variant_files(folder, filename):
+    """Paths of every derived file of an upload (whether or not they exist)"""
+    return [full_file(folder, filename)] + [variant_file(folder, filename, v) for v in VARIANTS]
+
+
+def is_final(folder, filename):
+    """True once processing finished: the original and its variants no longer change"""
+    return all(variant_path(folder, filename, variant) for variant in VARIANTS)
+
+
+def _save_atomically(image, path, **params):
+    # Readers never see a half-written file: write next to it, then rename
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        image.save(tmp_path, **params)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _write_full_variant(image, path, max_dimension):
+    """Write a downscaled copy (same format) of an original that exceeds max_dimension"""
+    if not max_dimension or max(image.size) <= max_dimension:
+        return False
+    if getattr(image, 'n_frames', 1) > 1:
+        return False  # Keep animations untouched
+
+    image_format = image.format
+    resized = ImageOps.exif_transpose(image)
+    resized.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+    params = {'format': image_format}
+    if image_format == 'JPEG':
+        params['quality'] = 90
+        if resized.mode not in ('RGB', 'L'):
+            resized = resized.convert('RGB')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _save_atomically(resized, path, **params)
+    return True
+
+
+def process_upload(folder, filename, max_dimension=None):
+    """Create the WebP variants of an upload and the downscaled copy of the original
+
+    Returns a summary dict, or None when Pillow is missing or the file is
+    not a readable image (the original is then served as uploaded).
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    path = os.path.join(folder, filename)
+    try:
+        with Image.open(path) as image:
+            image.load()
+            # Variants follow the camera orientation and drop the alpha channel
+            base = ImageOps.exif_transpose(image)
+            base = base.convert('RGBA' if base.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+            # The full copy first: once the variants exist nothing changes (see is_final)
+            downscaled = _write_full_variant(image, full_file(folder, filename), max_dimension)
+
+            variants = {}
+            for variant, size in VARIANTS.items():
+                target = variant_file(folder, filename, variant)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                resized = base.copy()
+                resized.thumbnail((size, size), Image.LANCZOS)
+                _save_atomically(resized, target, format='WEBP', quality=WEBP_QUALITY, method=4)
+                variants[variant] = resized.size
+    except (OSError, Image.DecompressionBombError) as e:
+        print(f"⚠️  Gagal memproses gambar bukti {filename}: {e}")
+        return None
+
+    return {'filename': filename, 'variants': variants, 'downscaled': downscaled}
+
+
+def delete_upload(folder, filename):
+    """Remove an upload and all its variants"""
+    for path in [os.path.join(folder, filename)] + variant_files(folder, filename):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _run_processing(folder, filename, max_dimension):
+    with _pending_lock:
+        _pending_files.discard(filename)
+    try:
+        return process_upload(folder, filename, max_dimension)
+    except Exception as e:
+        print(f"⚠️  Proof image worker error for {filename}: {e}")
+        return None
+
+
+def schedule_processing(app, filename):
+    """Queue variant creation for an upload (coalesced while pending)"""
+    folder = app.config['UPLOAD_FOLDER']
+    max_dimension = app.config.get('PROOF_MAX_DIMENSION')
+    if not app.config.get('PROOF_IMAGES_BACKGROUND', True):
+        return process_upload(folder, filename, max_dimension)
+
+    with _pending_lock:
+        if filename in _pending_files:
+            return None
+        _pending_files.add(filename)
+    return _executor.submit(_run_processing, folder, filename, max_dimension)
+
+
+def backfill(folder, max_dimension=None):
+    """Create missing variants for every upload in ``folder``; returns the count processed"""
+    processed = 0
+    for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+        if not entry.is_file() or entry.name.endswith('.tmp'):
+            continue
+        if is_final(folder, entry.name):
+            continue
+        if process_upload(folder, entry.name, max_dimension):
+            processed += 1
+    return processed
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+    settings = config.from_env()
+    if not PIL_AVAILABLE:
+        print("❌ Pillow tidak terpasang")
+        sys.exit(1)
+    count = backfill(settings['UPLOAD_FOLDER'], settings['PROOF_MAX_DIMENSION'])
+    print(f"✅ Varian dibuat untuk {count} gambar bukti")
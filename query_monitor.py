@@ -0,0 +1,134 @@
+"""
+Query Monitor
+Slow-query log and per-request query budgets
+
+SQLAlchemy engine events time every statement. Statements slower than
+``SLOW_QUERY_THRESHOLD_MS`` are logged to the ``query_monitor`` logger
+together with the route that issued them. Inside a request, the number
+of statements and their total time are counted (``request_query_stats``);
+``app_metrics`` exports them per route.
+
+A view declares its budget with ``@query_budget(n)``; other views use
+``QUERY_BUDGET_DEFAULT`` (None: unlimited). When a request exceeds its
+budget, ``QUERY_BUDGET_MODE`` decides what happens:
+
+- ``'warn'``: log and emit a ``QueryBudgetWarning``.
+- ``'raise'``: raise ``QueryBudgetExceeded``, an AssertionError that
+  fails the test issuing the request. This is the default when
+  ``app.testing`` is set.
+- ``'off'``: ignore the budget.
+"""
+
+import logging
+import time
+import warnings
+from functools import wraps
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger('query_monitor')
+
+DEFAULT_SLOW_QUERY_THRESHOLD_MS = 200
+
+_listeners_installed = False
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request issued more queries than its declared budget"""
+
+
+class QueryBudgetWarning(UserWarning):
+    """A request issued more queries than its declared budget"""
+
+
+def query_budget(max_queries):
+    """Declare the maximum number of queries a view may issue per request"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            return view(*args, **kwargs)
+        wrapper.query_budget = max_queries
+        return wrapper
+    return decorator
+
+
+def _route_label():
+    return request.url_rule.rule if request.url_rule is not None else request.path
+
+
+def request_query_stats():
+    """(query count, total query seconds) of the current request"""
+    return g.get('query_count', 0), g.get('query_seconds', 0.0)
+
+
+def _before_request():
+    g.query_count = 0
+    g.query_seconds = 0.0
+
+
+def _after_request(response):
+    view = current_app.view_functions.get(request.endpoint)
+    budget = getattr(view, 'query_budget', current_app.config.get('QUERY_BUDGET_DEFAULT'))
+    mode = current_app.config.get('QUERY_BUDGET_MODE', 'raise' if current_app.testing else 'warn')
+    count, seconds = request_query_stats()
+
+    if budget is None or mode == 'off' or count <= budget:
+        return response
+
+    message = (
+        f"{request.method} {_route_label()} issued {count} queries "
+        f"({seconds * 1000:.1f} ms), budget is {budget}"
+    )
+    if mode == 'raise':
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+    warnings.warn(message, QueryBudgetWarning)
+    return response
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+
+    route = '-'
+    if has_request_context():
+        route = _route_label()
+        if 'query_count' in g:
+            g.query_count += 1
+            g.query_seconds += elapsed
+
+    threshold_ms = DEFAULT_SLOW_QUERY_THRESHOLD_MS
+    if has_app_context():
+        threshold_ms = current_app.config.get('SLOW_QUERY_THRESHOLD_MS', threshold_ms)
+    if threshold_ms is not None and elapsed * 1000 >= threshold_ms:
+        logger.warning("Slow query (%.1f ms) on %s: %s", elapsed * 1000, route, ' '.join(statement.split()))
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('query_start'):
+        connection.info['query_start'].pop()
+
+
+def install_listeners():
+    """Time every statement of every engine (idempotent)"""
+    global _listeners_installed
+    if _listeners_installed:
+        return
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(Engine, 'handle_error', _handle_error)
+    _listeners_installed = True
+
+
+def init_app(app):
+    """Count queries per request and enforce budgets for ``app``"""
+    install_listeners()
+    app.before_request(_before_request)
+    app.after_request(_after_request)
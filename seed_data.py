@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Script untuk mengisi database dengan data sintetis dalam jumlah besar
+
+Generates ``--users`` users with ``--jobs-per-user`` applications each.
+Every application has a realistic status history: it moves through the
+hiring funnel (Terdaftar -> Tes -> Interview -> Diterima / Tidak
+Diterima), and each step produces the notification that
+``/api/job/<id>/status`` would have created. Each user also gets a CV
+profile and AI insights.
+
+Rows are written with Core bulk inserts (``executemany``) in large
+transactions. Primary keys are assigned up front, so notifications can
+reference their applications without reading them back. The data is a
+pure function of ``--seed``, ``--anchor`` and the sizes, which keeps perf
+runs reproducible. The database is the app's (``DATABASE_URL``).
+
+Usage:
+    python seed_data.py --users 100 --jobs-per-user 10000 [--seed 0] [--anchor 2025-01-01]
+                        [--prefix seed] [--password password] [--batch-size 50000] [--reset]
+"""
+
+import argparse
+import functools
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+STATUSES = [
+    ('Terdaftar', 'secondary'),
+    ('Interview', 'warning'),
+    ('Tes', 'info'),
+    ('Diterima', 'success'),
+    ('Tidak Diterima', 'danger')
+]
+
+POSITIONS = {
+    'Backend Developer': 'Requirements: Python, Django, PostgreSQL, Docker. Minimal 3 tahun pengalaman',
+    'Frontend Developer': 'Menguasai JavaScript, React, HTML, CSS dan Git',
+    'Full Stack Developer': 'Node.js, React, MongoDB, REST API. Fresh graduate dipersilakan melamar',
+    'Data Analyst': 'SQL, Excel, Tableau, Power BI. Pengalaman 1-2 tahun',
+    'Data Scientist': 'Python, Machine Learning, Pandas, TensorFlow. Senior level, 5+ tahun',
+    'DevOps Engineer': 'Kubernetes, Docker, AWS, Terraform, CI/CD',
+    'Mobile Developer': 'Kotlin, Flutter, Android, Firebase',
+    'QA Engineer': 'Selenium, automation testing, Jira, Agile',
+    'Project Manager': 'Scrum, Agile, leadership, communication. Minimal 5 tahun pengalaman',
+    'UI/UX Designer': 'Figma, Adobe XD, user research, prototyping',
+    'Marketing Specialist': 'SEO, Google Ads, social media, copywriting',
+    'Staf Administrasi': 'Microsoft Office, Excel, teliti dan komunikatif'
+}
+POSITION_NAMES = tuple(POSITIONS)
+COMPANIES = ['PT Maju Jaya', 'PT Digital Nusantara', 'PT Solusi Data', 'Tokopedia', 'Gojek', 'Traveloka',
+             'Bank Mandiri', 'Bank Central Asia', 'Telkom Indonesia', 'PT Kreasi Teknologi', 'Bukalapak',
+             'Shopee Indonesia', 'PT Astra International', 'PT Unilever Indonesia', 'Ruangguru', 'Xendit']
+CITIES = ['Jakarta', 'Bandung', 'Surabaya', 'Yogyakarta', 'Medan', 'Denpasar', 'Semarang', 'Remote']
+SOURCES = ['LinkedIn', 'Jobstreet', 'Glints', 'Kalibrr', 'Referral', 'Website Perusahaan']
+
+CV_SKILLS = ['python', 'django', 'flask', 'sql', 'postgresql', 'mysql', 'docker', 'kubernetes', 'aws',
+             'javascript', 'react', 'node.js', 'excel', 'tableau', 'power bi', 'machine learning',
+             'git', 'scrum', 'agile', 'leadership', 'communication', 'figma', 'seo', 'kotlin']
+EXPERIENCE_LEVELS = [('junior', 0, 2), ('mid', 2, 5), ('senior', 5, 10), ('expert', 10, 15)]
+EDUCATION_LEVELS = ['SMA/SMK', 'D3', 'S1', 'S1', 'S1', 'S2']
+
+INSIGHTS = [
+    ('skill_gap', 'Pelajari {skill} untuk meningkatkan peluang',
+     '{skill} diminta di banyak lowongan yang Anda lamar.', True),
+    ('career_path', 'Jalur karir menuju {position}',
+     'Pengalaman Anda cocok untuk melangkah ke posisi {position}.', False),
+    ('market_trend', 'Permintaan {skill} sedang naik',
+     'Lowongan yang membutuhkan {skill} meningkat dalam 3 bulan terakhir.', False),
+    ('success_prediction', 'Peluang diterima {rate}%',
+     'Berdasarkan riwayat lamaran, peluang diterima Anda sekitar {rate}%.', False)
+]
+
+DEFAULT_BATCH_SIZE = 50000
+
+
+@functools.lru_cache(maxsize=None)
+def status_notification(status_name, company_name, position):
+    """(title, message, type) of the notification for a status change (same text as the app)"""
+    position = position or 'Posisi'
+    if status_name == 'Diterima':
+        return ('🎉 Selamat! Lamaran Diterima!',
+                f'Selamat! Lamaran Anda di {company_name} untuk posisi {position} telah diterima!', 'success')
+    if status_name == 'Tidak Diterima':
+        return ('Lamaran Tidak Diterima',
+                f'Maaf, lamaran Anda di {company_name} untuk posisi {position} tidak diterima. Jangan menyerah!',
+                'warning')
+    if status_name == 'Interview':
+        return ('📞 Undangan Interview',
+                f'Anda mendapat undangan interview untuk posisi {position} di {company_name}. '
+                f'Persiapkan diri dengan baik!', 'info')
+    if status_name == 'Tes':
+        return ('📝 Undangan Tes',
+                f'Anda mendapat undangan tes untuk posisi {position} di {company_name}. '
+                f'Belajar dan persiapan yang matang!', 'info')
+    return ('Status Lamaran Diupdate',
+            f'Status lamaran di {company_name} berhasil diubah menjadi {status_name}', 'info')
+
+
+def status_history(rng):
+    """Statuses an application moved through after 'Terdaftar' (hiring funnel)"""
+    history = []
+    if rng.random() < 0.5:
+        # Never heard back
+        return history
+    if rng.random() < 0.35:
+        history.append('Tidak Diterima')
+        return history
+    if rng.random() < 0.6:
+        history.append('Tes')
+        if rng.random() < 0.4:
+            history.append('Tidak Diterima')
+            return history
+    history.append('Interview')
+    history.append('Diterima' if rng.random() < 0.3 else 'Tidak Diterima')
+    if rng.random() < 0.2:
+        # Still waiting for the interview result
+        history.pop()
+    return history
+
+
+def next_id(model):
+    from extensions import db
+    return (db.session.query(db.func.max(model.id)).scalar() or 0) + 1
+
+
+class Seeder:
+    """Bulk row generator and writer; call ``run()`` inside an app context"""
+
+    def __init__(self, users, jobs_per_user, seed=0, anchor=None, prefix='seed', password='password',
+                 history_days=365, batch_size=DEFAULT_BATCH_SIZE):
+        self.users = users
+        self.jobs_per_user = jobs_per_user
+        self.seed = seed
+        self.anchor = anchor or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.prefix = prefix
+        self.password = password
+        self.history_days = history_days
+        self.batch_size = batch_size
+        self.counts = {'users': 0, 'jobs': 0, 'notifications': 0, 'cv_profiles': 0, 'ai_insights': 0}
+        self._requirements = {}
+        self._pending = {}
+
+    def _job_requirements(self, values):
+        """Columns the before_insert hook would fill (skipped by Core inserts)"""
+        # notes are derived from the position
+        key = (values['position'], values['company_name'], values['location'], values['source_info'])
+        if key not in self._requirements:
+            from ai_modules import registry
+            requirements = registry.get_job_matcher().derive_job_requirements(values)
+            self._requirements[key] = {
+                'required_skills': json.dumps(sorted(requirements['extracted_skills'])),
+                'experience_required': requirements['experience_required'],
+                'job_category': requirements['job_category']
+            }
+        return self._requirements[key]
+
+    def _queue(self, model, row):
+        rows = self._pending.setdefault(model, [])
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        """Insert all queued rows, parents before the rows that reference them"""
+        from extensions import db
+        from models import User, JobApplication, Notification, CVProfile, AIInsight
+
+        for model in (User, JobApplication, Notification, CVProfile, AIInsight):
+            rows = self._pending.pop(model, [])
+            if rows:
+                # Table-level insert: one executemany, no per-row ORM bookkeeping
+                db.session.execute(model.__table__.insert(), rows)
+
+    def ensure_statuses(self):
+        from extensions import db
+        from models import Status
+
+        existing = {status.name: status.id for status in Status.query.all()}
+        missing = [Status(name=name, color=color) for name, color in STATUSES if name not in existing]
+        if missing:
+            db.session.add_all(missing)
+            db.session.flush()
+            existing.update((status.name, status.id) for status in missing)
+        return existing
+
+    def _user_jobs(self, rng, user_id, job_id, notification_id, status_ids):
+        from models import JobApplication, Notification
+
+        for _ in range(self.jobs_per_user):
+            position = rng.choice(POSITION_NAMES)
+            values = {
+                'company_name': rng.choice(COMPANIES),
+                'position': position,
+                'location': rng.choice(CITIES),
+                'source_info': rng.choice(SOURCES),
+                'notes': POSITIONS[position]
+            }
+            applied = self.anchor - timedelta(minutes=rng.randint(0, self.history_days * 24 * 60))
+            history = []
+            changed = applied
+            for status in status_history(rng):
+                changed = min(changed + timedelta(days=rng.randint(2, 21), minutes=rng.randint(0, 1440)),
+                              self.anchor)
+                history.append((status, changed))
+
+            # The application is queued before its notifications, so a flush never orphans them
+            self._queue(JobApplication, dict(
+                values,
+                id=job_id,
+                applied_date=applied,
+                last_status_update=history[-1][1] if history else None,
+                match_version=1,
+                status_id=status_ids[history[-1][0] if history else 'Terdaftar'],
+                user_id=user_id,
+                **self._job_requirements(values)
+            ))
+            self.counts['jobs'] += 1
+
+            for status, changed in history:
+                title, message, kind = status_notification(status, values['company_name'], position)
+                self._queue(Notification, {
+                    'id': notification_id,
+                    'user_id': user_id,
+                    'title': title,
+                    'message': message,
+                    'type': kind,
+                    # Older notifications have mostly been read
+                    'is_read': rng.random() < (0.95 if (self.anchor - changed).days > 7 else 0.3),
+                    'created_at': changed,
+                    'job_id': job_id
+                })
+                notification_id += 1
+                self.counts['notifications'] += 1
+            job_id += 1
+        return job_id, notification_id
+
+    def _user_profile(self, rng, user_id, index):
+        from insight_sync import insight_values
+        from models import CVProfile, AIInsight
+
+        level, min_years, max_years = rng.choice(EXPERIENCE_LEVELS)
+        skills = rng.sample(CV_SKILLS, k=rng.randint(4, 12))
+        self._queue(CVProfile, {
+            'user_id': user_id,
+            'full_name': f'Pengguna Sintetis {index}',
+            'email': f'{self.prefix}{index}@example.com',
+            'phone': f'+62 81{rng.randint(1, 9)} {rng.randint(1000, 9999)} {rng.randint(1000, 9999)}',
+            'location': rng.choice(CITIES),
+            'extracted_skills': json.dumps(skills),
+            'experience_level': level,
+            'years_experience': rng.randint(min_years, max_years),
+            'education_level': rng.choice(EDUCATION_LEVELS),
+            'summary': f'{level.title()} professional dengan keahlian {", ".join(skills[:3])}.',
+            'cv_file_path': None,
+            'file_size': rng.randint(20000, 400000),
+            'ats_score': round(rng.uniform(40, 95), 1),
+            'completeness_score': round(rng.uniform(50, 100), 1),
+            'version': 1,
+            'last_updated': self.anchor,
+            'created_at': self.anchor
+        })
+        self.counts['cv_profiles'] += 1
+
+        for insight_type, title, content, action_required in INSIGHTS:
+            fields = {'skill': rng.choice(CV_SKILLS).title(), 'position': rng.choice(POSITION_NAMES),
+                      'rate': rng.randint(5, 60)}
+            insight = {
+                'type': insight_type,
+                'title': title.format(**fields),
+                'content': content.format(**fields),
+                'confidence': round(rng.uniform(0.5, 0.95), 2),
+                'priority': rng.randint(1, 5),
+                'action_required': action_required,
+                'action_text': 'Lihat rekomendasi kursus' if action_required else '',
+                'related_skills': [fields['skill']]
+            }
+            self._queue(AIInsight, dict(
+                insight_values(user_id, insight),
+                is_read=rng.random() < 0.5,
+                is_dismissed=False,
+                created_at=self.anchor
+            ))
+            self.counts['ai_insights'] += 1
+
+    def run(self):
+        from werkzeug.security import generate_password_hash
+        from extensions import db
+        from models import User, JobApplication, Notification
+
+        status_ids = self.ensure_statuses()
+        # Hashing is slow on purpose; every synthetic user shares one hash
+        password = generate_password_hash(self.password)
+
+        user_id = next_id(User)
+        job_id = next_id(JobApplication)
+        notification_id = next_id(Notification)
+        for index in range(self.users):
+            # Per-user generator: a user's data does not depend on the batch size
+            rng = random.Random(f'{self.seed}-{index}')
+            self._queue(User, {'id': user_id, 'username': f'{self.prefix}{index}', 'password': password})
+            self.counts['users'] += 1
+            job_id, notification_id = self._user_jobs(rng, user_id, job_id, notification_id, status_ids)
+            self._user_profile(rng, user_id, index)
+            user_id += 1
+
+        self._flush()
+        db.session.commit()
+        return self.counts
+
+
+def seed(users, jobs_per_user, **options):
+    """Seed the database of the current app context; returns the row counts"""
+    return Seeder(users, jobs_per_user, **options).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Isi database dengan data sintetis dalam jumlah besar')
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--jobs-per-user', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--anchor', type=lambda value: datetime.strptime(value, '%Y-%m-%d'), default=None,
+                        help='date the generated histories end at (default: today)')
+    parser.add_argument('--prefix', default='seed', help='username prefix')
+    parser.add_argument('--password', default='password')
+    parser.add_argument('--history-days', type=int, default=365)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--reset', action='store_true', help='drop and recreate all tables first')
+    args = parser.parse_args()
+
+    from app import app, db
+
+    # Every bulk INSERT would be reported as a slow query
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = None
+    with app.app_context():
+        if args.reset:
+            print("🗑️  Menghapus tabel lama...")
+            db.drop_all()
+        db.create_all()
+
+        print(f"🌱 Mengisi {args.users} user x {args.jobs_per_user} lamaran (seed {args.seed})...")
+        start = time.perf_counter()
+        counts = seed(args.users, args.jobs_per_user, seed=args.seed, anchor=args.anchor, prefix=args.prefix,
+                      password=args.password, history_days=args.history_days, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+
+    total = sum(counts.values())
+    print(f"✅ {total} baris dalam {elapsed:.1f} detik ({total / elapsed:.0f} baris/detik)")
+    for table, count in counts.items():
+        print(f"   - {table}: {count}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test shared AI component registry
+Memastikan setiap komponen AI hanya dibuat sekali per proses
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_modules import registry
+from ai_modules.ai_service import AIService
+from ai_modules.cv_analyzer import CVAnalyzer
+
+
+def test_components_are_shared():
+    """Registry mengembalikan instance yang sama dan saling terhubung"""
+    service = registry.get_ai_service()
+
+    assert service is registry.get_ai_service()
+    assert service.cv_analyzer is registry.get_cv_analyzer()
+    assert service.nlp_processor is registry.get_nlp_processor()
+    assert service.cv_analyzer.nlp is service.nlp_processor
+    assert service.job_matcher is registry.get_job_matcher()
+
+
+def test_default_constructors_reuse_shared_components():
+    """CVAnalyzer() dan AIService() tanpa argumen memakai komponen bersama"""
+    analyzer = CVAnalyzer()
+    service = AIService()
+
+    assert analyzer.nlp is registry.get_nlp_processor()
+    assert analyzer.critical_analyzer is registry.get_critical_analyzer()
+    assert service.insights_generator is registry.get_insights_generator()
+
+
+def test_skill_database_is_read_only():
+    """Skill database bersama tidak boleh dimodifikasi"""
+    nlp = registry.get_nlp_processor()
+
+    try:
+        nlp.skill_keywords['programming'] = ['cobol']
+        assert False, "skill_keywords should be read-only"
+    except TypeError:
+        pass
+    assert isinstance(nlp.skill_keywords['programming'], tuple)
+
+
+if __name__ == '__main__':
+    test_components_are_shared()
+    test_default_constructors_reuse_shared_components()
+    test_skill_database_is_read_only()
+    print("✅ AI registry tests passed")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test warm-up komponen AI dan readiness per komponen
+Memastikan warm-up mencatat waktu load/warm-up, tidak masuk metrik pipeline,
+dan /healthz/ready melaporkan status komponen setelah create_app
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from ai_modules import pipeline_metrics, registry, warmup
+
+
+def test_warm_up_reports_every_component():
+    """Semua komponen dibangun dan dicatat waktunya, tanpa mengisi histogram pipeline"""
+    warmup.reset()
+    pipeline_metrics.HISTOGRAMS.reset()
+    assert warmup.readiness()['status'] == 'cold'
+
+    state = warmup.warm_up()
+    assert state['status'] == 'ready', state
+    assert state['total_ms'] > 0
+    assert list(state['components']) == [name for name, _, _ in warmup.COMPONENTS]
+    for name, entry in state['components'].items():
+        assert entry['status'] == 'ready', (name, entry)
+        assert entry['load_ms'] is not None
+    assert state['components']['nlp_processor']['warmup_ms'] is not None
+    assert set(registry.loaded_components()) >= set(state['components'])
+
+    # Warm-up runs are not real traffic
+    assert pipeline_metrics.HISTOGRAMS.snapshot() == []
+    with pipeline_metrics.pipeline_run('test'):
+        pass
+    assert len(pipeline_metrics.HISTOGRAMS.snapshot()) == 1
+    pipeline_metrics.HISTOGRAMS.reset()
+
+
+def test_failing_component_degrades():
+    """Komponen yang gagal dicatat sebagai error, komponen lain tetap siap"""
+    def broken():
+        raise RuntimeError('model missing')
+
+    original = warmup.COMPONENTS
+    warmup.COMPONENTS = (original[0], ('broken', broken, None))
+    try:
+        state = warmup.warm_up()
+    finally:
+        warmup.COMPONENTS = original
+        warmup.reset()
+
+    assert state['status'] == 'degraded'
+    assert state['components']['nlp_processor']['status'] == 'ready'
+    assert state['components']['broken'] == {'status': 'error', 'load_ms': None, 'warmup_ms': None,
+                                             'error': 'model missing'}
+
+
+def test_validate_ai_dependencies_uses_warm_up():
+    """AIService.validate_ai_dependencies melaporkan status warm-up"""
+    warmup.reset()
+    state = registry.get_ai_service().validate_ai_dependencies()
+    assert state['status'] == 'ready'
+    assert 'cv_analyzer' in state['components']
+    warmup.reset()
+
+
+def test_readiness_endpoint_after_sync_warm_up():
+    """/healthz/ready berisi waktu per komponen setelah create_app dengan AI_WARMUP=sync"""
+    script = (
+        "import json, app\n"
+        "app.create_app({'JOB_MATCH_BACKGROUND': False})\n"
+        "response = app.app.test_client().get('/healthz/ready')\n"
+        "print(json.dumps({'code': response.status_code, 'body': response.get_json()}))\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}", AI_WARMUP='sync')
+        result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report['code'] == 200
+    ai_warmup = report['body']['ai_warmup']
+    assert ai_warmup['status'] == 'ready'
+    assert ai_warmup['components']['cv_analyzer']['warmup_ms'] is not None
+    assert 'job_matcher' in report['body']['ai_components']
+
+
+if __name__ == '__main__':
+    test_warm_up_reports_every_component()
+    test_failing_component_degrades()
+    test_validate_ai_dependencies_uses_warm_up()
+    test_readiness_endpoint_after_sync_warm_up()
+    print("✅ AI warm-up tests passed")
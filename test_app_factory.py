@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test application factory, konfigurasi dari environment, dan server pre-fork
+Memastikan create_app menyiapkan app, /healthz/ready baru 200 setelahnya,
+dan worker gunicorn di-recycle setelah max_requests
+"""
+
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+import config
+
+
+def test_config_from_env():
+    """Default development, override dari environment, dan nilai opsional kosong"""
+    defaults = config.from_env({})
+    assert defaults['SQLALCHEMY_DATABASE_URI'] == 'sqlite:///database.db'
+    assert defaults['JOB_MATCH_BACKGROUND'] is True
+    assert defaults['SLOW_QUERY_THRESHOLD_MS'] == 200
+    assert defaults['QUERY_BUDGET_DEFAULT'] is None
+    assert defaults['AI_WARMUP'] == 'background'
+    assert 'QUERY_BUDGET_MODE' not in defaults
+
+    settings = config.from_env({
+        'DATABASE_URL': 'sqlite:////tmp/other.db',
+        'JOB_MATCH_BACKGROUND': 'off',
+        'SLOW_QUERY_THRESHOLD_MS': 'none',
+        'QUERY_BUDGET_DEFAULT': '25',
+        'AI_WARMUP': 'Sync',
+        'QUERY_BUDGET_MODE': 'warn',
+        'SQLITE_JOURNAL_MODE': ''
+    })
+    assert settings['SQLALCHEMY_DATABASE_URI'] == 'sqlite:////tmp/other.db'
+    assert settings['JOB_MATCH_BACKGROUND'] is False
+    assert settings['SLOW_QUERY_THRESHOLD_MS'] is None
+    assert settings['QUERY_BUDGET_DEFAULT'] == 25
+    assert settings['AI_WARMUP'] == 'sync'
+    assert settings['QUERY_BUDGET_MODE'] == 'warn'
+    assert 'journal_mode' not in settings['SQLITE_PRAGMAS']
+
+    try:
+        config.from_env({'METRICS_ENABLED': 'maybe'})
+        assert False, 'invalid boolean should be rejected'
+    except ValueError:
+        pass
+
+    try:
+        config.from_env({'AI_WARMUP': 'eager'})
+        assert False, 'unknown warm-up mode should be rejected'
+    except ValueError:
+        pass
+
+
+def test_create_app_and_readiness():
+    """/healthz/ready 503 sebelum create_app, 200 setelahnya (di proses terpisah)"""
+    script = (
+        "import json, app\n"
+        "client = app.app.test_client()\n"
+        "before = client.get('/healthz/ready').status_code\n"
+        "created = app.create_app({'JOB_MATCH_BACKGROUND': False})\n"
+        "after = client.get('/healthz/ready')\n"
+        "import sqlalchemy\n"
+        "with created.app_context():\n"
+        "    tables = sqlalchemy.inspect(app.db.engine).get_table_names()\n"
+        "print(json.dumps({'before': before, 'after': after.status_code, 'body': after.get_json(),\n"
+        "                  'same_app': created is app.app, 'background': created.config['JOB_MATCH_BACKGROUND'],\n"
+        "                  'tables': tables}))\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}", AI_WARMUP='off')
+        result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report['before'] == 503
+    assert report['after'] == 200 and report['body']['status'] == 'ready'
+    assert report['same_app'] and report['background'] is False
+    assert 'job_application' in report['tables']
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _get_json(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def test_gunicorn_preforks_and_recycles_workers():
+    """Worker gunicorn melayani /healthz/ready dan diganti setelah max_requests"""
+    if shutil.which('gunicorn') is None:
+        print("⚠️  gunicorn tidak terpasang, test dilewati")
+        return
+
+    port = _free_port()
+    url = f'http://127.0.0.1:{port}/healthz/ready'
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}", AI_WARMUP='off',
+                   BIND=f'127.0.0.1:{port}', WEB_CONCURRENCY='2',
+                   GUNICORN_MAX_REQUESTS='2', GUNICORN_MAX_REQUESTS_JITTER='0')
+        server = subprocess.Popen(['gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'], cwd=PROJECT_ROOT, env=env,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            deadline = time.time() + 60
+            while True:
+                try:
+                    _get_json(url)
+                    break
+                except OSError:
+                    assert time.time() < deadline, 'gunicorn did not become ready'
+                    time.sleep(0.2)
+
+            pids = set()
+            for _ in range(8):
+                body = _get_json(url)
+                assert body['status'] == 'ready'
+                pids.add(body['pid'])
+            # Two workers serving at most two requests each
+            assert len(pids) > 2, pids
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=30)
+
+
+if __name__ == '__main__':
+    test_config_from_env()
+    test_create_app_and_readiness()
+    test_gunicorn_preforks_and_recycles_workers()
+    print("✅ App factory tests passed")
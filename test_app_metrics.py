@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test Prometheus metrics endpoint
+Memastikan latency, query DB, poll notifikasi dan export tercatat, juga saat multi-process
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Response, jsonify
+from prometheus_client import REGISTRY
+
+from conftest import create_test_app
+from extensions import db
+from models import Status
+import app_metrics
+import query_monitor
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def instrument(test_app):
+    query_monitor.init_app(test_app)
+    app_metrics.init_app(test_app)
+
+    def get_notifications():
+        return jsonify({'statuses': [status.name for status in Status.query.all()], 'count': Status.query.count()})
+
+    def export_pdf():
+        return Response(b'%PDF' + b'0' * 2048, mimetype='application/pdf')
+
+    test_app.add_url_rule('/api/notifications', 'get_notifications', get_notifications)
+    test_app.add_url_rule('/export/pdf', 'export_pdf', export_pdf)
+    return test_app
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_request_metrics_exposed(make_app):
+    """Latency per route, jumlah query per request, poll dan export tercatat di /metrics"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = instrument(make_app(os.path.join(tmp, 'test.db')))
+        with test_app.app_context():
+            db.create_all()
+
+        before = {
+            'latency': sample('http_request_duration_seconds_count',
+                              method='GET', route='/api/notifications', status='200'),
+            'queries': sample('http_request_db_queries_sum', route='/api/notifications'),
+            'polls': sample('notification_polls_total'),
+            'export_size': sample('export_size_bytes_sum', format='pdf'),
+            'missing': sample('http_request_duration_seconds_count', method='GET', route='unmatched', status='404'),
+        }
+
+        client = test_app.test_client()
+        for _ in range(3):
+            assert client.get('/api/notifications').status_code == 200
+        assert client.get('/export/pdf').status_code == 200
+        assert client.get('/no-such-page').status_code == 404
+
+        assert sample('http_request_duration_seconds_count',
+                      method='GET', route='/api/notifications', status='200') - before['latency'] == 3
+        assert sample('http_request_db_queries_sum', route='/api/notifications') - before['queries'] == 6
+        assert sample('notification_polls_total') - before['polls'] == 3
+        assert sample('export_size_bytes_sum', format='pdf') - before['export_size'] == 2052
+        assert sample('http_request_duration_seconds_count',
+                      method='GET', route='unmatched', status='404') - before['missing'] == 1
+
+        response = client.get('/metrics')
+        assert response.status_code == 200
+        body = response.get_data(as_text=True)
+        assert 'http_request_duration_seconds_bucket' in body
+        assert 'http_request_db_seconds_sum{route="/api/notifications"}' in body
+
+
+WORKER_CODE = """
+import os, sys
+sys.path.insert(0, {root!r})
+from conftest import create_test_app
+from test_app_metrics import instrument
+from extensions import db
+test_app = instrument(create_test_app(os.path.join({tmp!r}, 'test.db')))
+with test_app.app_context():
+    db.create_all()
+client = test_app.test_client()
+if sys.argv[1] == 'serve':
+    client.get('/api/notifications')
+else:
+    sys.stdout.write(client.get('/metrics').get_data(as_text=True))
+"""
+
+
+def test_multiprocess_aggregation():
+    """Sample dari beberapa worker dijumlahkan oleh /metrics"""
+    with tempfile.TemporaryDirectory() as tmp:
+        metrics_dir = os.path.join(tmp, 'prometheus')
+        os.makedirs(metrics_dir)
+        env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=metrics_dir)
+        code = WORKER_CODE.format(root=PROJECT_ROOT, tmp=tmp)
+
+        for _ in range(2):
+            subprocess.run([sys.executable, '-c', code, 'serve'], env=env, check=True, cwd=tmp)
+        result = subprocess.run(
+            [sys.executable, '-c', code, 'scrape'], env=env, check=True, cwd=tmp,
+            capture_output=True, text=True
+        )
+        assert 'notification_polls_total 2.0' in result.stdout
+
+
+if __name__ == '__main__':
+    test_request_metrics_exposed(create_test_app)
+    test_multiprocess_aggregation()
+    print("✅ App metrics tests passed")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test vectorized batch job matching
+Memastikan BatchJobMatcher menghasilkan skor yang sama dengan analisis per job
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_modules.job_matcher import JobMatcher
+
+POSITIONS = [
+    'Senior Python Developer', 'Junior Data Analyst', 'Backend Engineer Django',
+    'Frontend Developer React', 'DevOps Engineer Docker Kubernetes', 'Project Manager Agile',
+    'Marketing Specialist', 'Machine Learning Engineer', 'Intern Web Developer', ''
+]
+NOTES = [
+    'Requires SQL, PostgreSQL and AWS', 'Experience with Tableau and Excel', '5+ years experience',
+    'fresh graduate welcome', 'Java and Spring', 'Node.js, Express, MongoDB', '', 'Scrum master and Kanban'
+]
+LOCATIONS = ['Jakarta Selatan', 'Bandung', 'Surabaya', 'Jakarta', 'Remote', '']
+
+
+def make_jobs(count, seed=42):
+    rng = random.Random(seed)
+    return [{
+        'id': index,
+        'position': rng.choice(POSITIONS),
+        'company_name': f'PT Contoh {index}',
+        'location': rng.choice(LOCATIONS),
+        'source_info': rng.choice(['LinkedIn', 'Jobstreet', '']),
+        'notes': rng.choice(NOTES)
+    } for index in range(count)]
+
+
+def _normalize(result):
+    normalized = dict(result)
+    normalized.pop('analysis_date')
+    for key in ('matching_skills', 'missing_skills', 'additional_skills'):
+        normalized[key] = sorted(normalized[key])
+    normalized['job_requirements'] = dict(result['job_requirements'], extracted_skills=sorted(result['job_requirements']['extracted_skills']))
+    return normalized
+
+
+def _assert_same(cv_analysis, jobs):
+    matcher = JobMatcher()
+    expected = {r['job_id']: _normalize(r) for r in matcher.batch_analyze_jobs_sequential(cv_analysis, jobs)}
+    actual = {r['job_id']: _normalize(r) for r in matcher.batch_analyze_jobs(cv_analysis, jobs)}
+    assert expected == actual
+
+
+def test_batch_matches_sequential_scores():
+    """Skor batch identik dengan skor per job"""
+    cv_analysis = {
+        'extracted_skills': ['Python', 'Django', 'postgres', 'SQL', 'sql', 'Docker', 'Excel', 'javascript'],
+        'experience_level': 'mid',
+        'contact_info': {'location': 'Jakarta Barat'}
+    }
+    _assert_same(cv_analysis, make_jobs(300))
+
+
+def test_batch_edge_cases():
+    """CV tanpa skill dan job tanpa requirement"""
+    jobs = make_jobs(50, seed=7) + [{'id': 999, 'position': '', 'company_name': '', 'location': ''}]
+    _assert_same({'extracted_skills': []}, jobs)
+    _assert_same({'extracted_skills': ['python'], 'experience_level': 'expert'}, jobs)
+    assert JobMatcher().batch_analyze_jobs({'extracted_skills': ['python']}, []) == []
+
+
+def test_precomputed_requirements_match_derived():
+    """Requirements yang disimpan saat write menghasilkan skor yang sama"""
+    matcher = JobMatcher()
+    cv_analysis = {
+        'extracted_skills': ['Python', 'Django', 'SQL', 'Excel', 'Tableau'],
+        'experience_level': 'junior',
+        'contact_info': {'location': 'Jakarta'}
+    }
+    jobs = make_jobs(200, seed=3)
+    precomputed = [dict(job, **matcher.derive_job_requirements(job)) for job in jobs]
+
+    expected = {r['job_id']: _normalize(r) for r in matcher.batch_analyze_jobs(cv_analysis, jobs)}
+    actual = {r['job_id']: _normalize(r) for r in matcher.batch_analyze_jobs(cv_analysis, precomputed)}
+    assert expected == actual
+
+
+if __name__ == '__main__':
+    test_batch_matches_sequential_scores()
+    test_batch_edge_cases()
+    test_precomputed_requirements_match_derived()
+    print("✅ Batch job matcher tests passed")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test section-level critical analysis
+Memastikan hanya section yang diminta yang dihitung, dan hasilnya di-cache per section
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_modules.critical_analyzer import CriticalAnalyzer, CRITICAL_SECTIONS
+from ai_modules.cv_analyzer import CVAnalyzer
+from ai_modules.feedback_generator import FeedbackGenerator
+
+CV_TEXT = """Budi Santoso
+budi@example.com | +62 812 3456 7890 | Jakarta
+RINGKASAN
+Senior data analyst dengan pengalaman 6 tahun.
+PENGALAMAN KERJA
+PT Maju Jaya - Lead Data Analyst (2019 - 2024)
+- Bertanggung jawab memimpin tim 5 analis
+- Meningkatkan akurasi forecast 30% dengan Python dan SQL
+PENDIDIKAN
+Sarjana Statistika, Universitas Indonesia, GPA 3.6
+KEAHLIAN
+Python, SQL, Excel, Tableau, Machine Learning
+"""
+
+EXTRACTED_DATA = {
+    'extracted_text': CV_TEXT,
+    'extracted_skills': ['python', 'sql', 'excel', 'tableau'],
+    'contact_info': {'email': 'budi@example.com'},
+    'ats_score': 65,
+    'analysis_date': '2026-01-01T10:00:00'
+}
+
+
+def count_calls(obj, method_names):
+    """Bungkus method instance untuk menghitung jumlah pemanggilan"""
+    calls = dict.fromkeys(method_names, 0)
+    for name in method_names:
+        original = getattr(obj, name)
+
+        def counted(*args, _name=name, _original=original, **kwargs):
+            calls[_name] += 1
+            return _original(*args, **kwargs)
+
+        setattr(obj, name, counted)
+    return calls
+
+
+def test_only_requested_sections_are_computed():
+    """Section yang tidak diminta tidak dihitung; dependensi dihitung sekali"""
+    analyzer = CriticalAnalyzer()
+    calls = count_calls(analyzer, [
+        'analyze_content_quality', 'identify_critical_gaps', 'analyze_cv_credibility', 'generate_critical_feedback'
+    ])
+
+    report = analyzer.generate_critical_analysis(EXTRACTED_DATA, ['critical_gaps'])
+    assert set(report) >= {'critical_gaps', 'sections'} and 'content_quality' not in report
+    assert calls == {'analyze_content_quality': 0, 'identify_critical_gaps': 1,
+                     'analyze_cv_credibility': 0, 'generate_critical_feedback': 0}
+
+    # Later requests reuse sections computed for the same input (timestamps ignored)
+    rerun = dict(EXTRACTED_DATA, analysis_date='2026-02-02T10:00:00')
+    report = analyzer.generate_critical_analysis(rerun, ['critical_feedback', 'critical_gaps'])
+    assert 'content_quality' not in report and 'overall_score' not in report
+    assert calls == {'analyze_content_quality': 1, 'identify_critical_gaps': 1,
+                     'analyze_cv_credibility': 0, 'generate_critical_feedback': 1}
+
+    full = analyzer.generate_comprehensive_critical_analysis(EXTRACTED_DATA)
+    assert full['sections'] == list(CRITICAL_SECTIONS)
+    assert full['overall_score'] == full['content_quality']['score']
+    assert all(count == 1 for count in calls.values())
+
+
+def test_full_report_matches_direct_computation():
+    """Laporan lengkap sama dengan memanggil setiap analisis langsung"""
+    analyzer = CriticalAnalyzer()
+    report = analyzer.generate_comprehensive_critical_analysis(EXTRACTED_DATA)
+
+    content = analyzer.analyze_content_quality(CV_TEXT, EXTRACTED_DATA['extracted_skills'])
+    gaps = analyzer.identify_critical_gaps(EXTRACTED_DATA)
+    assert report['content_quality'] == content
+    assert report['critical_gaps'] == gaps
+    assert report['credibility_analysis'] == analyzer.analyze_cv_credibility(CV_TEXT, EXTRACTED_DATA)
+    assert report['critical_feedback'] == analyzer.generate_critical_feedback(content, gaps, EXTRACTED_DATA)
+
+    try:
+        analyzer.generate_critical_analysis(EXTRACTED_DATA, ['unknown'])
+        assert False, 'unknown section should be rejected'
+    except ValueError:
+        pass
+
+
+def test_cv_analyzer_skips_unrequested_feedback():
+    """analyze_cv_critical tidak menjalankan FeedbackGenerator jika tidak diminta"""
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'cv.txt')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(CV_TEXT)
+
+        analyzer = CVAnalyzer(critical_analyzer=CriticalAnalyzer(), feedback_generator=FeedbackGenerator())
+        calls = count_calls(analyzer.feedback_generator, [
+            'generate_comprehensive_feedback', 'generate_priority_based_feedback'
+        ])
+
+        results = analyzer.analyze_cv_critical(file_path, len(CV_TEXT), sections=['content_quality'])
+        assert results['sections'] == ['content_quality']
+        assert 'intelligent_feedback' not in results and 'enhanced_summary' not in results
+        assert calls == {'generate_comprehensive_feedback': 0, 'generate_priority_based_feedback': 0}
+
+        results = analyzer.analyze_cv_critical(file_path, len(CV_TEXT), sections=['enhanced_summary'])
+        assert results['enhanced_summary']
+        assert calls == {'generate_comprehensive_feedback': 0, 'generate_priority_based_feedback': 1}
+
+        results = analyzer.analyze_cv_critical(file_path, len(CV_TEXT))
+        assert results['intelligent_feedback'] and results['enhanced_summary']
+        assert 'credibility_analysis' in results['critical_analysis']
+
+
+if __name__ == '__main__':
+    test_only_requested_sections_are_computed()
+    test_full_report_matches_direct_computation()
+    test_cv_analyzer_skips_unrequested_feedback()
+    print("✅ Critical section tests passed")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test tuning SQLite (WAL, busy timeout, pragmas)
+Memastikan setiap koneksi di pool mendapat pragma dan nilainya bisa diatur lewat environment
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+
+from conftest import create_test_app
+from extensions import db
+import db_bootstrap
+
+
+def test_pragmas_from_env():
+    """Nilai default, override dari environment, dan string kosong untuk menonaktifkan"""
+    assert db_bootstrap.pragmas_from_env({}) == db_bootstrap.DEFAULT_PRAGMAS
+    pragmas = db_bootstrap.pragmas_from_env({'SQLITE_BUSY_TIMEOUT': '250', 'SQLITE_MMAP_SIZE': ''})
+    assert pragmas['busy_timeout'] == '250'
+    assert 'mmap_size' not in pragmas
+    assert pragmas['journal_mode'] == 'WAL'
+
+
+def test_every_pooled_connection_is_tuned(make_app):
+    """Koneksi dari beberapa thread (pool) semuanya memakai WAL dan busy timeout"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'), SQLITE_PRAGMAS=db_bootstrap.pragmas_from_env({
+            'SQLITE_BUSY_TIMEOUT': '1234', 'SQLITE_CACHE_SIZE': '-4096'
+        }))
+        db_bootstrap.init_app(test_app)
+        results = []
+
+        def read_settings():
+            with test_app.app_context():
+                with db.engine.connect() as connection:
+                    results.append(db_bootstrap.read_pragmas(connection))
+                    # Keep the connection checked out so the threads use different ones
+                    barrier.wait()
+
+        barrier = threading.Barrier(3)
+        threads = [threading.Thread(target=read_settings) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 3
+        for settings in results:
+            assert settings['journal_mode'] == 'wal'
+            assert settings['synchronous'] == 1  # NORMAL
+            assert settings['busy_timeout'] == 1234
+            assert settings['cache_size'] == -4096
+
+        with test_app.app_context():
+            db.engine.dispose()
+
+
+def test_configure_engine_skips_other_dialects_and_empty_settings():
+    """Engine non-SQLite dan SQLITE_PRAGMAS kosong tidak diubah"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'plain.db')}")
+        assert not db_bootstrap.configure_engine(engine, {})
+        with engine.connect() as connection:
+            assert db_bootstrap.read_pragmas(connection)['journal_mode'] == 'delete'
+        engine.dispose()
+
+    class FakeDialect:
+        name = 'postgresql'
+
+    class FakeEngine:
+        dialect = FakeDialect()
+
+    assert not db_bootstrap.configure_engine(FakeEngine(), db_bootstrap.DEFAULT_PRAGMAS)
+
+
+if __name__ == '__main__':
+    test_pragmas_from_env()
+    test_every_pooled_connection_is_tuned(create_test_app)
+    test_configure_engine_skips_other_dialects_and_empty_settings()
+    print("✅ DB bootstrap tests passed")
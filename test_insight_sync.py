@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test memoized insight generation
+Memastikan generate insight dengan input yang sama tidak menghitung ulang
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event
+
+from conftest import create_test_app
+from extensions import db
+from models import User, AIInsight
+import insight_sync
+from ai_modules import registry
+
+USER_DATA = {
+    'cv_analysis': {
+        'extracted_skills': ['python', 'sql'],
+        'experience_level': 'mid',
+        'years_experience': 3,
+        'ats_score': 70,
+        'analysis_date': '2026-01-01T10:00:00'
+    },
+    'job_applications': [
+        {'position': 'Data Analyst', 'company_name': 'PT A', 'location': 'Jakarta', 'status': 'Applied'}
+    ]
+}
+
+
+def test_fingerprint_ignores_timestamps_and_key_order():
+    """Fingerprint stabil terhadap urutan key dan timestamp analisis"""
+    reordered = {
+        'job_applications': USER_DATA['job_applications'],
+        'cv_analysis': dict(reversed(list(USER_DATA['cv_analysis'].items())), analysis_date='2026-02-02')
+    }
+    assert insight_sync.fingerprint(reordered) == insight_sync.fingerprint(USER_DATA)
+
+    changed = dict(USER_DATA, cv_analysis=dict(USER_DATA['cv_analysis'], experience_level='senior'))
+    assert insight_sync.fingerprint(changed) != insight_sync.fingerprint(USER_DATA)
+
+
+def test_unchanged_input_is_not_recomputed(make_app):
+    """Generate kedua dengan input sama memakai data tersimpan"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            db.session.add(User(id=1, username='user1', password='x'))
+            db.session.commit()
+
+            insights, cached = insight_sync.generate_insights(1, USER_DATA)
+            db.session.commit()
+            assert not cached and insights
+            first_ids = sorted(insight.id for insight in AIInsight.query.all())
+
+            def fail_if_called(user_data):
+                raise AssertionError('insights recomputed for unchanged input')
+
+            generator = registry.get_insights_generator()
+            original = generator.generate_all_insights
+            generator.generate_all_insights = fail_if_called
+            try:
+                insights_again, cached_again = insight_sync.generate_insights(1, USER_DATA)
+            finally:
+                generator.generate_all_insights = original
+            assert cached_again
+            assert sorted(insight.id for insight in insights_again) == first_ids
+
+            changed = dict(USER_DATA, job_applications=[])
+            _, cached_changed = insight_sync.generate_insights(1, changed)
+            assert not cached_changed
+
+
+def _insight(insight_type, title, content, priority=3):
+    return {'type': insight_type, 'title': title, 'content': content, 'confidence': 0.8, 'priority': priority}
+
+
+def test_differential_upsert_preserves_read_state(make_app):
+    """Upsert hanya mengubah insight yang berubah dan mempertahankan is_read/is_dismissed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            db.session.add(User(id=1, username='user1', password='x'))
+            db.session.commit()
+
+            insight_sync.upsert_insights(1, [
+                _insight('market_trend', 'Trends', 'A'),
+                _insight('skill_gap', 'Gaps', 'B'),
+                _insight('success_prediction', 'Good Success Potential', 'C')
+            ])
+            db.session.commit()
+            rows = {row.insight_type: row for row in AIInsight.query.all()}
+            rows['market_trend'].is_read = True
+            rows['skill_gap'].is_dismissed = True
+            db.session.commit()
+            ids = {insight_type: row.id for insight_type, row in rows.items()}
+
+            updated_rows = []
+
+            def listener(conn, cursor, statement, params, context, executemany):
+                if statement.lstrip().upper().startswith('INSERT'):
+                    updated_rows.append(cursor.rowcount)
+
+            event.listen(db.engine, 'after_cursor_execute', listener)
+            try:
+                insight_sync.upsert_insights(1, [
+                    _insight('market_trend', 'Trends', 'A'),  # unchanged
+                    _insight('skill_gap', 'Gaps', 'B2'),  # changed content
+                    _insight('success_prediction', 'High Success Probability', 'D')  # new title -> new key
+                ])
+                db.session.commit()
+            finally:
+                event.remove(db.engine, 'after_cursor_execute', listener)
+
+            assert updated_rows == [2]  # one insert + one update, unchanged row untouched
+            rows = {row.insight_type: row for row in AIInsight.query.all()}
+            assert len(rows) == 3
+            assert rows['market_trend'].id == ids['market_trend'] and rows['market_trend'].is_read
+            assert rows['skill_gap'].id == ids['skill_gap'] and rows['skill_gap'].is_dismissed
+            assert rows['skill_gap'].content == 'B2'
+            assert rows['success_prediction'].title == 'High Success Probability'
+
+            # Expired rows are removed even without replace
+            rows['market_trend'].expires_at = datetime(2000, 1, 1)
+            db.session.commit()
+            insight_sync.upsert_insights(1, [], replace=False)
+            db.session.commit()
+            assert AIInsight.query.count() == 2
+
+
+if __name__ == '__main__':
+    test_fingerprint_ignores_timestamps_and_key_order()
+    test_unchanged_input_is_not_recomputed(create_test_app)
+    test_differential_upsert_preserves_read_state(create_test_app)
+    print("✅ Insight sync tests passed")
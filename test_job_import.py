@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Test import massal lamaran kerja dari CSV/XLSX
+Memastikan kolom export Excel dikenali, baris tidak valid dilaporkan per baris,
+dry run tidak menulis apa pun, dan import memakai batch dengan kolom requirement terisi
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from openpyxl import Workbook
+
+from conftest import create_test_app
+from extensions import db
+from models import JobApplication, Status, User
+import job_import
+
+EXPORT_HEADER = ['No', 'Nama Perusahaan', 'Posisi', 'Lokasi', 'Alamat', 'Status', 'Tanggal Apply',
+                 'Terakhir Diupdate', 'Sumber Info', 'Bukti Lamaran (Link)', 'Catatan']
+
+CSV_CONTENT = (
+    ';'.join(EXPORT_HEADER + ['Kolom Lain']) + '\n'
+    '1;PT Maju;Python Developer;Jakarta;-;Interview;05/01/2025;06/01/2025 10:30;LinkedIn;-;Django, SQL;x\n'
+    '2;;Designer;Bandung;-;Terdaftar;05/01/2025;-;-;-;-;x\n'
+    '3;PT Salah;QA;Surabaya;-;Menunggu;05/01/2025;-;-;-;-;x\n'
+    '4;PT Tanggal;QA;Surabaya;-;Tes;32/01/2025;-;-;-;-;x\n'
+    ';;;;;;;;;;;\n'
+    f"5;PT Panjang;{'x' * 300};Medan;-;Tes;-;-;-;-;-;x\n"
+    '6;CV Kecil;Data Analyst;Yogyakarta;Jl. Malioboro;;2025-02-03;-;Jobstreet;-;-;x\n'
+    '7;PT Akhir;Java Developer;Jakarta;-;diterima;-;-;-;-;Spring Boot;x\n'
+).encode('utf-8-sig')
+
+
+def _seed():
+    db.session.add_all([Status(id=i, name=name) for i, name in
+                        enumerate(['Terdaftar', 'Interview', 'Tes', 'Diterima', 'Tidak Diterima'], start=1)])
+    db.session.add(User(id=1, username='u', password='x'))
+    db.session.commit()
+
+
+def test_read_rows_maps_export_headers():
+    """Header export Excel dipetakan ke field; kolom tak dikenal dilaporkan, baris kosong dilewati"""
+    ignored, rows = job_import.read_rows(io.BytesIO(CSV_CONTENT), 'lamaran.csv')
+    rows = list(rows)
+
+    assert ignored == ['No', 'Kolom Lain']
+    assert [line for line, _ in rows] == [2, 3, 4, 5, 7, 8, 9]
+    assert rows[0][1]['company_name'] == 'PT Maju' and rows[0][1]['application_proof'] == '-'
+
+    for content, filename in [(b'Posisi,Lokasi\nQA,Jakarta\n', 'a.csv'), (b'', 'a.csv'), (b'x', 'a.pdf')]:
+        try:
+            job_import.read_rows(io.BytesIO(content), filename)
+        except ValueError:
+            continue
+        raise AssertionError(f'{filename} {content!r} harus ditolak')
+
+
+def test_dry_run_and_batched_import(make_app):
+    """Dry run hanya memvalidasi; import sebenarnya menulis baris valid per batch"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            _seed()
+
+            report = job_import.import_file(io.BytesIO(CSV_CONTENT), 'lamaran.csv', 1, dry_run=True)
+            assert JobApplication.query.count() == 0
+            assert (report['rows'], report['valid'], report['imported'], report['invalid']) == (7, 3, 0, 4)
+            errors = {error['row']: ' '.join(error['errors']) for error in report['errors']}
+            assert set(errors) == {3, 4, 5, 7}
+            assert 'company_name' in errors[3] and 'Menunggu' in errors[4]
+            assert 'applied_date' in errors[5] and 'position' in errors[7]
+            assert [row['company_name'] for row in report['preview']] == ['PT Maju', 'CV Kecil', 'PT Akhir']
+            assert report['preview'][0]['last_status_update'] == '2025-01-06T10:30:00'
+            assert report['preview'][1]['status'] == 'Terdaftar'
+
+            report = job_import.import_file(io.BytesIO(CSV_CONTENT), 'lamaran.csv', 1, batch_size=2, max_errors=1)
+            assert report['imported'] == 3 and len(report['errors']) == 1 and report['errors_truncated']
+
+            jobs = {job.company_name: job for job in JobApplication.query.all()}
+            assert set(jobs) == {'PT Maju', 'CV Kecil', 'PT Akhir'}
+            maju = jobs['PT Maju']
+            assert maju.status.name == 'Interview' and maju.user_id == 1
+            assert maju.applied_date == datetime(2025, 1, 5) and maju.address is None
+            assert 'python' in json.loads(maju.required_skills) and maju.job_category
+            assert jobs['CV Kecil'].status.name == 'Terdaftar'
+            assert jobs['CV Kecil'].last_status_update == datetime(2025, 2, 3)
+            assert jobs['PT Akhir'].status.name == 'Diterima'
+            db.engine.dispose()
+
+
+def test_xlsx_export_roundtrip(make_app):
+    """File XLSX dengan format export (tanggal sebagai sel datetime) bisa diimport"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(EXPORT_HEADER)
+    sheet.append([1, 'PT Excel', 'Backend Engineer', 'Jakarta', '-', 'Tes',
+                  datetime(2025, 3, 1), datetime(2025, 3, 2, 9, 15), 'Website', '-', '-'])
+    sheet.append([2, 'PT Angka', 12345, 'Bogor', '-', 'Terdaftar', '01/03/2025', None, None, None, None])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            _seed()
+            report = job_import.import_file(buffer, 'export.xlsx', 1)
+            assert report['imported'] == 2 and report['invalid'] == 0, report
+            excel = JobApplication.query.filter_by(company_name='PT Excel').one()
+            assert excel.last_status_update == datetime(2025, 3, 2, 9, 15) and excel.status.name == 'Tes'
+            assert JobApplication.query.filter_by(company_name='PT Angka').one().position == '12345'
+            db.engine.dispose()
+
+
+def test_import_endpoint():
+    """POST /import/jobs: dry run, import, dan penolakan format yang tidak didukung"""
+    script = (
+        "import io, json, app\n"
+        "from models import JobApplication, Status, User\n"
+        "app.create_app()\n"
+        "with app.app.app_context():\n"
+        "    app.db.session.add_all([Status(id=1, name='Terdaftar'), Status(id=2, name='Interview'),\n"
+        "                            User(id=1, username='u', password='x')])\n"
+        "    app.db.session.commit()\n"
+        "client = app.app.test_client()\n"
+        "with client.session_transaction() as session:\n"
+        "    session['_user_id'] = '1'\n"
+        "content = b'Perusahaan,Posisi,Status\\nPT A,Dev,Interview\\nPT B,QA,\\n,Ops,Terdaftar\\n'\n"
+        "report = {}\n"
+        "for name, data in [('dry', {'dry_run': '1'}), ('real', {})]:\n"
+        "    data['file'] = (io.BytesIO(content), 'jobs.csv')\n"
+        "    response = client.post('/import/jobs', data=data)\n"
+        "    report[name] = [response.status_code, response.get_json()['report']]\n"
+        "response = client.post('/import/jobs', data={'file': (io.BytesIO(b'x'), 'jobs.pdf')})\n"
+        "report['unsupported'] = response.status_code\n"
+        "with app.app.app_context():\n"
+        "    report['companies'] = sorted(job.company_name for job in JobApplication.query.filter_by(user_id=1))\n"
+        "print(json.dumps(report))\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}",
+                   AI_WARMUP='off', JOB_MATCH_BACKGROUND='0')
+        result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report['dry'][0] == 200 and report['dry'][1]['valid'] == 2 and report['dry'][1]['imported'] == 0
+    assert report['real'][0] == 200 and report['real'][1]['imported'] == 2
+    assert report['real'][1]['errors'] == [{'row': 4, 'errors': ['company_name wajib diisi']}]
+    assert report['unsupported'] == 400
+    assert report['companies'] == ['PT A', 'PT B']
+
+
+if __name__ == '__main__':
+    test_read_rows_maps_export_headers()
+    test_dry_run_and_batched_import(create_test_app)
+    test_xlsx_export_roundtrip(create_test_app)
+    test_import_endpoint()
+    print("✅ Job import tests passed")
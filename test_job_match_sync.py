@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Test incremental job match recomputation
+Memastikan hanya job yang berubah (atau semua job saat CV berubah) yang dihitung ulang
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import event
+
+from conftest import create_test_app
+from extensions import db
+from models import User, Status, JobApplication, CVProfile, JobMatch
+import job_match_sync
+from ai_modules import registry
+
+MATCH_CONFIG = {'JOB_MATCH_BACKGROUND': False, 'JOB_MATCH_BATCH_SIZE': 2}
+
+
+def seed(user_id=1):
+    db.session.add(User(id=user_id, username=f'user{user_id}', password='x'))
+    db.session.add(Status(id=1, name='Applied'))
+    for index, (position, notes) in enumerate([
+        ('Python Developer', 'Django, SQL'),
+        ('Data Analyst', 'Excel and Tableau'),
+        ('DevOps Engineer', 'Docker, Kubernetes, AWS'),
+        ('Marketing Specialist', ''),
+        ('Frontend Developer', 'React')
+    ]):
+        db.session.add(JobApplication(
+            company_name=f'PT {index}', position=position, location='Jakarta',
+            notes=notes, status_id=1, user_id=user_id
+        ))
+    db.session.add(CVProfile(
+        user_id=user_id, extracted_skills=json.dumps(['python', 'django', 'sql']),
+        experience_level='mid', location='Jakarta Selatan'
+    ))
+    db.session.commit()
+
+
+def test_only_stale_matches_are_recomputed(make_app):
+    """Hitung ulang hanya job yang stale, dilewati jika sudah current"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'), **MATCH_CONFIG)
+        with test_app.app_context():
+            db.create_all()
+            seed()
+
+            assert job_match_sync.schedule_recompute(test_app, 1) == 5
+            assert JobMatch.query.count() == 5
+            assert job_match_sync.recompute_stale_matches(1) == 0
+
+            # Non-matching field edit does not invalidate, text edit invalidates one job
+            job = JobApplication.query.filter_by(position='Data Analyst').first()
+            job.address = 'Jl. Sudirman'
+            db.session.commit()
+            assert job_match_sync.recompute_stale_matches(1) == 0
+
+            job.notes = 'Python, SQL and Tableau'
+            db.session.commit()
+            assert job.match_version == 2
+            assert job_match_sync.stale_job_ids(1, CVProfile.query.first()) == [job.id]
+            assert job_match_sync.recompute_stale_matches(1) == 1
+
+            job_match = JobMatch.query.filter_by(job_id=job.id).first()
+            assert job_match.job_version == 2
+            assert 'python' in json.loads(job_match.matching_skills)
+
+            # CV change invalidates every match
+            cv_profile = CVProfile.query.first()
+            cv_profile.extracted_skills = json.dumps(['excel', 'tableau'])
+            db.session.commit()
+            assert cv_profile.version == 2
+            assert job_match_sync.recompute_stale_matches(1) == 5
+            assert JobMatch.query.count() == 5
+            assert all(m.cv_version == 2 for m in JobMatch.query.all())
+
+
+def test_stored_match_round_trip(make_app):
+    """Hasil yang disimpan bisa dibaca ulang dengan bentuk yang sama"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'), **MATCH_CONFIG)
+        with test_app.app_context():
+            db.create_all()
+            seed()
+            job_match_sync.recompute_stale_matches(1)
+
+            cv_profile = CVProfile.query.first()
+            job = JobApplication.query.filter_by(position='Python Developer').first()
+            job_match = JobMatch.query.filter_by(job_id=job.id).first()
+            assert job_match_sync.match_is_current(job_match, cv_profile, job)
+
+            stored = job_match_sync.match_result_from_row(job_match)
+            fresh = _fresh_result(cv_profile, job)
+            for key in ('overall_match_score', 'skill_match_score', 'experience_match_score',
+                        'location_match_score', 'match_level', 'recommendations'):
+                assert stored[key] == fresh[key], key
+            assert sorted(stored['matching_skills']) == sorted(fresh['matching_skills'])
+            assert set(stored) == set(fresh) | {'job_id'} and stored['analysis_date']
+
+
+def test_batch_match_single_bulk_upsert(make_app):
+    """Batch match: satu statement upsert, hasil terurut, match current dipakai ulang"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'), **MATCH_CONFIG)
+        with test_app.app_context():
+            db.create_all()
+            seed()
+            cv_profile = CVProfile.query.first()
+            jobs = JobApplication.query.all()
+
+            statements = []
+            listener = lambda conn, cursor, statement, *args: statements.append(statement)
+            event.listen(db.engine, 'before_cursor_execute', listener)
+            try:
+                results, scored = job_match_sync.match_jobs(1, cv_profile, jobs)
+                db.session.commit()
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', listener)
+
+            writes = [s for s in statements if s.lstrip().upper().startswith(('INSERT', 'UPDATE', 'DELETE'))]
+            assert len(writes) == 1 and 'ON CONFLICT' in writes[0]
+            assert scored == 5 and JobMatch.query.count() == 5
+            scores = [r['overall_match_score'] for r in results]
+            assert scores == sorted(scores, reverse=True)
+
+            # Second call reuses stored matches; force rescoring updates rows in place
+            results_again, scored_again = job_match_sync.match_jobs(1, cv_profile, jobs)
+            assert scored_again == 0
+            assert [set(r) for r in results_again] == [set(r) for r in results]
+            assert sorted((r['job_id'], r['overall_match_score']) for r in results_again) == \
+                sorted((r['job_id'], r['overall_match_score']) for r in results)
+            assert set(job_match_sync.stored_matches(1, [jobs[0].id, jobs[1].id])) == {jobs[0].id, jobs[1].id}
+            _, forced = job_match_sync.match_jobs(1, cv_profile, jobs[:2], force=True)
+            db.session.commit()
+            assert forced == 2 and JobMatch.query.count() == 5
+
+
+def test_requirements_extracted_at_write_time(make_app):
+    """Requirements diekstrak saat insert/edit dan disimpan di job_application"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'), **MATCH_CONFIG)
+        with test_app.app_context():
+            db.create_all()
+            seed()
+
+            job = JobApplication.query.filter_by(position='DevOps Engineer').first()
+            assert json.loads(job.required_skills) == ['aws', 'docker', 'kubernetes']
+            assert job.experience_required == 'mid'
+
+            job.position = 'Senior Data Scientist'
+            db.session.commit()
+            assert job.experience_required == 'senior'
+            assert job.job_category == 'data_science'
+            assert JobApplication.query.filter_by(job_category='data_science').count() == 2  # + Data Analyst
+
+            requirements = registry.get_job_matcher().extract_job_requirements(
+                job_match_sync.job_data_from_application(job)
+            )
+            assert sorted(requirements['extracted_skills']) == ['aws', 'docker', 'kubernetes']
+
+
+def test_single_job_match_tolerates_concurrent_write():
+    """Route match satu job: baris yang ditulis worker setelah lookup di-upsert, bukan 500"""
+    script = (
+        "import json, os, sqlite3, app\n"
+        "from ai_modules import registry\n"
+        "from models import CVProfile, JobApplication, JobMatch\n"
+        "from test_job_match_sync import seed\n"
+        "app.create_app()\n"
+        "with app.app.app_context():\n"
+        "    seed()\n"
+        "    job_id = JobApplication.query.first().id\n"
+        "    cv_version = CVProfile.query.first().version\n"
+        "matcher = registry.get_job_matcher()\n"
+        "original = matcher.analyze_job_compatibility\n"
+        "def racing(*args):\n"
+        "    # The background recompute writes the same (user, job) row meanwhile\n"
+        "    connection = sqlite3.connect(os.environ['DATABASE_URL'][len('sqlite:///'):])\n"
+        "    connection.execute('INSERT INTO job_match (user_id, job_id, match_score) VALUES (1, ?, -1)', (job_id,))\n"
+        "    connection.commit()\n"
+        "    connection.close()\n"
+        "    return original(*args)\n"
+        "matcher.analyze_job_compatibility = racing\n"
+        "client = app.app.test_client()\n"
+        "with client.session_transaction() as session:\n"
+        "    session['_user_id'] = '1'\n"
+        "response = client.post(f'/api/ai/job-match/{job_id}')\n"
+        "with app.app.app_context():\n"
+        "    rows = [[m.match_score, m.cv_version == cv_version] for m in JobMatch.query.filter_by(job_id=job_id)]\n"
+        "print(json.dumps({'status': response.status_code, 'result': response.get_json().get('match_result'),\n"
+        "                  'rows': rows}))\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}",
+                   AI_WARMUP='off', JOB_MATCH_BACKGROUND='0')
+        result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report['status'] == 200, result.stdout
+    assert report['rows'] == [[report['result']['overall_match_score'], True]]
+
+
+def test_batch_route_accepts_long_job_id_list():
+    """Route batch: daftar job_ids panjang (melebihi limit parameter SQLite) dimuat per chunk"""
+    script = (
+        "import json, sqlite3, app\n"
+        "from sqlalchemy import event\n"
+        "from models import JobApplication\n"
+        "from test_job_match_sync import seed\n"
+        "app.create_app()\n"
+        "with app.app.app_context():\n"
+        "    seed()\n"
+        "    job_ids = [job.id for job in JobApplication.query.all()]\n"
+        "    # The host parameter limit of older SQLite builds (newer builds allow far more)\n"
+        "    event.listen(app.db.engine, 'connect', lambda connection, record:\n"
+        "                 connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999))\n"
+        "    app.db.engine.dispose()\n"
+        "client = app.app.test_client()\n"
+        "with client.session_transaction() as session:\n"
+        "    session['_user_id'] = '1'\n"
+        "# Real ids spread over several chunks, padded with unknown ids and duplicates\n"
+        "requested = list(range(10000, 11500)) + job_ids + list(range(20000, 21500)) + job_ids\n"
+        "response = client.post('/api/ai/job-match/batch', json={'job_ids': requested, 'limit': 100})\n"
+        "body = response.get_json()\n"
+        "print(json.dumps({'status': response.status_code, 'total': body.get('total_jobs'),\n"
+        "                  'matched': sorted(m['job_id'] for m in body.get('top_matches', [])),\n"
+        "                  'job_ids': sorted(job_ids)}))\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}",
+                   AI_WARMUP='off', JOB_MATCH_BACKGROUND='0')
+        result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report['status'] == 200, result.stdout
+    assert report['total'] == len(report['job_ids']) == 5
+    assert report['matched'] == report['job_ids']
+
+
+def _fresh_result(cv_profile, job):
+    return registry.get_job_matcher().analyze_job_compatibility(
+        job_match_sync.cv_analysis_from_profile(cv_profile),
+        job_match_sync.job_data_from_application(job)
+    )
+
+
+if __name__ == '__main__':
+    test_only_stale_matches_are_recomputed(create_test_app)
+    test_stored_match_round_trip(create_test_app)
+    test_batch_match_single_bulk_upsert(create_test_app)
+    test_requirements_extracted_at_write_time(create_test_app)
+    test_single_job_match_tolerates_concurrent_write()
+    test_batch_route_accepts_long_job_id_list()
+    print("✅ Job match sync tests passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test per-stage timing of the CV analysis pipeline
+Memastikan setiap stage tercatat di metadata dan histogram, dan tidak ada yang dicatat saat dimatikan
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_modules import pipeline_metrics
+from ai_modules.cv_analyzer import CVAnalyzer
+from ai_modules.nlp_processor import NLPProcessor
+
+CV_TEXT = """Siti Rahma
+siti@example.com | +62 811 2345 6789 | Bandung
+PENGALAMAN KERJA
+Backend Developer - PT Digital Nusantara (2020 - 2024)
+- Membangun REST API dengan Python, Django dan PostgreSQL
+- Mengurangi waktu respon API 40%
+PENDIDIKAN
+Sarjana Teknik Informatika, Institut Teknologi Bandung
+KEAHLIAN
+Python, Django, SQL, Docker, Git
+"""
+
+
+def write_cv(directory):
+    file_path = os.path.join(directory, 'cv.txt')
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(CV_TEXT)
+    return file_path
+
+
+def test_stages_attached_to_metadata_and_histograms():
+    """analyze_cv mencatat stage CV dan NLP dalam satu run"""
+    pipeline_metrics.HISTOGRAMS.reset()
+    with tempfile.TemporaryDirectory() as tmp:
+        results = CVAnalyzer().analyze_cv(write_cv(tmp), len(CV_TEXT))
+
+    timings = results['metadata']['stage_timings']
+    assert timings['pipeline'] == 'analyze_cv'
+    for name in ('extraction', 'nlp', 'nlp.skills', 'nlp.keywords', 'nlp.ats_score', 'industry', 'summary'):
+        assert name in timings['stages'], name
+    assert timings['stages']['nlp.skills']['input_size'] == len(CV_TEXT)
+    assert timings['stages']['extraction']['input_size'] == len(CV_TEXT)
+    assert timings['total_wall_ms'] >= timings['stages']['nlp']['wall_ms'] >= timings['stages']['nlp.skills']['wall_ms']
+
+    snapshot = {(s['pipeline'], s['stage']): s for s in pipeline_metrics.HISTOGRAMS.snapshot()}
+    assert snapshot[('analyze_cv', 'total')]['count'] == 1
+    assert snapshot[('analyze_cv', 'nlp.keywords')]['buckets']['+Inf'] == 1
+    # The nested NLP call joined the run instead of starting its own
+    assert not any(pipeline == 'process_cv_text' for pipeline, _ in snapshot)
+
+
+def test_standalone_nlp_run_and_disabled_mode():
+    """process_cv_text membuat run sendiri; saat dimatikan tidak ada yang dicatat"""
+    pipeline_metrics.HISTOGRAMS.reset()
+    nlp = NLPProcessor()
+    results = nlp.process_cv_text(CV_TEXT)
+    assert results['metadata']['stage_timings']['pipeline'] == 'process_cv_text'
+    assert results['metadata']['skills_count'] == len(results['extracted_skills'])
+
+    pipeline_metrics.set_enabled(False)
+    try:
+        results = nlp.process_cv_text(CV_TEXT)
+    finally:
+        pipeline_metrics.set_enabled(True)
+    assert 'stage_timings' not in results['metadata']
+    counts = {s['stage']: s['count'] for s in pipeline_metrics.HISTOGRAMS.snapshot()}
+    assert counts['total'] == 1 and counts['nlp.language'] == 1
+
+
+def test_histogram_buckets_are_cumulative():
+    histograms = pipeline_metrics.StageHistograms(buckets=(10, 100))
+    for wall_ms in (5, 50, 50, 500):
+        histograms.observe('p', 's', wall_ms, 1, input_size=10)
+    series = histograms.snapshot()[0]
+    assert series['buckets'] == {'10': 1, '100': 3, '+Inf': 4}
+    assert series['count'] == 4 and series['input_size_sum'] == 40
+
+
+if __name__ == '__main__':
+    test_stages_attached_to_metadata_and_histograms()
+    test_standalone_nlp_run_and_disabled_mode()
+    test_histogram_buckets_are_cumulative()
+    print("✅ Pipeline metrics tests passed")
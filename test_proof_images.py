@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test varian WebP untuk screenshot bukti lamaran
+Memastikan thumbnail/medium dibuat, original yang terlalu besar diperkecil,
+dan route /uploads/proofs/ mengirim varian yang diminta
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from PIL import Image
+
+import proof_images
+
+
+def _make_image(path, size, image_format='PNG', mode='RGB'):
+    Image.new(mode, size, (30, 120, 200)).save(path, format=image_format)
+
+
+def test_variants_and_downscaled_original():
+    """Varian WebP dengan sisi terpanjang sesuai VARIANTS, original diperkecil ke batas"""
+    with tempfile.TemporaryDirectory() as folder:
+        _make_image(os.path.join(folder, 'shot.png'), (4000, 2000))
+        result = proof_images.process_upload(folder, 'shot.png', max_dimension=2000)
+
+        assert result['downscaled'] is True
+        for variant, size in proof_images.VARIANTS.items():
+            path = proof_images.variant_path(folder, 'shot.png', variant)
+            assert path.endswith(os.path.join('variants', variant, 'shot.webp'))
+            with Image.open(path) as image:
+                assert image.format == 'WEBP'
+                assert image.size == (size, size // 2)
+
+        # The original keeps its bytes; the downscaled copy is sent instead
+        full = proof_images.full_path(folder, 'shot.png')
+        assert full == proof_images.full_file(folder, 'shot.png')
+        with Image.open(full) as copy:
+            assert copy.format == 'PNG' and copy.size == (2000, 1000)
+        with Image.open(os.path.join(folder, 'shot.png')) as original:
+            assert original.size == (4000, 2000)
+
+        # Within the limit (or no limit): no copy, the original is sent as uploaded
+        _make_image(os.path.join(folder, 'small.jpg'), (800, 600), 'JPEG')
+        assert proof_images.process_upload(folder, 'small.jpg', max_dimension=None)['downscaled'] is False
+        assert proof_images.full_path(folder, 'small.jpg') == os.path.join(folder, 'small.jpg')
+
+        proof_images.delete_upload(folder, 'shot.png')
+        assert not any(os.path.exists(path) for path in proof_images.variant_files(folder, 'shot.png'))
+
+
+def test_exif_orientation_and_transparency():
+    """Varian mengikuti orientasi EXIF dan gambar transparan tetap bisa diproses"""
+    with tempfile.TemporaryDirectory() as folder:
+        image = Image.new('RGB', (600, 300))
+        exif = image.getexif()
+        exif[0x0112] = 6  # Rotated 90° clockwise
+        image.save(os.path.join(folder, 'photo.jpg'), format='JPEG', exif=exif)
+        _make_image(os.path.join(folder, 'alpha.png'), (500, 500), mode='RGBA')
+
+        assert proof_images.process_upload(folder, 'photo.jpg')['variants']['thumb'] == (160, 320)
+        assert proof_images.process_upload(folder, 'alpha.png')['variants']['thumb'] == (320, 320)
+
+
+def test_invalid_image_and_delete():
+    """File rusak tidak membuat varian; delete_upload menghapus original dan varian"""
+    with tempfile.TemporaryDirectory() as folder:
+        with open(os.path.join(folder, 'broken.png'), 'wb') as f:
+            f.write(b'not an image')
+        assert proof_images.process_upload(folder, 'broken.png') is None
+        assert proof_images.variant_path(folder, 'broken.png', 'thumb') is None
+
+        _make_image(os.path.join(folder, 'shot.png'), (400, 400))
+        proof_images.process_upload(folder, 'shot.png')
+        assert proof_images.variant_path(folder, 'shot.png', 'unknown') is None
+        proof_images.delete_upload(folder, 'shot.png')
+        assert not os.path.exists(os.path.join(folder, 'shot.png'))
+        assert proof_images.variant_path(folder, 'shot.png', 'thumb') is None
+        assert proof_images.backfill(folder) == 0
+
+
+def test_route_serves_requested_variant():
+    """Route mengirim varian WebP, atau original jika varian belum ada;
+    varian hanya dibuat untuk upload yang tersimpan di database"""
+    script = (
+        "import json, os, app\n"
+        "import proof_images\n"
+        "from PIL import Image\n"
+        "from models import JobApplication, Status, User\n"
+        "app.create_app()\n"
+        "folder = app.app.config['UPLOAD_FOLDER']\n"
+        "Image.new('RGB', (2000, 1000)).save(folder + '/shot.png')\n"
+        "Image.new('RGB', (50, 50)).save(folder + '/legacy.png')\n"
+        "proof_images.schedule_processing(app.app, 'shot.png')\n"
+        "with app.app.app_context():\n"
+        "    app.db.session.add_all([Status(id=1, name='Applied'), User(id=1, username='u', password='x')])\n"
+        "    for name in ('shot.png', 'legacy.png'):\n"
+        "        app.db.session.add(JobApplication(company_name='A', status_id=1, user_id=1, image_proof=name))\n"
+        "    app.db.session.commit()\n"
+        "client = app.app.test_client()\n"
+        "with client.session_transaction() as session:\n"
+        "    session['_user_id'] = '1'\n"
+        "report = {}\n"
+        "for name, url in [('thumb', '/uploads/proofs/shot.png?variant=thumb'),\n"
+        "                  ('original', '/uploads/proofs/shot.png'),\n"
+        "                  ('fallback', '/uploads/proofs/legacy.png?variant=medium')]:\n"
+        "    response = client.get(url)\n"
+        "    report[name] = [response.status_code, response.mimetype, len(response.data)]\n"
+        "    response.close()\n"
+        "# A request that fails before the commit leaves no variants behind\n"
+        "response = client.post('/add', data={'image_proof': (open(folder + '/legacy.png', 'rb'), 'x.png')})\n"
+        "report['failed_add'] = response.status_code\n"
+        "report['variant_files'] = sorted(name for _, _, names in os.walk(folder + '/variants') for name in names)\n"
+        "print(json.dumps(report))\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}",
+                   UPLOAD_FOLDER=tmp, PROOF_IMAGES_BACKGROUND='0', AI_WARMUP='off')
+        result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report['thumb'][:2] == [200, 'image/webp']
+    assert report['original'][:2] == [200, 'image/png']
+    assert report['thumb'][2] < report['original'][2]
+    assert report['fallback'][:2] == [200, 'image/png']
+    assert report['failed_add'] == 400
+    assert report['variant_files'] == ['shot.webp', 'shot.webp']
+
+
+if __name__ == '__main__':
+    test_variants_and_downscaled_original()
+    test_exif_orientation_and_transparency()
+    test_invalid_image_and_delete()
+    test_route_serves_requested_variant()
+    print("✅ Proof image tests passed")
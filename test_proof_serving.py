@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test penyajian screenshot bukti: login, cache header, ETag, range, X-Sendfile
+Memastikan /uploads/proofs/ hanya untuk pemilik job, bisa di-cache browser,
+dan bisa diserahkan ke proxy depan (X-Sendfile / X-Accel-Redirect)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Runs in a fresh interpreter (DATABASE_URL is read when app is imported);
+# creates two users, a job with a processed proof and one with a pending proof
+SETUP = (
+    "import json, app\n"
+    "import proof_images\n"
+    "from PIL import Image\n"
+    "from models import JobApplication, Status, User\n"
+    "app.create_app()\n"
+    "folder = app.app.config['UPLOAD_FOLDER']\n"
+    "Image.new('RGB', (800, 600), (10, 20, 30)).save(folder + '/done.png')\n"
+    "Image.new('RGB', (80, 60)).save(folder + '/pending.png')\n"
+    "proof_images.process_upload(folder, 'done.png')\n"
+    "with app.app.app_context():\n"
+    "    app.db.session.add_all([Status(id=1, name='Applied'), User(id=1, username='owner', password='x'),\n"
+    "                            User(id=2, username='other', password='x')])\n"
+    "    app.db.session.add_all([JobApplication(company_name='A', status_id=1, user_id=1, image_proof='done.png'),\n"
+    "                            JobApplication(company_name='B', status_id=1, user_id=1, image_proof='pending.png')])\n"
+    "    app.db.session.commit()\n"
+    "def client_for(user_id=None):\n"
+    "    client = app.app.test_client()\n"
+    "    if user_id:\n"
+    "        with client.session_transaction() as session:\n"
+    "            session['_user_id'] = str(user_id)\n"
+    "    return client\n"
+    "def summary(response):\n"
+    "    data = {'code': response.status_code, 'headers': dict(response.headers), 'length': len(response.data)}\n"
+    "    response.close()\n"
+    "    return data\n"
+    "report = {}\n"
+)
+
+
+def run_script(checks, **env_overrides):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}", UPLOAD_FOLDER=tmp,
+                   AI_WARMUP='off', PROOF_IMAGES_BACKGROUND='0', **env_overrides)
+        result = subprocess.run([sys.executable, '-c', SETUP + checks + "print(json.dumps(report))\n"],
+                                cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_only_owner_can_fetch_proofs():
+    """Tanpa login diarahkan ke login, user lain dan file tak dikenal 404"""
+    report = run_script(
+        "report['anonymous'] = summary(client_for().get('/uploads/proofs/done.png'))\n"
+        "report['other'] = summary(client_for(2).get('/uploads/proofs/done.png'))\n"
+        "report['unknown'] = summary(client_for(1).get('/uploads/proofs/missing.png'))\n"
+        "report['owner'] = summary(client_for(1).get('/uploads/proofs/done.png'))\n"
+    )
+    assert report['anonymous']['code'] == 302
+    assert report['other']['code'] == 404
+    assert report['unknown']['code'] == 404
+    assert report['owner']['code'] == 200
+
+
+def test_cache_headers_etag_and_ranges():
+    """Proof selesai diproses: immutable; belum selesai: revalidasi; ETag 304 dan Range 206"""
+    report = run_script(
+        "client = client_for(1)\n"
+        "report['done'] = summary(client.get('/uploads/proofs/done.png?variant=thumb'))\n"
+        "report['pending'] = summary(client.get('/uploads/proofs/pending.png?variant=thumb'))\n"
+        "etag = report['done']['headers']['ETag']\n"
+        "report['not_modified'] = summary(client.get('/uploads/proofs/done.png?variant=thumb',\n"
+        "                                            headers={'If-None-Match': etag}))\n"
+        "report['range'] = summary(client.get('/uploads/proofs/done.png', headers={'Range': 'bytes=0-99'}))\n"
+    )
+    done = report['done']['headers']
+    assert done['Content-Type'] == 'image/webp'
+    cache_control = {part.strip() for part in done['Cache-Control'].split(',')}
+    assert cache_control == {'private', 'max-age=31536000', 'immutable'}
+
+    pending = report['pending']['headers']
+    assert pending['Content-Type'] == 'image/png'
+    assert 'no-cache' in pending['Cache-Control'] and 'immutable' not in pending['Cache-Control']
+    assert 'ETag' in pending
+
+    assert report['not_modified']['code'] == 304 and report['not_modified']['length'] == 0
+    assert report['range']['code'] == 206 and report['range']['length'] == 100
+    assert report['range']['headers']['Accept-Ranges'] == 'bytes'
+
+
+def test_proxy_offload_modes():
+    """X-Sendfile berisi path file, X-Accel-Redirect berisi lokasi internal; body kosong"""
+    checks = (
+        "client = client_for(1)\n"
+        "report['variant'] = summary(client.get('/uploads/proofs/done.png?variant=medium'))\n"
+        "etag = report['variant']['headers']['ETag']\n"
+        "report['not_modified'] = summary(client.get('/uploads/proofs/done.png?variant=medium',\n"
+        "                                            headers={'If-None-Match': etag}))\n"
+        "report['folder'] = folder\n"
+    )
+    report = run_script(checks, PROOF_SENDFILE='x-sendfile')
+    headers = report['variant']['headers']
+    assert headers['X-Sendfile'] == os.path.join(report['folder'], 'variants', 'medium', 'done.webp')
+    assert headers['Content-Type'] == 'image/webp' and report['variant']['length'] == 0
+    assert 'immutable' in headers['Cache-Control']
+    assert report['not_modified']['code'] == 304
+
+    report = run_script(checks, PROOF_SENDFILE='x-accel-redirect', PROOF_ACCEL_REDIRECT_PREFIX='/internal/proofs/')
+    headers = report['variant']['headers']
+    assert headers['X-Accel-Redirect'] == '/internal/proofs/variants/medium/done.webp'
+    assert 'X-Sendfile' not in headers and report['variant']['length'] == 0
+
+
+if __name__ == '__main__':
+    test_only_owner_can_fetch_proofs()
+    test_cache_headers_etag_and_ranges()
+    test_proxy_offload_modes()
+    print("✅ Proof serving tests passed")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test slow-query log dan query budget per request
+Memastikan route yang melebihi budget query gagal di test dan memberi warning di produksi
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask import jsonify
+
+from conftest import create_test_app
+from extensions import db
+from models import Status
+import query_monitor
+from query_monitor import query_budget, QueryBudgetExceeded, QueryBudgetWarning
+
+
+def budget_app(make_app, db_path, **config):
+    test_app = make_app(db_path, TESTING=True, **config)
+    query_monitor.init_app(test_app)
+
+    @test_app.route('/statuses')
+    @query_budget(2)
+    def statuses():
+        # One query per status: an N+1 pattern
+        names = [db.session.get(Status, status_id).name for status_id in range(1, 4)]
+        return jsonify({'names': names, 'queries': query_monitor.request_query_stats()[0]})
+
+    @test_app.route('/count')
+    @query_budget(2)
+    def count():
+        return jsonify({'count': Status.query.count()})
+
+    with test_app.app_context():
+        db.create_all()
+        db.session.add_all([Status(id=index, name=f'Status {index}') for index in range(1, 4)])
+        db.session.commit()
+    return test_app
+
+
+def test_budget_exceeded_fails_in_tests(make_app):
+    """Mode default saat testing: raise QueryBudgetExceeded"""
+    with tempfile.TemporaryDirectory() as tmp:
+        client = budget_app(make_app, os.path.join(tmp, 'test.db')).test_client()
+        assert client.get('/count').status_code == 200
+        try:
+            client.get('/statuses')
+            assert False, 'budget should have been exceeded'
+        except QueryBudgetExceeded as e:
+            assert '/statuses issued 3 queries' in str(e)
+
+
+def test_budget_warn_mode_and_slow_query_log(make_app):
+    """Mode warn: response tetap dikirim, warning dan log slow query muncul"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = budget_app(make_app, os.path.join(tmp, 'test.db'),
+                              QUERY_BUDGET_MODE='warn', SLOW_QUERY_THRESHOLD_MS=0)
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        query_monitor.logger.addHandler(handler)
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                response = test_app.test_client().get('/statuses')
+        finally:
+            query_monitor.logger.removeHandler(handler)
+
+        assert response.status_code == 200 and response.get_json()['queries'] == 3
+        assert any(issubclass(w.category, QueryBudgetWarning) for w in caught)
+        slow = [r.getMessage() for r in records if r.getMessage().startswith('Slow query')]
+        assert len(slow) == 3 and all(' on /statuses: SELECT' in message for message in slow)
+
+
+def test_default_budget_and_off_mode(make_app):
+    """QUERY_BUDGET_DEFAULT berlaku untuk view tanpa decorator; mode off menonaktifkan"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = budget_app(make_app, os.path.join(tmp, 'test.db'),
+                              QUERY_BUDGET_DEFAULT=0, SLOW_QUERY_THRESHOLD_MS=None)
+
+        @test_app.route('/unbudgeted')
+        def unbudgeted():
+            return jsonify({'count': Status.query.count()})
+
+        client = test_app.test_client()
+        try:
+            client.get('/unbudgeted')
+            assert False, 'default budget should apply'
+        except QueryBudgetExceeded:
+            pass
+
+        test_app.config['QUERY_BUDGET_MODE'] = 'off'
+        assert client.get('/statuses').status_code == 200
+
+
+if __name__ == '__main__':
+    test_budget_exceeded_fails_in_tests(create_test_app)
+    test_budget_warn_mode_and_slow_query_log(create_test_app)
+    test_default_budget_and_off_mode(create_test_app)
+    print("✅ Query monitor tests passed")
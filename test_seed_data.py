@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test seeding data sintetis
+Memastikan data deterministik per seed, riwayat status konsisten dengan notifikasi,
+dan kolom requirements terisi walau insert melewati hook ORM
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import create_test_app
+from extensions import db
+from models import User, JobApplication, Notification, CVProfile, AIInsight
+from seed_data import Seeder, status_notification
+
+ANCHOR = datetime(2025, 6, 1)
+
+
+def empty_app(make_app, db_path):
+    test_app = make_app(db_path)
+    with test_app.app_context():
+        db.create_all()
+    return test_app
+
+
+def seeded_rows(make_app, batch_size, seed=0):
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = empty_app(make_app, os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            counts = Seeder(3, 40, seed=seed, anchor=ANCHOR, batch_size=batch_size).run()
+            jobs = [(job.id, job.user_id, job.company_name, job.position, job.status.name, job.applied_date,
+                     job.last_status_update, job.required_skills) for job in JobApplication.query.order_by('id')]
+            notifications = [(n.id, n.user_id, n.job_id, n.title, n.created_at, n.is_read)
+                             for n in Notification.query.order_by('id')]
+            db.engine.dispose()
+    return counts, jobs, notifications
+
+
+def test_seed_is_deterministic(make_app):
+    """Seed dan ukuran sama menghasilkan data identik, berapa pun ukuran batch"""
+    first = seeded_rows(make_app, batch_size=7)
+    assert first == seeded_rows(make_app, batch_size=10000)
+    assert first != seeded_rows(make_app, batch_size=10000, seed=1)
+
+    counts, jobs, notifications = first
+    assert counts['users'] == 3 and counts['jobs'] == 120
+    assert counts['notifications'] == len(notifications) > 0
+    assert counts['cv_profiles'] == 3 and counts['ai_insights'] == 12
+
+
+def test_status_history_matches_notifications(make_app):
+    """Status akhir dan tanggal update lamaran sesuai notifikasi terakhirnya"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = empty_app(make_app, os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            Seeder(2, 60, anchor=ANCHOR, batch_size=25).run()
+
+            for job in JobApplication.query.all():
+                history = Notification.query.filter_by(job_id=job.id).order_by(Notification.created_at).all()
+                assert all(n.user_id == job.user_id for n in history)
+                assert job.required_skills is not None and isinstance(json.loads(job.required_skills), list)
+                assert job.applied_date <= ANCHOR
+                if not history:
+                    assert job.status.name == 'Terdaftar' and job.last_status_update is None
+                    continue
+                last = history[-1]
+                assert last.title == status_notification(job.status.name, job.company_name, job.position)[0]
+                assert job.last_status_update == last.created_at
+                assert job.applied_date <= history[0].created_at <= ANCHOR
+
+            assert User.query.filter(User.username.like('seed%')).count() == 2
+            assert CVProfile.query.count() == 2
+            assert AIInsight.query.filter(AIInsight.content_key.isnot(None)).count() == 8
+            db.engine.dispose()
+
+
+def test_seed_appends_to_existing_data(make_app):
+    """Seeding kedua dengan prefix lain melanjutkan id yang sudah ada"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = empty_app(make_app, os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            Seeder(1, 10, anchor=ANCHOR).run()
+            Seeder(1, 10, anchor=ANCHOR, prefix='more').run()
+            assert JobApplication.query.count() == 20
+            assert {user.username for user in User.query} == {'seed0', 'more0'}
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    test_seed_is_deterministic(create_test_app)
+    test_status_history_matches_notifications(create_test_app)
+    test_seed_appends_to_existing_data(create_test_app)
+    print("✅ Seed data tests passed")
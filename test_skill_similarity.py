@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test skill similarity index
+Memastikan index yang diprecompute menghasilkan rasio yang sama dengan SequenceMatcher
+"""
+
+import os
+import random
+import sys
+import tempfile
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_modules.skill_similarity import SkillSimilarityIndex, build_index, skill_vocabulary
+
+
+def test_index_ratios_match_sequence_matcher():
+    """Rasio dari index (skill dikenal) dan fallback (skill baru) identik dengan SequenceMatcher"""
+    index = SkillSimilarityIndex()
+    assert index.loaded, "run: python -m ai_modules.skill_similarity"
+    vocabulary = skill_vocabulary()
+    assert len(index) == len(vocabulary)
+
+    rng = random.Random(0)
+    unseen = ['pyhton', 'postgres', 'jakarta', 'jakarta selatan', 'reactjs', '']
+    for _ in range(3000):
+        a = rng.choice(vocabulary + unseen)
+        b = rng.choice(vocabulary + unseen)
+        expected = SequenceMatcher(None, a, b).ratio()
+        assert index.ratio(a, b) == expected, (a, b)
+        for threshold in (0.7, 0.8):
+            assert index.is_similar(a, b, threshold) == (expected > threshold), (a, b, threshold)
+
+
+def test_build_and_load_custom_vocabulary():
+    """Index kecil bisa dibangun dan dimuat dari file lain"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_index(['python', 'pyhton', 'java', 'javascript'], os.path.join(tmp, 'skills.idx'))
+        index = SkillSimilarityIndex(path)
+        assert len(index) == 4
+        assert index.is_similar('python', 'pyhton', 0.7)
+        assert not index.is_similar('java', 'python', 0.7)
+        assert index.ratio('java', 'javascript') == SequenceMatcher(None, 'java', 'javascript').ratio()
+
+    missing = SkillSimilarityIndex('/nonexistent/skills.idx')
+    assert not missing.loaded
+    assert missing.is_similar('python', 'pyhton', 0.7)
+
+
+if __name__ == '__main__':
+    test_index_ratios_match_sequence_matcher()
+    test_build_and_load_custom_vocabulary()
+    print("✅ Skill similarity tests passed")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test startup time aplikasi
+Memastikan import app tetap cepat dan tidak mengakses jaringan (NLTK offline)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Budget waktu import app (detik), bisa di-override untuk mesin CI yang lambat
+IMPORT_BUDGET_SECONDS = float(os.environ.get('APP_IMPORT_BUDGET', '3.0'))
+
+# Modul berat yang harus di-import secara lazy (lihat benchmarks/import_time_budget.json)
+with open(os.path.join(PROJECT_ROOT, 'benchmarks', 'import_time_budget.json')) as f:
+    DEFERRED_MODULES = json.load(f)['deferred_modules']
+
+
+def _time_import(module_code):
+    """Run an import in a fresh interpreter and return (elapsed, result)"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', module_code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    return time.perf_counter() - start, result
+
+
+def test_import_app_within_budget():
+    """Import app harus selesai dalam budget waktu"""
+    elapsed, result = _time_import('import app')
+    print(f"⏱️  import app: {elapsed:.2f}s (budget {IMPORT_BUDGET_SECONDS:.2f}s)")
+
+    assert result.returncode == 0, result.stderr
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"import app took {elapsed:.2f}s"
+
+
+def test_heavy_modules_not_imported_at_startup():
+    """pandas, reportlab, nltk, yake dll. tidak boleh ikut ter-import saat startup"""
+    code = (
+        "import sys, app\n"
+        f"deferred = {DEFERRED_MODULES!r}\n"
+        "print(','.join(m for m in deferred if m in sys.modules))\n"
+    )
+    _, result = _time_import(code)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '', f"imported at startup: {result.stdout.strip()}"
+
+
+def test_no_nltk_download_at_runtime():
+    """Import dan inisialisasi NLPProcessor tidak boleh memanggil nltk.download"""
+    code = (
+        "import nltk\n"
+        "def _blocked(*args, **kwargs):\n"
+        "    raise SystemExit('nltk.download called at runtime')\n"
+        "nltk.download = _blocked\n"
+        "from ai_modules.nlp_processor import NLPProcessor\n"
+        "nlp = NLPProcessor()\n"
+        "nlp.process_cv_text('John Doe\\nPython developer. Experienced with SQL and Docker.')\n"
+    )
+    _, result = _time_import(code)
+
+    assert result.returncode == 0, result.stderr
+    assert '[nltk_data]' not in result.stderr
+
+
+def test_combined_stopwords_built_once():
+    """Stopword gabungan EN+ID dibuat sekali dan dipakai ulang di setiap akses"""
+    sys.path.insert(0, PROJECT_ROOT)
+    from ai_modules.nlp_processor import NLPProcessor
+
+    nlp = NLPProcessor()
+    assert nlp.stop_words is nlp.stop_words
+    assert isinstance(nlp.stop_words, frozenset)
+    assert nlp.stop_words == nlp.stop_words_en | nlp.stop_words_id
+    assert {'the', 'yang'} <= nlp.stop_words
+
+
+if __name__ == '__main__':
+    test_import_app_within_budget()
+    test_heavy_modules_not_imported_at_startup()
+    test_no_nltk_download_at_runtime()
+    test_combined_stopwords_built_once()
+    print("✅ Startup time tests passed")
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Test penyimpanan upload berbasis hash (content-addressed) dengan reference counting
+Memastikan file yang sama disimpan sekali, referensi dihitung dengan benar,
+analisis CV dipakai ulang per hash, dan migrasi menghapus duplikat lama
+"""
+
+import io
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from PIL import Image
+
+from conftest import create_test_app
+from extensions import db
+from models import JobApplication, Status, UploadBlob, User
+from ai_modules import pipeline_metrics, registry
+from ai_modules.cv_analyzer import CVAnalyzer
+import migrate_content_addressed_uploads
+import proof_images
+import upload_storage
+
+
+def test_store_deduplicates_by_content(make_app):
+    """Isi yang sama -> satu file <sha256>.<ext>; isi berbeda -> file baru"""
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, 'proofs')
+        os.makedirs(folder)
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            first = upload_storage.store(io.BytesIO(b'same bytes'), folder, 'PNG', 'proof')
+            second = upload_storage.store(io.BytesIO(b'same bytes'), folder, 'png', 'proof')
+            other = upload_storage.store(io.BytesIO(b'other bytes'), folder, 'png', 'proof')
+            db.session.commit()
+
+            assert first.created and not second.created and other.created
+            assert first.filename == second.filename == f'{first.digest}.png'
+            assert first.size == len(b'same bytes')
+            assert upload_storage.digest_of(first.filename) == first.digest
+            assert upload_storage.file_digest(os.path.join(folder, first.filename)) == first.digest
+            assert upload_storage.digest_of('0b4c2c1e-legacy.png') is None
+            assert sorted(os.listdir(folder)) == sorted([first.filename, other.filename])
+            assert UploadBlob.query.filter_by(filename=first.filename).one().ref_count == 2
+            db.engine.dispose()
+
+
+def test_reference_counting(make_app):
+    """acquire/release menghitung referensi; discard hanya menghapus blob yang tidak direferensikan"""
+    with tempfile.TemporaryDirectory() as tmp:
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            name = upload_storage.blob_filename('a' * 64, 'png')
+            upload_storage.acquire('proof', name, 10)
+            upload_storage.acquire('proof', name, 10)
+            upload_storage.acquire('cv', name, 10)
+            db.session.commit()
+            assert UploadBlob.query.filter_by(kind='proof', filename=name).one().ref_count == 2
+
+            assert upload_storage.release('proof', name) is False
+            assert upload_storage.release('proof', name) is True
+            db.session.commit()
+            # The row stays at zero until discard removes it with the files
+            assert UploadBlob.query.filter_by(kind='proof').one().ref_count == 0
+            removed = []
+            assert upload_storage.discard('proof', name, removed.append) is True
+            assert removed == [name] and UploadBlob.query.filter_by(kind='proof').count() == 0
+            assert UploadBlob.query.filter_by(kind='cv').one().ref_count == 1
+            assert upload_storage.discard('cv', name, removed.append) is False and removed == [name]
+
+            # Legacy names have no blob row; None means no file at all
+            assert upload_storage.release('proof', 'legacy-uuid.png') is True
+            assert upload_storage.discard('proof', 'legacy-uuid.png', removed.append) is True
+            assert upload_storage.release('proof', None) is False
+            db.engine.dispose()
+
+
+def test_store_during_release_keeps_the_blob(make_app):
+    """Upload ulang di antara release dan discard: file tetap ada; setelah discard: file dibuat lagi"""
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, 'proofs')
+        os.makedirs(folder)
+        remove = lambda name: upload_storage.remove_from(folder, name)
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            name = upload_storage.store(io.BytesIO(b'shot'), folder, 'png', 'proof').filename
+            db.session.commit()
+
+            # Another request stores the same bytes before the releasing one discards
+            assert upload_storage.release('proof', name) is True
+            db.session.commit()
+            assert upload_storage.store(io.BytesIO(b'shot'), folder, 'png', 'proof').created is False
+            db.session.commit()
+            assert upload_storage.discard('proof', name, remove) is False
+            assert os.listdir(folder) == [name]
+            assert UploadBlob.query.filter_by(filename=name).one().ref_count == 1
+
+            # Discard first: the next store of the same bytes puts the file back
+            assert upload_storage.release('proof', name) is True
+            db.session.commit()
+            assert upload_storage.discard('proof', name, remove) is True and os.listdir(folder) == []
+            assert upload_storage.store(io.BytesIO(b'shot'), folder, 'png', 'proof').created is True
+            db.session.commit()
+            assert os.listdir(folder) == [name]
+            db.engine.dispose()
+
+
+def test_uncommitted_upload_is_discarded(make_app):
+    """File baru dari transaksi yang di-rollback (atau tidak di-commit) dihapus lagi"""
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, 'proofs')
+        os.makedirs(folder)
+        test_app = make_app(os.path.join(tmp, 'test.db'))
+        with test_app.app_context():
+            db.create_all()
+            kept = upload_storage.store(io.BytesIO(b'kept'), folder, 'png', 'proof').filename
+            db.session.commit()
+            assert upload_storage.discard_uncommitted() == 0
+
+            upload_storage.store(io.BytesIO(b'rolled back'), folder, 'png', 'proof')
+            db.session.rollback()
+            upload_storage.store(io.BytesIO(b'never committed'), folder, 'png', 'proof')
+            # A request that reused a committed blob leaves it alone
+            upload_storage.store(io.BytesIO(b'kept'), folder, 'png', 'proof')
+            assert upload_storage.discard_uncommitted() == 2
+
+            assert os.listdir(folder) == [kept]
+            assert [(blob.filename, blob.ref_count) for blob in UploadBlob.query] == [(kept, 1)]
+            db.engine.dispose()
+
+
+def test_shared_proof_deleted_with_last_job():
+    """Screenshot yang sama di dua job disimpan sekali dan baru dihapus bersama job terakhir"""
+    script = (
+        "import io, json, os, app\n"
+        "from PIL import Image\n"
+        "from models import JobApplication, Status, UploadBlob, User\n"
+        "app.create_app()\n"
+        "folder = app.app.config['UPLOAD_FOLDER']\n"
+        "with app.app.app_context():\n"
+        "    app.db.session.add_all([Status(id=1, name='Applied'), User(id=1, username='u', password='x')])\n"
+        "    app.db.session.commit()\n"
+        "buffer = io.BytesIO()\n"
+        "Image.new('RGB', (64, 64), (1, 2, 3)).save(buffer, format='PNG')\n"
+        "client = app.app.test_client()\n"
+        "with client.session_transaction() as session:\n"
+        "    session['_user_id'] = '1'\n"
+        "for company in ('A', 'B'):\n"
+        "    client.post('/add', data={'company_name': company, 'location': 'Jakarta', 'address': '-',\n"
+        "                              'status_id': '1', 'image_proof': (io.BytesIO(buffer.getvalue()), 'shot.PNG')})\n"
+        "def files():\n"
+        "    return sorted(name for name in os.listdir(folder) if name != 'variants')\n"
+        "with app.app.app_context():\n"
+        "    jobs = JobApplication.query.order_by(JobApplication.id).all()\n"
+        "    report = {'names': [job.image_proof for job in jobs], 'files': files(),\n"
+        "              'refs': [blob.ref_count for blob in UploadBlob.query.all()]}\n"
+        "# A request that fails after storing the upload leaves no file behind\n"
+        "client.post('/add', data={'image_proof': (io.BytesIO(b'broken request'), 'other.png')})\n"
+        "report['after_failed_add'] = files()\n"
+        "client.post(f'/job/{jobs[0].id}/delete')\n"
+        "report['after_first'] = files()\n"
+        "client.post(f'/job/{jobs[1].id}/delete')\n"
+        "report['after_last'] = files()\n"
+        "report['variants_left'] = sum(len(files) for _, _, files in os.walk(os.path.join(folder, 'variants')))\n"
+        "print(json.dumps(report))\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'test.db')}",
+                   UPLOAD_FOLDER=os.path.join(tmp, 'proofs'), AI_WARMUP='off', PROOF_IMAGES_BACKGROUND='0',
+                   JOB_MATCH_BACKGROUND='0')
+        result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    name = report['names'][0]
+    assert report['names'] == [name, name] and upload_storage.digest_of(name) and name.endswith('.png')
+    assert report['files'] == [name] and report['refs'] == [2]
+    assert report['after_failed_add'] == [name]
+    assert report['after_first'] == [name]
+    assert report['after_last'] == [] and report['variants_left'] == 0
+
+
+def _analyze_cv_runs():
+    return sum(series['count'] for series in pipeline_metrics.HISTOGRAMS.snapshot()
+               if series['pipeline'] == 'analyze_cv' and series['stage'] == 'total')
+
+
+def test_cv_analysis_reused_per_content_hash():
+    """analyze_cv dengan content_hash yang sama hanya menganalisis sekali"""
+    analyzer = CVAnalyzer(nlp=registry.get_nlp_processor())
+    calls = []
+    original = analyzer._analyze_cv
+
+    def counting(*args):
+        calls.append(args[0])
+        return original(*args)
+
+    analyzer._analyze_cv = counting
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'cv.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Budi Santoso\nbudi@example.com\nSKILLS\nPython, SQL, Docker\n")
+        runs_before = _analyze_cv_runs()
+        first = analyzer.analyze_cv(path, 60, content_hash='c' * 64)
+        first['extracted_skills'].append('mutated')
+        second = analyzer.analyze_cv(path, 60, content_hash='c' * 64)
+        analyzer.analyze_cv(path, 60)
+
+    assert len(calls) == 2
+    assert 'mutated' not in second['extracted_skills']
+    # A cache hit reports its own date and timings and is still recorded as a run
+    assert second['analysis_date'] > first['analysis_date']
+    assert set(second['metadata']['stage_timings']['stages']) == {'analysis_cache'}
+    assert 'nlp' in first['metadata']['stage_timings']['stages']
+    assert _analyze_cv_runs() - runs_before == 3
+
+
+def test_migration_deduplicates_existing_uploads(make_app):
+    """Migrasi mengganti nama file lama ke hash, menggabungkan duplikat, dan mengisi upload_blob"""
+    with tempfile.TemporaryDirectory() as tmp:
+        proofs = os.path.join(tmp, 'proofs')
+        cvs = os.path.join(tmp, 'cv')
+        os.makedirs(proofs)
+        os.makedirs(cvs)
+        for name in ('one.png', 'copy.png'):
+            Image.new('RGB', (40, 40), (200, 10, 10)).save(os.path.join(proofs, name))
+        Image.new('RGB', (40, 40), (10, 200, 10)).save(os.path.join(proofs, 'unused.png'))
+        proof_images.process_upload(proofs, 'one.png')
+        with open(os.path.join(cvs, 'abc_cv.txt'), 'w') as f:
+            f.write('curriculum vitae')
+
+        db_path = os.path.join(tmp, 'test.db')
+        test_app = make_app(db_path)
+        with test_app.app_context():
+            db.create_all()
+            db.session.add_all([Status(id=1, name='Applied'), User(id=1, username='u', password='x')])
+            for name in ('one.png', 'copy.png', 'copy.png'):
+                db.session.add(JobApplication(company_name='A', status_id=1, user_id=1, image_proof=name))
+            db.session.commit()
+            db.engine.dispose()
+
+        connection = sqlite3.connect(db_path)
+        connection.execute("DROP TABLE upload_blob")
+        connection.execute("INSERT INTO cv_profile (user_id, cv_file_path, version) VALUES (1, 'abc_cv.txt', 1)")
+        connection.commit()
+        connection.close()
+
+        assert migrate_content_addressed_uploads.migrate_database(db_path, {'proof': proofs, 'cv': cvs})
+
+        files = sorted(name for name in os.listdir(proofs) if name != 'variants')
+        assert len(files) == 2 and all(upload_storage.digest_of(name) for name in files)
+
+        connection = sqlite3.connect(db_path)
+        proof_names = {row[0] for row in connection.execute("SELECT image_proof FROM job_application")}
+        blobs = dict(connection.execute("SELECT filename, ref_count FROM upload_blob WHERE kind = 'proof'"))
+        cv_name = connection.execute("SELECT cv_file_path FROM cv_profile").fetchone()[0]
+        connection.close()
+
+        assert len(proof_names) == 1
+        proof_name = proof_names.pop()
+        assert blobs == {proof_name: 3}
+        assert proof_images.variant_path(proofs, proof_name, 'thumb')
+        assert upload_storage.digest_of(cv_name) and os.listdir(cvs) == [cv_name]
+
+        # Running it again changes nothing
+        assert migrate_content_addressed_uploads.migrate_database(db_path, {'proof': proofs, 'cv': cvs})
+        assert sorted(name for name in os.listdir(proofs) if name != 'variants') == files
+
+
+if __name__ == '__main__':
+    test_store_deduplicates_by_content(create_test_app)
+    test_reference_counting(create_test_app)
+    test_store_during_release_keeps_the_blob(create_test_app)
+    test_uncommitted_upload_is_discarded(create_test_app)
+    test_shared_proof_deleted_with_last_job()
+    test_cv_analysis_reused_per_content_hash()
+    test_migration_deduplicates_existing_uploads(create_test_app)
+    print("✅ Upload storage tests passed")
@@ -0,0 +1,201 @@
+"""
+Upload Storage
+Content-addressed storage of uploaded files with reference counting
+
+``store`` streams an upload to disk while hashing it (SHA-256) and keeps
+it as ``<digest>.<ext>``. When that blob already exists the new copy is
+dropped, so a screenshot or CV uploaded twice is stored once. The digest
+is the identity of the uploaded bytes: caches can key on it (see
+``digest_of`` and ``CVAnalyzer.analyze_cv(content_hash=...)``). Blobs are
+never rewritten; resized proof copies are separate files (see proof_images).
+
+References are counted per ``kind`` (``proof``, ``cv``) in the
+``upload_blob`` table (UploadBlob), in the caller's transaction: ``store``
+counts the new reference, ``acquire`` counts another one and ``release``
+drops one. ``release`` tells the caller when the count reached zero; the
+row is kept at zero and the caller calls ``discard`` after committing.
+``discard`` deletes the row only while its count is still zero and removes
+the files in that same write transaction. ``store`` counts its reference
+before it checks for the file and puts it back if a concurrent ``discard``
+removed it, so a blob that is referenced always exists on disk.
+
+A file created by ``store`` whose transaction never commits (the request
+failed, or returned without saving) is discarded by
+``discard_uncommitted``, which the app runs when each request ends. Legacy
+random names (from before ``migrate_content_addressed_uploads.py``) have
+no UploadBlob row and belong to their single referencing row.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+from collections import namedtuple
+
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.orm import Session
+
+from extensions import db, upsert_statement
+from models import UploadBlob
+
+CHUNK_SIZE = 64 * 1024
+DIGEST_PATTERN = re.compile(r'[0-9a-f]{64}')
+# Session.info keys: files created by store in the open transaction, and
+# files whose transaction was rolled back
+NEW_UPLOADS_KEY = 'upload_storage.new_uploads'
+ORPHANED_UPLOADS_KEY = 'upload_storage.orphaned_uploads'
+
+StoredUpload = namedtuple('StoredUpload', 'filename digest size created')
+
+
+def blob_filename(digest, extension):
+    return f'{digest}.{extension.lower()}'
+
+
+def digest_of(filename):
+    """SHA-256 of a content-addressed upload, or None for other (legacy) names"""
+    if not filename:
+        return None
+    stem = os.path.splitext(filename)[0]
+    return stem if DIGEST_PATTERN.fullmatch(stem) else None
+
+
+def store(file, folder, extension, kind):
+    """Stream ``file`` (FileStorage or binary file object) into ``folder`` and count a reference
+
+    Returns a StoredUpload. The reference is counted in the current session;
+    a new file is discarded again if that transaction does not commit.
+    """
+    stream = getattr(file, 'stream', file)
+    sha256 = hashlib.sha256()
+    size = 0
+
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                sha256.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+
+        digest = sha256.hexdigest()
+        filename = blob_filename(digest, extension)
+        path = os.path.join(folder, filename)
+        # Count first: a concurrent discard of this blob has either finished
+        # (the file is gone and is put back below) or now waits for this
+        # transaction and keeps the file
+        acquire(kind, filename, size)
+        created = not os.path.exists(path)
+        if created:
+            os.replace(tmp_path, path)
+            db.session.info.setdefault(NEW_UPLOADS_KEY, []).append((kind, folder, filename))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return StoredUpload(filename, digest, size, created)
+
+
+def remove_from(folder, filename):
+    """Delete ``folder/filename`` if it exists (the ``remove`` of a plain upload for ``discard``)"""
+    path = os.path.join(folder, filename)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def file_digest(path):
+    """SHA-256 of a file on disk (used when migrating existing uploads)"""
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def acquire(kind, filename, size=None):
+    """Count one more reference to a blob (in the current session)"""
+    table = UploadBlob.__table__
+    stmt = upsert_statement(table).values(kind=kind, filename=filename, size=size, ref_count=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['kind', 'filename'],
+        set_={'ref_count': table.c.ref_count + 1}
+    )
+    db.session.execute(stmt)
+
+
+def release(kind, filename):
+    """Drop one reference; True when the files of ``filename`` should now be discarded"""
+    if not filename:
+        return False
+    if digest_of(filename) is None:
+        return True  # Legacy name: owned by the single row that referenced it
+
+    table = UploadBlob.__table__
+    match = (table.c.kind == kind) & (table.c.filename == filename)
+    remaining = db.session.execute(
+        update(table).where(match).values(ref_count=table.c.ref_count - 1).returning(table.c.ref_count)
+    ).scalar_one_or_none()
+    # The row stays (at zero) until discard removes it together with the files
+    return remaining is None or remaining <= 0
+
+
+def discard(kind, filename, remove):
+    """Call ``remove(filename)`` if the blob is unreferenced; runs and commits its own transaction
+
+    Call after the transaction that released the last reference committed.
+    The zero-count row is deleted first: that write serializes with a
+    concurrent ``store`` of the same bytes, which either counted its
+    reference already (the files are kept) or runs afterwards and puts the
+    file back. Returns True when the files were removed.
+    """
+    if not filename:
+        return False
+
+    table = UploadBlob.__table__
+    match = (table.c.kind == kind) & (table.c.filename == filename)
+    try:
+        db.session.execute(delete(table).where(match & (table.c.ref_count <= 0)))
+        referenced = db.session.execute(select(table.c.id).where(match)).first() is not None
+        if not referenced:
+            remove(filename)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return not referenced
+
+
+def discard_uncommitted():
+    """Discard the files ``store`` created in transactions that did not commit
+
+    Rolls back the current session first when there is anything to discard.
+    Returns the number of files removed.
+    """
+    if not db.session.registry.has():
+        return 0
+    info = db.session.info
+    new_uploads = info.pop(ORPHANED_UPLOADS_KEY, []) + info.pop(NEW_UPLOADS_KEY, [])
+    if not new_uploads:
+        return 0
+
+    db.session.rollback()
+    discarded = 0
+    for kind, folder, filename in new_uploads:
+        if discard(kind, filename, lambda name, folder=folder: remove_from(folder, name)):
+            discarded += 1
+    return discarded
+
+
+@event.listens_for(Session, 'after_commit')
+def _forget_committed_uploads(session):
+    session.info.pop(NEW_UPLOADS_KEY, None)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _orphan_rolled_back_uploads(session):
+    rolled_back = session.info.pop(NEW_UPLOADS_KEY, None)
+    if rolled_back:
+        session.info.setdefault(ORPHANED_UPLOADS_KEY, []).extend(rolled_back)
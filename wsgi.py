@@ -0,0 +1,13 @@
+"""
+WSGI entry point for production servers
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+With ``preload_app`` (see gunicorn.conf.py) this module is imported once in
+the master process: tables are created and, with ``AI_WARMUP=sync``, all AI
+components are built and warmed up before the workers are forked.
+"""
+
+from app import create_app
+
+app = create_app()